@@ -3,16 +3,39 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, PLATFORMS
+from .const import (
+    CONF_DATE,
+    CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+    CONF_UPCOMING_COUNT,
+    DEFAULT_UPCOMING_COUNT,
+    DOMAIN,
+    PLATFORMS,
+)
 from .coordinator import AnniversaryDataUpdateCoordinator
+from .date_template import DateTemplateTracker, has_date_template
+from .engine import async_load_numpy
+from .roster import entity_settings, entry_configs, is_roster, loaded_keys
+from .services import async_setup_services
+from .websocket_api import async_setup_websocket_api
 
 _LOGGER = logging.getLogger(__name__)
 
+# Anniversaries are configured through config entries only
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Anniversaries integration."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Anniversary from a config entry."""
@@ -31,48 +54,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     # Get or create the shared coordinator that manages ALL anniversaries
     if "coordinator" not in hass.data[DOMAIN]:
-        from .data import AnniversaryData
-        
-        # Collect all anniversary config entries
+        # Collect all anniversary config entries up front, including the ones
+        # Home Assistant has not set up yet, so startup does a single refresh
+        # instead of one per entry.
         all_anniversaries = {}
         for config_entry in hass.config_entries.async_entries(DOMAIN):
-            if config_entry.state == "loaded" or config_entry.entry_id == entry.entry_id:
-                # Properly merge data and options (options override data)
-                entry_config = {**config_entry.data}
-                if config_entry.options:
-                    entry_config.update(config_entry.options)
-                
-                if entry_config and (entry_config.get("name") or entry_config.get("date")):
-                    try:
-                        anniversary_data = AnniversaryData.from_config(entry_config)
-                        all_anniversaries[config_entry.entry_id] = anniversary_data
-                    except Exception as e:
-                        _LOGGER.error(f"Failed to load anniversary {config_entry.entry_id}: {e}")
+            if config_entry.disabled_by is None:
+                all_anniversaries.update(_load_anniversaries(config_entry))
         
+        # NumPy, used by the bulk refreshes, is slow to import: load it in
+        # the executor instead of on the event loop during the first refresh
+        await async_load_numpy(hass)
+
         # Create shared coordinator
         coordinator = AnniversaryDataUpdateCoordinator(hass, all_anniversaries)
         await coordinator.async_config_entry_first_refresh()
+        coordinator.async_schedule_midnight_updates()
         
         hass.data[DOMAIN]["coordinator"] = coordinator
         hass.data[DOMAIN]["coordinator_lock"] = asyncio.Lock()
+        hass.data[DOMAIN]["date_templates"] = DateTemplateTracker(hass, coordinator)
     else:
         # Add this entry's data to existing coordinator
         coordinator = hass.data[DOMAIN]["coordinator"]
         try:
             from .data import AnniversaryData
-            # Properly merge data and options (options override data)
-            config = {**entry.data}
-            if entry.options:
-                config.update(entry.options)
-            anniversary_data = AnniversaryData.from_config(config)
-            coordinator.anniversaries[entry.entry_id] = anniversary_data
-            await coordinator.async_refresh()
+
+            for key, key_config in entry_configs(entry).items():
+                if has_date_template(key_config) and not key_config.get(CONF_DATE):
+                    continue  # Added once its template renders, below
+                anniversary_data = AnniversaryData.from_config(key_config)
+                # Entries preloaded with the coordinator need no update at all;
+                # anything else only touches this entry and the upcoming summary.
+                if coordinator.anniversaries.get(key) != anniversary_data:
+                    coordinator.async_set_anniversary(key, anniversary_data)
         except Exception as e:
             _LOGGER.error(f"Failed to add anniversary {entry.entry_id}: {e}")
             return False
     
+    # Dates from templates replace the static date as soon as they render
+    date_templates = hass.data[DOMAIN]["date_templates"]
+    for key, key_config in entry_configs(entry).items():
+        if has_date_template(key_config):
+            date_templates.async_track(key, key_config)
+
     # Store entry-specific coordinator reference
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Settings the entry's entities were created with, see update_listener
+    hass.data[DOMAIN].setdefault("entity_settings", {})[entry.entry_id] = entity_settings(entry)
 
     # Setup platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -80,48 +109,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Register update listener
     entry.async_on_unload(entry.add_update_listener(update_listener))
     
-    # Register static path for cards (only once) - moved to end to ensure HTTP component is ready
+    # Serve the card files (only once) - at the end so the HTTP component is ready
     if "static_path_registered" not in hass.data[DOMAIN]:
-        try:
-            # Wait for HTTP component to be fully ready
-            if hasattr(hass, 'http') and hass.http is not None:
-                # Register the www directory to be accessible via /local/community/anniversaries/
-                url_path = f"/local/community/{DOMAIN}"
-                file_path = hass.config.path(f"custom_components/{DOMAIN}/www")
-                
-                _LOGGER.debug(f"Attempting to register static path: {url_path} -> {file_path}")
-                _LOGGER.debug(f"Path exists: {os.path.exists(file_path)}")
-                
-                # Simple fallback approach - just register a basic file server
-                try:
-                    from aiohttp.web import FileResponse
-                    from aiohttp import web
-                    
-                    async def serve_static_file(request):
-                        """Serve static files from www directory."""
-                        filename = request.match_info.get('filename', 'index.html')
-                        filepath = os.path.join(file_path, filename)
-                        if os.path.exists(filepath) and os.path.isfile(filepath):
-                            return FileResponse(filepath)
-                        return web.Response(status=404)
-                    
-                    # Add a simple route for static files
-                    hass.http.app.router.add_get(f"{url_path}/{{filename:.*}}", serve_static_file)
-                    _LOGGER.info(f"Successfully registered static route: {url_path}")
-                    
-                except Exception as e:
-                    _LOGGER.error(f"Failed to register static path: {e}")
-                    _LOGGER.debug("Static files will not be available, but emoji system will still work")
-                
-                hass.data[DOMAIN]["static_path_registered"] = True
-            else:
-                _LOGGER.warning("HTTP component not available yet")
-                hass.data[DOMAIN]["static_path_registered"] = True
-                
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error in static path registration: {e}")
-            # Don't fail the integration setup
-            hass.data[DOMAIN]["static_path_registered"] = True
+        hass.data[DOMAIN]["static_path_registered"] = True
+        if getattr(hass, "http", None) is not None:
+            try:
+                from .assets import async_register_assets
+
+                hass.data[DOMAIN]["assets"] = await async_register_assets(hass)
+            except Exception as e:
+                # Don't fail the integration setup
+                _LOGGER.error(f"Failed to register the card files: {e}")
+        else:
+            _LOGGER.warning("HTTP component not available yet")
 
     return True
 
@@ -133,12 +133,21 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Remove this entry from the shared coordinator
         if "coordinator" in hass.data[DOMAIN]:
             coordinator = hass.data[DOMAIN]["coordinator"]
-            if entry.entry_id in coordinator.anniversaries:
-                del coordinator.anniversaries[entry.entry_id]
-                await coordinator.async_refresh()
+            date_templates = hass.data[DOMAIN]["date_templates"]
+            for key in loaded_keys(entry, date_templates.keys):
+                date_templates.async_untrack(key)
+            for key in loaded_keys(entry, coordinator.anniversaries):
+                coordinator.async_remove_anniversary(key)
+            if not coordinator.anniversaries and not date_templates:
+                # Last anniversary gone: stop the midnight scheduler so a new
+                # entry starts from a fresh coordinator.
+                await coordinator.async_shutdown()
+                hass.data[DOMAIN].pop("coordinator", None)
+                hass.data[DOMAIN].pop("date_templates", None)
         
         # Remove entry-specific data
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        hass.data[DOMAIN].get("entity_settings", {}).pop(entry.entry_id, None)
 
     return unload_ok
 
@@ -154,21 +163,57 @@ async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
             return
             
         coordinator = hass.data[DOMAIN]["coordinator"]
-        
-        # Properly merge data and options (options override data)
-        config = {**entry.data}
-        if entry.options:
-            config.update(entry.options)
-            
-        # Update the anniversary data in the coordinator
-        anniversary_data = AnniversaryData.from_config(config)
-        coordinator.anniversaries[entry.entry_id] = anniversary_data
-        
-        # Refresh the coordinator to update all entities
-        await coordinator.async_refresh()
+        configs = entry_configs(entry)
+
+        # Roster members added or removed, or changed entity settings such as
+        # the calendars, need entities created or removed, which only a
+        # reload does; edits to anniversaries are applied in place.
+        if (
+            is_roster(entry) and loaded_keys(entry, coordinator.anniversaries) != configs.keys()
+        ) or (
+            hass.data[DOMAIN].get("entity_settings", {}).get(entry.entry_id)
+            != entity_settings(entry)
+        ):
+            await hass.config_entries.async_reload(entry.entry_id)
+            return
+
+        if entry.options.get(CONF_UPCOMING_ANNIVERSARIES_SENSOR, False):
+            coordinator.async_set_upcoming_count(
+                entry.options.get(CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT)
+            )
+
+        date_templates = hass.data[DOMAIN]["date_templates"]
+        for key, config in configs.items():
+            if has_date_template(config):
+                # Re-rendered with the new configuration
+                date_templates.async_track(key, config)
+                continue
+            date_templates.async_untrack(key)
+            # Update the anniversary data in the coordinator. Only this
+            # anniversary's entities (and the summary, if its membership
+            # changed) are re-rendered
+            anniversary_data = AnniversaryData.from_config(config)
+            if coordinator.anniversaries.get(key) != anniversary_data:
+                coordinator.async_set_anniversary(key, anniversary_data)
         _LOGGER.debug(f"Updated anniversary {entry.entry_id} with new configuration")
         
     except Exception as e:
         _LOGGER.error(f"Failed to update anniversary {entry.entry_id}: {e}")
         # Fall back to full reload if update fails
         await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _load_anniversaries(entry: ConfigEntry) -> dict:
+    """Return {coordinator key: AnniversaryData} for the valid anniversaries of an entry."""
+    from .data import AnniversaryData
+
+    anniversaries = {}
+    for key, config in entry_configs(entry).items():
+        if has_date_template(config) and not config.get(CONF_DATE):
+            continue  # Added once its template renders
+        if config and (config.get("name") or config.get("date")):
+            try:
+                anniversaries[key] = AnniversaryData.from_config(config)
+            except Exception as e:
+                _LOGGER.error(f"Failed to load anniversary {key}: {e}")
+    return anniversaries
@@ -0,0 +1,176 @@
+"""In-memory, cache-aware server for the Lovelace card files."""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from aiohttp import hdrs, web
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.http import HomeAssistantView
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+ASSETS_DIR = Path(__file__).parent / "www"
+ASSETS_URL = f"/local/community/{DOMAIN}"
+
+# Files requested with their current content hash (?v=<hash>) never change
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+# Other requests are revalidated with the ETag on every load
+CACHE_REVALIDATE = "no-cache"
+# Smaller files gain nothing from compression
+MIN_COMPRESS_SIZE = 256
+# Relative module specifiers such as './anniversary-feed.js'
+MODULE_SPECIFIER = re.compile(r"""(['"])\./([\w.-]+\.js)\1""")
+
+
+class Asset(NamedTuple):
+    """A static file held in memory with its precompressed variants."""
+
+    body: bytes
+    content_type: str
+    version: str
+    # Content-Encoding -> compressed body, in order of preference
+    encoded: dict[str, bytes]
+
+    @property
+    def etag(self) -> str:
+        """Return the strong ETag of the file."""
+        return f'"{self.version}"'
+
+
+def build_asset(name: str, body: bytes) -> Asset:
+    """Hash and precompress one file."""
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    encoded: dict[str, bytes] = {}
+    if len(body) >= MIN_COMPRESS_SIZE:
+        try:
+            import brotli  # Optional: not every installation has it
+        except ImportError:
+            pass
+        else:
+            encoded["br"] = brotli.compress(body)
+        # mtime=0 keeps the gzip output reproducible
+        encoded["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+    return Asset(
+        body=body,
+        content_type=content_type,
+        version=hashlib.sha256(body).hexdigest()[:16],
+        encoded={encoding: data for encoding, data in encoded.items() if len(data) < len(body)},
+    )
+
+
+def load_assets(directory: Path = ASSETS_DIR) -> dict[str, Asset]:
+    """Read every file of the directory into memory (runs in the executor).
+
+    Only the files found here can be served, which also rules out path
+    traversal.
+    """
+    sources = {
+        path.name: path.read_bytes()
+        for path in sorted(directory.iterdir())
+        if path.is_file() and not path.name.startswith(".")
+    }
+    assets: dict[str, Asset] = {}
+    for name in sources:
+        _build_module(name, sources, assets, set())
+    return assets
+
+
+def _build_module(
+    name: str, sources: dict[str, bytes], assets: dict[str, Asset], building: set[str]
+) -> Asset:
+    """Build a file after the modules it imports, pinning them to their hash.
+
+    './card.js' becomes './card.js?v=<hash>', so a module's own hash changes
+    whenever one of its imports does and every versioned URL can be cached
+    for good.
+    """
+    if name in assets:
+        return assets[name]
+    body = sources[name]
+    if name.endswith(".js"):
+        building.add(name)
+
+        def pin(match: re.Match[str]) -> str:
+            target = match[2]
+            if target not in sources or target in building:
+                return match[0]
+            version = _build_module(target, sources, assets, building).version
+            return f"{match[1]}./{target}?v={version}{match[1]}"
+
+        body = MODULE_SPECIFIER.sub(pin, body.decode()).encode()
+        building.discard(name)
+    assets[name] = build_asset(name, body)
+    return assets[name]
+
+
+def _accepted_encodings(request: web.Request) -> set[str]:
+    """Return the content codings accepted by the client."""
+    accepted = set()
+    for part in request.headers.get(hdrs.ACCEPT_ENCODING, "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+class AnniversaryAssetsView(HomeAssistantView):
+    """Serve the card files from memory with ETags and compression."""
+
+    url = ASSETS_URL + "/{filename}"
+    name = f"{DOMAIN}:assets"
+    requires_auth = False
+
+    def __init__(self, assets: dict[str, Asset]) -> None:
+        """Initialize the view."""
+        self.assets = assets
+
+    def asset_url(self, filename: str) -> str:
+        """Return the versioned URL of a file, cacheable forever."""
+        return f"{ASSETS_URL}/{filename}?v={self.assets[filename].version}"
+
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
+        """Serve a file, or 304 if the client's copy is current."""
+        asset = self.assets.get(filename)
+        if asset is None:
+            raise web.HTTPNotFound
+        headers = {
+            hdrs.ETAG: asset.etag,
+            hdrs.CACHE_CONTROL: (
+                CACHE_IMMUTABLE
+                if request.query.get("v") == asset.version
+                else CACHE_REVALIDATE
+            ),
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if_none_match = request.headers.get(hdrs.IF_NONE_MATCH, "")
+        if if_none_match.strip() == "*" or asset.etag in (
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        ):
+            return web.Response(status=304, headers=headers)
+
+        body = asset.body
+        accepted = _accepted_encodings(request)
+        for encoding, data in asset.encoded.items():
+            if encoding in accepted:
+                headers[hdrs.CONTENT_ENCODING] = encoding
+                body = data
+                break
+        return web.Response(body=body, content_type=asset.content_type, headers=headers)
+
+
+async def async_register_assets(hass: HomeAssistant) -> AnniversaryAssetsView:
+    """Load the card files and serve them under /local/community/anniversaries."""
+    assets = await hass.async_add_executor_job(load_assets, ASSETS_DIR)
+    view = AnniversaryAssetsView(assets)
+    hass.http.register_view(view)
+    _LOGGER.debug("Serving %s card files from memory at %s", len(assets), ASSETS_URL)
+    return view
@@ -1,7 +1,7 @@
 """Calendar platform for Anniversaries."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
@@ -9,11 +9,22 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import entity_registry as er
-from homeassistant.util import slugify
+from homeassistant.util import dt as dt_util, slugify
 
-from .const import DOMAIN
+from .const import (
+    CATEGORY_OPTIONS,
+    CONF_CATEGORY_CALENDARS,
+    CONF_COMBINED_CALENDAR,
+    CONF_ENTRY_CALENDAR,
+    CONF_MEMBER_ENTITIES,
+    CONF_MEMBER_ID,
+    DEFAULT_MEMBER_ENTITIES,
+    DEFAULT_ENTRY_CALENDAR,
+    DOMAIN,
+)
 from .coordinator import AnniversaryDataUpdateCoordinator
-from .data import AnniversaryData
+from .data import AnniversaryData, AnniversarySnapshot
+from .roster import entry_configs, is_roster
 
 
 async def async_setup_entry(
@@ -23,7 +34,31 @@ async def async_setup_entry(
 ) -> None:
     """Set up the calendar platform."""
     coordinator: AnniversaryDataUpdateCoordinator = hass.data[DOMAIN]["coordinator"]
-    async_add_entities([AnniversaryCalendar(coordinator, entry.entry_id, entry)])
+    entities: list[CalendarEntity] = []
+    if entry.options.get(CONF_ENTRY_CALENDAR, DEFAULT_ENTRY_CALENDAR):
+        if not is_roster(entry):
+            entities.append(AnniversaryCalendar(coordinator, entry.entry_id, entry))
+        elif entry.options.get(CONF_MEMBER_ENTITIES, DEFAULT_MEMBER_ENTITIES):
+            entities.extend(
+                AnniversaryCalendar(coordinator, key, entry, config)
+                for key, config in entry_configs(entry).items()
+            )
+
+    if entry.options.get(CONF_COMBINED_CALENDAR) or entry.options.get(CONF_CATEGORY_CALENDARS):
+        lock = hass.data[DOMAIN]["coordinator_lock"]
+        async with lock:
+            categories: list[str | None] = []
+            if entry.options.get(CONF_COMBINED_CALENDAR):
+                categories.append(None)
+            if entry.options.get(CONF_CATEGORY_CALENDARS):
+                categories.extend(CATEGORY_OPTIONS)
+            for category in categories:
+                flag = AnniversariesCalendar.added_flag(category)
+                if flag not in hass.data[DOMAIN]:
+                    entities.append(AnniversariesCalendar(coordinator, category))
+                    hass.data[DOMAIN][flag] = True
+
+    async_add_entities(entities)
 
 
 class AnniversaryCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], CalendarEntity):
@@ -34,20 +69,32 @@ class AnniversaryCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], C
         coordinator: AnniversaryDataUpdateCoordinator,
         entry_id: str,
         entry: ConfigEntry,
+        config: dict | None = None,
     ) -> None:
         """Initialize the calendar with a stable prefixed entity id."""
         super().__init__(coordinator)
         self._entry = entry
         self._internal_key = entry_id
-        self._attr_unique_id = f"{entry.entry_id}_calendar"
-        name = (entry.options or entry.data).get("name", "anniversary")
+        self._attr_unique_id = f"{entry_id}_calendar"
+        if config is None:
+            name = (entry.options or entry.data).get("name", "anniversary")
+            short_id = entry.entry_id.split("-")[0]
+        else:
+            # A roster member, configured by its own entry in the roster
+            name = config.get("name", "anniversary")
+            short_id = config[CONF_MEMBER_ID]
         slug = slugify(name)
-        short_id = entry.entry_id.split("-")[0]
         self._suggested_object_id = f"anniversary_{slug}_{short_id}"
 
     async def async_added_to_hass(self) -> None:
         """Handle entity being added to hass."""
         await super().async_added_to_hass()
+        # Edits to this anniversary are delivered to this entity only
+        self.async_on_remove(
+            self.coordinator.async_add_entry_listener(
+                self._internal_key, self._handle_coordinator_update
+            )
+        )
         current_eid = self.entity_id
         try:
             domain, object_id = current_eid.split(".")
@@ -68,6 +115,11 @@ class AnniversaryCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], C
             return None
         return self.coordinator.anniversaries.get(self._internal_key)
 
+    @property
+    def snapshot(self) -> AnniversarySnapshot | None:
+        """Return the coordinator's evaluated snapshot for this anniversary."""
+        return self.coordinator.get_snapshot(self._internal_key)
+
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
@@ -84,14 +136,15 @@ class AnniversaryCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], C
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        anniversary = self.anniversary
-        if anniversary is None:
+        snapshot = self.snapshot
+        if snapshot is None:
             return None
         
-        next_date = anniversary.next_anniversary_date
+        anniversary = snapshot.anniversary
+        next_date = snapshot.next_anniversary_date
         description = (
-            f"Happy {anniversary.next_years}th anniversary!"
-            if anniversary.next_years is not None
+            f"Happy {snapshot.next_years}th anniversary!"
+            if snapshot.next_years is not None
             else anniversary.name
         )
         return CalendarEvent(
@@ -108,21 +161,102 @@ class AnniversaryCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], C
         anniversary = self.anniversary
         if anniversary is None:
             return []
-        
-        events = []
-        next_date = anniversary.next_anniversary_date
-        if start_date.date() <= next_date <= end_date.date():
-            description = (
-                f"Happy {anniversary.next_years}th anniversary!"
-                if anniversary.next_years is not None
-                else anniversary.name
+        return [
+            build_event(anniversary, day, years, is_half)
+            for day, years, is_half in anniversary.occurrences(
+                start_date.date(), end_date.date()
+            )
+        ]
+
+
+def build_event(
+    anniversary: AnniversaryData, day: date, years: int | None, is_half: bool = False
+) -> CalendarEvent:
+    """Build the all-day calendar event for one occurrence of an anniversary."""
+    if is_half:
+        summary = f"{anniversary.name} (half anniversary)"
+        description = (
+            f"Happy {years}½ anniversary!" if years is not None else summary
+        )
+    else:
+        summary = anniversary.name
+        description = (
+            f"Happy {years}th anniversary!" if years is not None else anniversary.name
+        )
+    return CalendarEvent(
+        summary=summary,
+        start=day,
+        end=day + timedelta(days=1),
+        description=description,
+    )
+
+
+class AnniversariesCalendar(CoordinatorEntity[AnniversaryDataUpdateCoordinator], CalendarEntity):
+    """Calendar of all anniversaries, or of one category, served from the index."""
+
+    def __init__(
+        self, coordinator: AnniversaryDataUpdateCoordinator, category: str | None = None
+    ) -> None:
+        """Initialize the aggregated calendar."""
+        super().__init__(coordinator)
+        self._category = category
+        if category is None:
+            self._attr_name = "All Anniversaries"
+            self._attr_unique_id = f"{DOMAIN}_all_calendar"
+        else:
+            self._attr_name = f"{category.capitalize()} Anniversaries"
+            self._attr_unique_id = f"{DOMAIN}_{category}_calendar"
+
+    @staticmethod
+    def added_flag(category: str | None) -> str:
+        """Return the hass.data flag marking this calendar as added."""
+        return f"{category or 'all'}_calendar_added"
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity being added to hass."""
+        await super().async_added_to_hass()
+        # Any edit can move the next event, not only those of the upcoming summary
+        if self._category is None:
+            remove_listener = self.coordinator.async_add_change_listener(
+                self._handle_coordinator_update
+            )
+        else:
+            remove_listener = self.coordinator.async_add_category_listener(
+                self._category, self._handle_coordinator_update
             )
-            events.append(
-                CalendarEvent(
-                    summary=anniversary.name,
-                    start=next_date,
-                    end=next_date + timedelta(days=1),
-                    description=description,
-                )
+        self.async_on_remove(remove_listener)
+        current_eid = self.entity_id
+        try:
+            domain, object_id = current_eid.split(".")
+        except ValueError:
+            return
+        if not object_id.startswith("anniversary_"):
+            registry = er.async_get(self.hass)
+            new_object_id = f"anniversary_{object_id}"
+            registry.async_update_entity(current_eid, new_entity_id=f"{domain}.{new_object_id}")
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Allow the calendar to be added again by a later setup."""
+        await super().async_will_remove_from_hass()
+        self.hass.data.get(DOMAIN, {}).pop(self.added_flag(self._category), None)
+
+    @property
+    def event(self) -> CalendarEvent | None:
+        """Return the next upcoming event."""
+        today = self.coordinator.reference_date or dt_util.now().date()
+        for day, anniversary, years, is_half in self.coordinator.occurrences_between(
+            today, today + timedelta(days=366), self._category
+        ):
+            return build_event(anniversary, day, years, is_half)
+        return None
+
+    async def async_get_events(
+        self, hass: HomeAssistant, start_date: datetime, end_date: datetime
+    ) -> list[CalendarEvent]:
+        """Get all events in a specific time frame with a single index query."""
+        return [
+            build_event(anniversary, day, years, is_half)
+            for day, anniversary, years, is_half in self.coordinator.occurrences_between(
+                start_date.date(), end_date.date(), self._category
             )
-        return events
+        ]
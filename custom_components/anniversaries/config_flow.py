@@ -3,7 +3,6 @@ from collections import OrderedDict
 from homeassistant.core import callback
 import voluptuous as vol
 from homeassistant import config_entries
-from datetime import datetime
 import uuid
 
 from .const import (
@@ -20,6 +19,7 @@ from .const import (
     CONF_ICON_TODAY,
     CONF_ICON_SOON,
     CONF_DATE,
+    CONF_DATE_TEMPLATE,
     CONF_SOON,
     CONF_HALF_ANNIVERSARY,
     CONF_UNIT_OF_MEASUREMENT,
@@ -27,16 +27,33 @@ from .const import (
     CONF_CATEGORY,
     CATEGORY_OPTIONS,
     CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+    CONF_UPCOMING_COUNT,
+    DEFAULT_UPCOMING_COUNT,
+    CONF_ENTRY_CALENDAR,
+    DEFAULT_ENTRY_CALENDAR,
+    CONF_COMBINED_CALENDAR,
+    CONF_CATEGORY_CALENDARS,
     CONF_EMOJI,
     DEFAULT_EMOJI,
     CATEGORY_EMOJIS,
-    EMOJI_OPTIONS,
+    CONTEXT_BULK_IMPORT,
+    CONF_ROSTER,
+    CONF_MEMBERS,
+    CONF_MEMBER_ID,
+    CONF_MEMBER_ENTITIES,
+    DEFAULT_MEMBER_ENTITIES,
+    ATTR_FILE_PATH,
 )
+from .dateparse import is_valid_date
+from .emoji import emoji_index, resolve_emoji
+from .roster import is_roster, new_member_id, roster_members
 
 from homeassistant.const import CONF_NAME
 
 
-from homeassistant.helpers import selector
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv, selector
+from homeassistant.util import slugify
 
 @config_entries.HANDLERS.register(DOMAIN)
 class AnniversariesFlowHandler(config_entries.ConfigFlow):
@@ -50,7 +67,12 @@ class AnniversariesFlowHandler(config_entries.ConfigFlow):
 
     async def async_step_user(self, user_input=None):
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["anniversary", "roster"])
+
+    async def async_step_anniversary(self, user_input=None):
+        """Create a config entry for a single anniversary."""
         errors = {}
+        emoji_matches = []
         if user_input is not None:
             try:
                 # Prevent leading anniversary_ prefix in name to avoid double prefix
@@ -60,10 +82,14 @@ class AnniversariesFlowHandler(config_entries.ConfigFlow):
                     raise ValueError("name has forbidden prefix")
 
                 # Validate date
-                if is_not_date(user_input[CONF_DATE], user_input.get(CONF_ONE_TIME, False)):
-                    errors[CONF_DATE] = "invalid"
+                check_date(user_input, errors)
+                if errors:
                     raise ValueError("Invalid date")
 
+                emoji_matches = check_emoji(user_input, errors)
+                if errors:
+                    raise ValueError("Invalid emoji")
+
                 # Set a unique ID for the entry
                 await self.async_set_unique_id(str(uuid.uuid4()))
                 self._abort_if_unique_id_configured()
@@ -78,9 +104,12 @@ class AnniversariesFlowHandler(config_entries.ConfigFlow):
         data_schema = vol.Schema(
             {
                 vol.Required(CONF_NAME): str,
-                vol.Required(CONF_DATE): str,
+                vol.Optional(CONF_DATE): str,
+                vol.Optional(CONF_DATE_TEMPLATE): selector.TemplateSelector(),
                 vol.Optional(CONF_CATEGORY, default=DEFAULT_CATEGORY): vol.In(CATEGORY_OPTIONS),
-                vol.Optional(CONF_EMOJI, default=self.get_default_emoji_for_category(DEFAULT_CATEGORY)): vol.In(EMOJI_OPTIONS),
+                vol.Optional(CONF_EMOJI, default=self.get_default_emoji_for_category(DEFAULT_CATEGORY)): emoji_selector(
+                    *(emoji_matches or CATEGORY_EMOJIS.values())
+                ),
                 vol.Optional(CONF_ONE_TIME, default=DEFAULT_ONE_TIME): bool,
                 vol.Optional(CONF_HALF_ANNIVERSARY, default=DEFAULT_HALF_ANNIVERSARY): bool,
                 vol.Optional(CONF_UNIT_OF_MEASUREMENT, default=DEFAULT_UNIT_OF_MEASUREMENT): str,
@@ -90,11 +119,41 @@ class AnniversariesFlowHandler(config_entries.ConfigFlow):
                 vol.Optional(CONF_ICON_SOON, default=DEFAULT_ICON_SOON): selector.IconSelector(),
             }
         )
-        return self.async_show_form(step_id="user", data_schema=data_schema, errors=errors)
+        if emoji_matches:
+            # Keep what was entered and preselect the first matching emoji
+            data_schema = self.add_suggested_values_to_schema(
+                data_schema, {**user_input, CONF_EMOJI: emoji_matches[0]}
+            )
+        return self.async_show_form(step_id="anniversary", data_schema=data_schema, errors=errors)
+
+    async def async_step_roster(self, user_input=None):
+        """Create a roster: many anniversaries held by one config entry."""
+        errors = {}
+        if user_input is not None:
+            raw_name = user_input[CONF_NAME].strip()
+            if raw_name.lower().startswith("anniversary_"):
+                errors[CONF_NAME] = "no_prefix"
+            else:
+                await self.async_set_unique_id(str(uuid.uuid4()))
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=raw_name,
+                    data={CONF_NAME: raw_name, CONF_ROSTER: True},
+                    options={CONF_MEMBERS: []},
+                )
+
+        data_schema = vol.Schema({vol.Required(CONF_NAME): str})
+        return self.async_show_form(step_id="roster", data_schema=data_schema, errors=errors)
 
     async def async_step_import(self, user_input):
-        """Import a config entry from configuration.yaml."""
+        """Import a config entry from configuration.yaml or a bulk import file."""
         name = user_input[CONF_NAME]
+        if self.context.get(CONTEXT_BULK_IMPORT):
+            # Rows were validated by the importer; re-importing a file is a no-op
+            await self.async_set_unique_id(f"import_{slugify(name)}_{user_input[CONF_DATE]}")
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(title=name, data=user_input)
+
         unique_id = f"yaml_{name.lower().replace(' ', '_')}"
 
         await self.async_set_unique_id(unique_id)
@@ -111,19 +170,64 @@ class AnniversariesFlowHandler(config_entries.ConfigFlow):
         return OptionsFlowHandler(config_entry)
 
 def is_not_date(date, one_time):
-    try:
-        datetime.strptime(date, "%Y-%m-%d")
-        return False
-    except ValueError:
-        if not one_time:
-            pass
-        else:
-            return True
-    try:
-        datetime.strptime(date, "%m-%d")
-        return False
-    except ValueError:
-        return True
+    """Return True if date is not a valid anniversary date; see dateparse."""
+    return not is_valid_date(date, one_time)
+
+
+def check_date(user_input, errors):
+    """Validate the date, or the date template that can replace it.
+
+    With a template, the date is optional: it is only used until the
+    template first renders a valid date.
+    """
+    date = user_input.get(CONF_DATE, "")
+    if template := user_input.get(CONF_DATE_TEMPLATE):
+        try:
+            cv.template(template)
+        except vol.Invalid:
+            errors[CONF_DATE_TEMPLATE] = "invalid_template"
+        if not date:
+            return
+    if is_not_date(date, user_input.get(CONF_ONE_TIME, False)):
+        errors[CONF_DATE] = "invalid"
+
+
+def emoji_selector(*emojis):
+    """Return an emoji picker suggesting a few emojis.
+
+    Any other emoji can be typed in, or found by typing a keyword such as
+    "cake"; see check_emoji. Only the suggestions are sent to the frontend.
+    """
+    index = emoji_index()
+    options = []
+    for emoji in dict.fromkeys(emoji for emoji in emojis if emoji):
+        entry = index.entries.get(emoji)
+        options.append(
+            selector.SelectOptionDict(value=emoji, label=entry.label if entry else emoji)
+        )
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            custom_value=True,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
+def check_emoji(user_input, errors):
+    """Replace a keyword typed into the emoji picker with its emoji.
+
+    Returns the emojis matching an ambiguous keyword, to suggest when the
+    form is shown again.
+    """
+    if CONF_EMOJI not in user_input:
+        return []
+    emoji, matches = resolve_emoji(user_input[CONF_EMOJI])
+    if emoji is None:
+        errors[CONF_EMOJI] = "emoji_choose" if matches else "emoji_not_found"
+        return matches
+    user_input[CONF_EMOJI] = emoji
+    return []
 
 
 class OptionsFlowHandler(config_entries.OptionsFlow):
@@ -135,12 +239,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
+        if is_roster(self._config_entry):
+            return await self.async_step_roster()
         errors = {}
+        emoji_matches = []
         if user_input is not None:
             # Validate date if it was provided
-            if CONF_DATE in user_input and user_input[CONF_DATE]:
-                if is_not_date(user_input[CONF_DATE], user_input.get(CONF_ONE_TIME, False)):
-                    errors[CONF_DATE] = "invalid"
+            if user_input.get(CONF_DATE) or user_input.get(CONF_DATE_TEMPLATE):
+                check_date(user_input, errors)
+            # A cleared template must also override the one in the entry's data
+            user_input.setdefault(CONF_DATE_TEMPLATE, "")
+            emoji_matches = check_emoji(user_input, errors)
             
             if not errors:
                 return self.async_create_entry(title="", data=user_input)
@@ -149,6 +258,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         current_config = {**self._config_entry.data}
         if self._config_entry.options:
             current_config.update(self._config_entry.options)
+        current_emoji = current_config.get(
+            CONF_EMOJI,
+            CATEGORY_EMOJIS.get(current_config.get(CONF_CATEGORY, DEFAULT_CATEGORY), DEFAULT_EMOJI),
+        )
 
         data_schema = vol.Schema(
             {
@@ -156,18 +269,38 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_DATE,
                     default=current_config.get(CONF_DATE, ""),
                 ): str,
+                vol.Optional(
+                    CONF_DATE_TEMPLATE,
+                    description={"suggested_value": current_config.get(CONF_DATE_TEMPLATE)},
+                ): selector.TemplateSelector(),
                 vol.Optional(
                     CONF_UPCOMING_ANNIVERSARIES_SENSOR,
                     default=current_config.get(CONF_UPCOMING_ANNIVERSARIES_SENSOR, False),
                 ): bool,
+                vol.Optional(
+                    CONF_UPCOMING_COUNT,
+                    default=current_config.get(CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT),
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(
+                    CONF_ENTRY_CALENDAR,
+                    default=current_config.get(CONF_ENTRY_CALENDAR, DEFAULT_ENTRY_CALENDAR),
+                ): bool,
+                vol.Optional(
+                    CONF_COMBINED_CALENDAR,
+                    default=current_config.get(CONF_COMBINED_CALENDAR, False),
+                ): bool,
+                vol.Optional(
+                    CONF_CATEGORY_CALENDARS,
+                    default=current_config.get(CONF_CATEGORY_CALENDARS, False),
+                ): bool,
                 vol.Optional(
                     CONF_CATEGORY,
                     default=current_config.get(CONF_CATEGORY, DEFAULT_CATEGORY),
                 ): vol.In(CATEGORY_OPTIONS),
                 vol.Optional(
                     CONF_EMOJI,
-                    default=current_config.get(CONF_EMOJI, CATEGORY_EMOJIS.get(current_config.get(CONF_CATEGORY, DEFAULT_CATEGORY), DEFAULT_EMOJI)),
-                ): vol.In(EMOJI_OPTIONS),
+                    default=current_emoji,
+                ): emoji_selector(*(emoji_matches or (current_emoji, *CATEGORY_EMOJIS.values()))),
                 vol.Optional(
                     CONF_ONE_TIME,
                     default=current_config.get(CONF_ONE_TIME, DEFAULT_ONE_TIME),
@@ -198,4 +331,137 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 ): selector.IconSelector(),
             }
         )
+        if emoji_matches:
+            data_schema = self.add_suggested_values_to_schema(
+                data_schema, {**user_input, CONF_EMOJI: emoji_matches[0]}
+            )
         return self.async_show_form(step_id="init", data_schema=data_schema, errors=errors)
+
+    async def async_step_roster(self, user_input=None):
+        """Choose how to edit a roster."""
+        return self.async_show_menu(
+            step_id="roster",
+            menu_options=["add_member", "remove_members", "import_members", "roster_settings"],
+        )
+
+    def _async_save_roster(self, members=None, **settings):
+        """Store the roster's members and settings as the entry's options."""
+        options = {**self._config_entry.options, **settings}
+        if members is not None:
+            options[CONF_MEMBERS] = members
+        return self.async_create_entry(title="", data=options)
+
+    async def async_step_add_member(self, user_input=None):
+        """Add one anniversary to the roster."""
+        errors = {}
+        emoji_matches = []
+        if user_input is not None:
+            raw_name = user_input[CONF_NAME].strip()
+            if raw_name.lower().startswith("anniversary_"):
+                errors[CONF_NAME] = "no_prefix"
+            else:
+                check_date(user_input, errors)
+                emoji_matches = check_emoji(user_input, errors)
+                if not errors:
+                    member = {CONF_MEMBER_ID: new_member_id(), **user_input, CONF_NAME: raw_name}
+                    return self._async_save_roster([*roster_members(self._config_entry), member])
+
+        data_schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME): str,
+                vol.Optional(CONF_DATE): str,
+                vol.Optional(CONF_DATE_TEMPLATE): selector.TemplateSelector(),
+                vol.Optional(CONF_CATEGORY, default=DEFAULT_CATEGORY): vol.In(CATEGORY_OPTIONS),
+                vol.Optional(CONF_EMOJI, default=CATEGORY_EMOJIS.get(DEFAULT_CATEGORY, DEFAULT_EMOJI)): emoji_selector(
+                    *(emoji_matches or CATEGORY_EMOJIS.values())
+                ),
+                vol.Optional(CONF_ONE_TIME, default=DEFAULT_ONE_TIME): bool,
+                vol.Optional(CONF_HALF_ANNIVERSARY, default=DEFAULT_HALF_ANNIVERSARY): bool,
+            }
+        )
+        if emoji_matches:
+            data_schema = self.add_suggested_values_to_schema(
+                data_schema, {**user_input, CONF_EMOJI: emoji_matches[0]}
+            )
+        return self.async_show_form(step_id="add_member", data_schema=data_schema, errors=errors)
+
+    async def async_step_remove_members(self, user_input=None):
+        """Remove anniversaries from the roster."""
+        members = roster_members(self._config_entry)
+        if user_input is not None:
+            removed = set(user_input.get(CONF_MEMBERS, []))
+            return self._async_save_roster(
+                [member for member in members if member[CONF_MEMBER_ID] not in removed]
+            )
+
+        data_schema = vol.Schema(
+            {
+                vol.Optional(CONF_MEMBERS, default=[]): selector.SelectSelector(
+                    selector.SelectSelectorConfig(
+                        options=[
+                            selector.SelectOptionDict(
+                                value=member[CONF_MEMBER_ID],
+                                label=f"{member[CONF_NAME]} ({member.get(CONF_DATE) or member.get(CONF_DATE_TEMPLATE)})",
+                            )
+                            for member in members
+                        ],
+                        multiple=True,
+                    )
+                ),
+            }
+        )
+        return self.async_show_form(step_id="remove_members", data_schema=data_schema)
+
+    async def async_step_import_members(self, user_input=None):
+        """Add every row of a CSV, JSON Lines or iCalendar file to the roster."""
+        errors = {}
+        if user_input is not None:
+            # The importer imports this module; load it only when used
+            from .importer import add_members, async_read_file
+
+            try:
+                rows, _ = await async_read_file(self.hass, user_input[ATTR_FILE_PATH])
+            except HomeAssistantError:
+                errors[ATTR_FILE_PATH] = "invalid_file"
+            else:
+                members, _ = add_members(roster_members(self._config_entry), rows)
+                return self._async_save_roster(members)
+
+        data_schema = vol.Schema({vol.Required(ATTR_FILE_PATH): str})
+        return self.async_show_form(step_id="import_members", data_schema=data_schema, errors=errors)
+
+    async def async_step_roster_settings(self, user_input=None):
+        """Manage the summary sensor and calendars of a roster."""
+        if user_input is not None:
+            return self._async_save_roster(**user_input)
+
+        options = self._config_entry.options
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+                    default=options.get(CONF_UPCOMING_ANNIVERSARIES_SENSOR, False),
+                ): bool,
+                vol.Optional(
+                    CONF_UPCOMING_COUNT,
+                    default=options.get(CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT),
+                ): vol.All(int, vol.Range(min=1)),
+                vol.Optional(
+                    CONF_MEMBER_ENTITIES,
+                    default=options.get(CONF_MEMBER_ENTITIES, DEFAULT_MEMBER_ENTITIES),
+                ): bool,
+                vol.Optional(
+                    CONF_ENTRY_CALENDAR,
+                    default=options.get(CONF_ENTRY_CALENDAR, DEFAULT_ENTRY_CALENDAR),
+                ): bool,
+                vol.Optional(
+                    CONF_COMBINED_CALENDAR,
+                    default=options.get(CONF_COMBINED_CALENDAR, False),
+                ): bool,
+                vol.Optional(
+                    CONF_CATEGORY_CALENDARS,
+                    default=options.get(CONF_CATEGORY_CALENDARS, False),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="roster_settings", data_schema=data_schema)
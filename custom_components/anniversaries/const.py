@@ -1,7 +1,7 @@
 """Constants for the Anniversaries integration."""
-from homeassistant.const import CONF_NAME
-import homeassistant.helpers.config_validation as cv
-import voluptuous as vol
+# Kept free of heavy imports: the runtime platforms import this module,
+# the emoji table lives in emoji.py.
+from homeassistant.const import CONF_NAME  # noqa: F401
 
 # Base component constants
 DOMAIN = "anniversaries"
@@ -70,6 +70,9 @@ DEFAULT_UNIT_OF_MEASUREMENT = "Days"  # Back to "Days" as requested
 DEFAULT_ONE_TIME = False
 DEFAULT_CATEGORY = CATEGORY_OTHER
 DEFAULT_EMOJI = "🎉"
+DEFAULT_UPCOMING_COUNT = 5
+DEFAULT_ENTRY_CALENDAR = True
+DEFAULT_MEMBER_ENTITIES = True
 # Removed DEFAULT_COUNT_UP - now using attributes instead
 
 # Category-specific default emojis
@@ -84,61 +87,6 @@ CATEGORY_EMOJIS = {
     CATEGORY_OTHER: "⭐",
 }
 
-# Comprehensive emoji options for dropdown selection
-EMOJI_OPTIONS = [
-    # Basic celebrations
-    "🎉", "🎊", "🎈", "🎁", "🎂", "🎄", "🎅", "🤶", "🎃", "👻", "🗽",
-    "🦃", "🍂", "🍁", "🎆", "🎇", "💘", "💝", "💌", "🌹",
-    "💕", "🍀", "🌈", "🎩", "💚", "🐰", "🥚", "🌸", "🌷", "🐣",
-    "👑", "🕷️", "🦇", "🕸️", "🥧", "🥳",
-    "🧨", "🏮", "🌮", "🌯", "🎌", "🪔",
-    
-    # Religious & Spiritual
-    "🕊️", "🙏", "📿", "🕎", "🕯️", "🍯", "🕌", "🌙",
-    "✝️", "⛪", "🧘", "🔯", "🌟", "💫", "✨", "⭐",
-    
-    # Love & Relationships
-    "💍", "💒", "👰", "🤵", "💐", "💖", "💗", "💓", "👫", "👬", "👭", "👩‍❤️‍👨", "👩‍❤️‍👩", "👨‍❤️‍👨", "👩‍❤️‍💋‍👨", "👩‍❤️‍💋‍👩", "👨‍❤️‍💋‍👨", "👨‍👩‍👧", "👨‍👩‍👧‍👦", "👩‍👩‍👦", "👨‍👨‍👦", "❤️", "🥂", "🍾", "💎",
-    
-    # Seasons
-    "🌺", "🌻", "🦋", "☀️", "🌞", "🏖️", "🌊", "🍉", "🌰", "🌾",
-    "🌨️", "🧊", "🔥", "🧤", "🧣", "🛷", "⛸️", "🏂", "🎿",
-    
-    # Travel & Vacations
-    "✈️", "🚗", "🚢", "🚂", "🗺️", "🏔️", "🏝️", "🌴", "🧳", "📷", "🏕️", "🏜️", "🧭",
-    "🎒", "🕶️", "👒", "🗼", "🏰", "🎡", "🎢",
-    
-    # Health & Medical
-    "🏥", "", "🩺", "🦷", "👁️", "🧠", "🩹", "💪", "🏃", "🥗",
-    "🔬", "🧪", "📋", "📊", "📈",
-    
-    # Work & Career
-    "💼", "👔", "💻", "🎓", "✏️", "🖊️", "📝", "🏆", "🥇",
-    "🎯", "🤝", "📞", "✉️", "📧", "📅",
-    
-    # Home & Life
-    "🏠", "🔑", "📦", "🛋️", "🚚", "👶", "🍼", "👪", "💙", "👵", "👴", "🧓",
-    "✍️", "💰", "🏦",
-
-    # Community & Social
-    "🏘️", "🏢", "🏫", "🏛️",
-
-    # Travel & Vacations
-    "✈️", "🚗", "🚢", "🚂", "🗺️", "🏔️", "🏝️", "🌴", "🧳", "📷", "🏕️", "🏜️", "🧭",
-    "🎒", "🕶️", "👒", "🗼", "🏰", "🎡", "🎢",
-
-    # Animals & Pets
-    "🐕", "🐱", "🐰", "🐹", "🐦", "🐴", "🐮", "🐷", "🐸", "🐢",
-    "🦎", "🐍", "🐝", "🐾",
-
-    # Hobbies & Interests
-    "🎨", "🖌️", "🖍️", "📸", "🎵", "🎶", "🎸", "🎹", "🎤", "🥁", "🎧", "🎼", "🎷", "🎺", "🎻", "🪕", "🪗", "🪘", "🪈", "🪇", "🪄", "🩰", "🎮", "🎲", "🃏", "🚴", "🏊", "⚽", "🏀", "🧩", "🧶", "✂️", "🧵",
-
-    # General & Time
-    "⏰", "⏳", "⌛", "🎪", "🎖️", "☂️", "⚡"
-
-]
-
 # Attributes
 ATTR_YEARS_NEXT = "years_at_anniversary"
 ATTR_YEARS_CURRENT = "current_years"
@@ -158,38 +106,41 @@ ATTR_CATEGORY = "category"
 ATTR_DAYS_SINCE_LAST = "days_since_last"
 ATTR_LAST_ANNIVERSARY_DATE = "last_anniversary_date"
 ATTR_YEARS_SINCE_LAST = "years_since_last"
+ATTR_CUSTOM_EMOJI = "custom_emoji"
+
+# Attributes that only change when the anniversary's configuration changes
+STATIC_ATTRIBUTES = frozenset(
+    {
+        ATTR_DATE,
+        ATTR_ZODIAC_SIGN,
+        ATTR_GENERATION,
+        ATTR_BIRTHSTONE,
+        ATTR_BIRTH_FLOWER,
+        ATTR_CATEGORY,
+        ATTR_CUSTOM_EMOJI,
+    }
+)
 
 # Configuration
 CONF_UPCOMING_ANNIVERSARIES_SENSOR = "upcoming_anniversaries_sensor"
+CONF_UPCOMING_COUNT = "upcoming_count"
+CONF_ENTRY_CALENDAR = "entry_calendar"
+CONF_COMBINED_CALENDAR = "combined_calendar"
+CONF_CATEGORY_CALENDARS = "category_calendars"
 CONF_ENABLE_SUMMARY_SENSOR = "enable_summary_sensor"
-
-# Schema
-CONFIG_SCHEMA = vol.Schema(
-    {
-        DOMAIN: vol.Schema(
-            {
-                vol.Optional(CONF_SENSORS): vol.All(
-                    cv.ensure_list,
-                    [
-                        vol.Schema(
-                            {
-                                vol.Required(CONF_NAME): cv.string,
-                                vol.Optional(CONF_DATE): cv.string,
-                                vol.Optional(CONF_DATE_TEMPLATE): cv.string,
-                                vol.Optional(CONF_SOON, default=DEFAULT_SOON): cv.positive_int,
-                                vol.Optional(CONF_ICON_NORMAL, default=DEFAULT_ICON_NORMAL): cv.icon,
-                                vol.Optional(CONF_ICON_TODAY, default=DEFAULT_ICON_TODAY): cv.icon,
-                                vol.Optional(CONF_ICON_SOON, default=DEFAULT_ICON_SOON): cv.icon,
-                                vol.Optional(CONF_HALF_ANNIVERSARY, default=DEFAULT_HALF_ANNIVERSARY): cv.boolean,
-                                vol.Optional(CONF_UNIT_OF_MEASUREMENT, default=DEFAULT_UNIT_OF_MEASUREMENT): cv.string,
-                                vol.Optional(CONF_ONE_TIME, default=DEFAULT_ONE_TIME): cv.boolean,
-                                vol.Optional(CONF_CATEGORY, default=DEFAULT_CATEGORY): vol.In(CATEGORY_OPTIONS),
-                            }
-                        )
-                    ],
-                )
-            }
-        )
-    },
-    extra=vol.ALLOW_EXTRA,
-)
+# Roster entries hold many anniversaries in one config entry
+CONF_ROSTER = "roster"
+CONF_MEMBERS = "anniversaries"
+CONF_MEMBER_ID = "id"
+# False: a roster's anniversaries are served by aggregate entities and the
+# WebSocket API only, without a sensor and calendar per anniversary
+CONF_MEMBER_ENTITIES = "member_entities"
+
+# Services
+SERVICE_IMPORT_FILE = "import_file"
+SERVICE_EXPORT = "export"
+ATTR_FILE_PATH = "file_path"
+ATTR_ROSTER = "roster"
+ATTR_REFERENCE_DATE = "reference_date"
+# Flow context flag marking import flows started by the import_file service
+CONTEXT_BULK_IMPORT = "bulk_import"
@@ -1,14 +1,31 @@
-from datetime import timedelta, date
-import logging
+from collections.abc import Callable, Iterator
+from datetime import date, datetime
 import heapq
+import logging
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_change
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DEFAULT_UPCOMING_COUNT, DOMAIN
+from .data import AnniversaryData, AnniversarySnapshot
+from .engine import AnniversaryColumns, async_load_numpy, build_columns, evaluate_snapshots
+from .index import DayIndex, UpcomingRing
 
 _LOGGER = logging.getLogger(__name__)
 
+# Targeted listener key for the upcoming anniversaries summary.
+_UPCOMING_KEY = None
+# Targeted listener key for any single anniversary being changed.
+_CHANGE_KEY = f"{DOMAIN}.change"
+
+
+def _category_key(category: str) -> str:
+    """Return the targeted listener key for a category's aggregate."""
+    return f"{DOMAIN}.category.{category}"
+
+
 class AnniversaryDataUpdateCoordinator(DataUpdateCoordinator[dict[str, "AnniversaryData"]]):
     """A coordinator to manage anniversary data."""
 
@@ -18,33 +35,369 @@ class AnniversaryDataUpdateCoordinator(DataUpdateCoordinator[dict[str, "Annivers
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(days=1),
+            # No polling: values only change at local midnight, see
+            # async_schedule_midnight_updates.
+            update_interval=None,
         )
         self.anniversaries = anniversaries
-        self.upcoming = []
+        self.snapshots: dict[str, AnniversarySnapshot] = {}
+        self.reference_date: date | None = None
+        self.upcoming: list[AnniversarySnapshot] = []
+        self.upcoming_count = DEFAULT_UPCOMING_COUNT
+        self._unsub_midnight: CALLBACK_TYPE | None = None
+        self._day_index = DayIndex()
+        self._upcoming_ring = UpcomingRing()
+        # Half anniversaries, indexed by their own month/day
+        self._half_index = DayIndex()
+        self._half_dates: dict[str, date] = {}
+        # Members of each category, for the aggregate entities
+        self._categories: dict[str, set[str]] = {}
+        # Columnar copy of the anniversaries for bulk refreshes, rebuilt lazily
+        self._columns: AnniversaryColumns | None = None
+        # Targeted listeners keyed by entry_id; _UPCOMING_KEY is the summary.
+        self._entry_listeners: dict[str | None, list[CALLBACK_TYPE]] = {}
+        # Listeners told the entry_id of every anniversary change
+        self._key_listeners: list[Callable[[str], None]] = []
+        for entry_id, anniversary in anniversaries.items():
+            self._index_anniversary(entry_id, anniversary)
+
+    def _index_anniversary(self, entry_id: str, anniversary: AnniversaryData) -> None:
+        """Place an anniversary in the day index and the upcoming ring."""
+        self._categories.setdefault(anniversary.category, set()).add(entry_id)
+        self._day_index.add(entry_id, anniversary.date.month, anniversary.date.day)
+        self._upcoming_ring.add(
+            entry_id,
+            anniversary.date,
+            recurring=not anniversary.is_one_time,
+            unknown_year=anniversary.unknown_year,
+        )
+        if anniversary.show_half_anniversary and (
+            anniversary.unknown_year or not anniversary.is_one_time
+        ):
+            half_date = anniversary.first_half_anniversary_date
+            self._half_dates[entry_id] = half_date
+            self._half_index.add(entry_id, half_date.month, half_date.day)
+        else:
+            self._half_dates.pop(entry_id, None)
+            self._half_index.discard(entry_id)
+
+    @callback
+    def async_add_entry_listener(
+        self, entry_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes to a single anniversary."""
+        return self._async_add_keyed_listener(entry_id, update_callback)
+
+    @callback
+    def async_add_upcoming_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for changes to the upcoming anniversaries summary."""
+        return self._async_add_keyed_listener(_UPCOMING_KEY, update_callback)
+
+    @callback
+    def async_add_change_listener(self, update_callback: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Listen for any anniversary being added, changed or removed."""
+        return self._async_add_keyed_listener(_CHANGE_KEY, update_callback)
+
+    @callback
+    def async_add_key_listener(self, update_callback: Callable[[str], None]) -> CALLBACK_TYPE:
+        """Listen for any anniversary change, called with the changed entry_id."""
+        self._key_listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the key listener."""
+            if update_callback in self._key_listeners:
+                self._key_listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_add_category_listener(
+        self, category: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for anniversaries of a category being added, changed or removed."""
+        return self._async_add_keyed_listener(_category_key(category), update_callback)
+
+    @callback
+    def _async_add_keyed_listener(
+        self, key: str | None, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Register a targeted listener and return its remover."""
+        self._entry_listeners.setdefault(key, []).append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the targeted listener."""
+            listeners = self._entry_listeners.get(key)
+            if listeners and update_callback in listeners:
+                listeners.remove(update_callback)
+                if not listeners:
+                    del self._entry_listeners[key]
+
+        return remove_listener
+
+    @callback
+    def _async_update_keyed_listeners(self, key: str | None) -> None:
+        """Notify the targeted listeners registered for a key."""
+        for update_callback in list(self._entry_listeners.get(key, ())):
+            update_callback()
+
+    @callback
+    def async_set_anniversary(self, entry_id: str, anniversary: AnniversaryData) -> None:
+        """Add or replace one anniversary, keeping the indexes in sync."""
+        categories = {anniversary.category}
+        if (previous := self.anniversaries.get(entry_id)) is not None:
+            categories.add(previous.category)
+            self._categories[previous.category].discard(entry_id)
+        self.anniversaries[entry_id] = anniversary
+        self.snapshots.pop(entry_id, None)
+        self._columns = None
+        self._index_anniversary(entry_id, anniversary)
+        self._async_anniversary_changed(entry_id, categories)
+
+    @callback
+    def async_remove_anniversary(self, entry_id: str) -> AnniversaryData | None:
+        """Remove one anniversary and its index entries."""
+        self.snapshots.pop(entry_id, None)
+        self._columns = None
+        self._day_index.discard(entry_id)
+        self._upcoming_ring.discard(entry_id)
+        self._half_index.discard(entry_id)
+        self._half_dates.pop(entry_id, None)
+        anniversary = self.anniversaries.pop(entry_id, None)
+        categories = set()
+        if anniversary is not None:
+            categories.add(anniversary.category)
+            self._categories[anniversary.category].discard(entry_id)
+        self._async_anniversary_changed(entry_id, categories)
+        return anniversary
+
+    @callback
+    def _async_anniversary_changed(self, entry_id: str, categories: set[str]) -> None:
+        """Re-render only the entities affected by a single anniversary change."""
+        if self.reference_date is None:
+            # Not refreshed yet; the first refresh notifies everyone.
+            return
+        self._async_update_keyed_listeners(entry_id)
+        for category in categories:
+            self._async_update_keyed_listeners(_category_key(category))
+        self._async_update_keyed_listeners(_CHANGE_KEY)
+        for update_callback in list(self._key_listeners):
+            update_callback(entry_id)
+        self._async_update_upcoming_if_changed()
+
+    @callback
+    def _async_update_upcoming_if_changed(self) -> None:
+        """Recompute the upcoming list and notify the summary if it changed."""
+        previous = self.upcoming
+        self._update_upcoming()
+        if self.upcoming != previous:
+            self._async_update_keyed_listeners(_UPCOMING_KEY)
+
+    @callback
+    def async_set_upcoming_count(self, count: int) -> None:
+        """Change how many anniversaries the upcoming summary lists."""
+        if count == self.upcoming_count:
+            return
+        self.upcoming_count = count
+        if self.reference_date is not None:
+            self._async_update_upcoming_if_changed()
+
+    def anniversaries_on(self, day: date) -> list[AnniversaryData]:
+        """Return the anniversaries occurring on the given date."""
+        return [
+            anniversary
+            for entry_id in self._day_index.on(day)
+            if _occurs_in_year(anniversary := self.anniversaries[entry_id], day.year)
+        ]
+
+    def anniversaries_between(
+        self, start: date, end: date
+    ) -> Iterator[tuple[date, AnniversaryData]]:
+        """Yield (date, anniversary) for every occurrence in [start, end]."""
+        for day, entry_ids in self._day_index.between(start, end):
+            for entry_id in entry_ids:
+                anniversary = self.anniversaries[entry_id]
+                if _occurs_in_year(anniversary, day.year):
+                    yield day, anniversary
+
+    def next_occurrences_between(
+        self, start: date, end: date
+    ) -> Iterator[tuple[str, AnniversarySnapshot]]:
+        """Yield (entry_id, snapshot) for anniversaries next occurring in [start, end].
+
+        Windows of up to a year are read from the day index in date order,
+        in O(days in range + hits); longer ones scan every snapshot.
+        """
+        if (end - start).days > 366:
+            for entry_id, snapshot in self.snapshots_for().items():
+                if start <= snapshot.next_anniversary_date <= end:
+                    yield entry_id, snapshot
+            return
+        for day, entry_ids in self._day_index.between(start, end):
+            for entry_id in entry_ids:
+                snapshot = self.get_snapshot(entry_id)
+                if snapshot.next_anniversary_date == day:
+                    yield entry_id, snapshot
+
+    def occurrences_between(
+        self, start: date, end: date, category: str | None = None
+    ) -> Iterator[tuple[date, AnniversaryData, int | None, bool]]:
+        """Yield (date, anniversary, years, is_half) for occurrences in [start, end].
+
+        Served from the day indexes in O(days in range + hits), in date
+        order, optionally limited to one category. Matches
+        AnniversaryData.occurrences for every anniversary.
+        """
+        return heapq.merge(
+            self._iter_main_occurrences(start, end, category),
+            self._iter_half_occurrences(start, end, category),
+            key=lambda occurrence: occurrence[0],
+        )
+
+    def _iter_main_occurrences(
+        self, start: date, end: date, category: str | None
+    ) -> Iterator[tuple[date, AnniversaryData, int | None, bool]]:
+        """Yield main occurrences from the day index."""
+        for day, entry_ids in self._day_index.between(start, end):
+            for entry_id in entry_ids:
+                anniversary = self.anniversaries[entry_id]
+                if category is not None and anniversary.category != category:
+                    continue
+                if _occurs_in_year(anniversary, day.year):
+                    years = None if anniversary.unknown_year else day.year - anniversary.date.year
+                    yield day, anniversary, years, False
+
+    def _iter_half_occurrences(
+        self, start: date, end: date, category: str | None
+    ) -> Iterator[tuple[date, AnniversaryData, int | None, bool]]:
+        """Yield half anniversary occurrences from the half index."""
+        for day, entry_ids in self._half_index.between(start, end):
+            for entry_id in entry_ids:
+                anniversary = self.anniversaries[entry_id]
+                if category is not None and anniversary.category != category:
+                    continue
+                if anniversary.unknown_year:
+                    yield day, anniversary, None, True
+                elif day.year >= (first_year := self._half_dates[entry_id].year):
+                    yield day, anniversary, day.year - first_year, True
+
+    def async_schedule_midnight_updates(self) -> None:
+        """Start advancing all anniversaries at every local midnight."""
+        if self._unsub_midnight is None:
+            self._unsub_midnight = async_track_time_change(
+                self.hass, self._async_handle_midnight, hour=0, minute=0, second=0
+            )
+
+    async def async_shutdown(self) -> None:
+        """Shut down once no anniversary is left on the shared coordinator.
+
+        The coordinator is created during the first entry's setup, so Home
+        Assistant also calls this when that entry is unloaded even though
+        other entries still depend on it.
+        """
+        if self.anniversaries:
+            return
+        if self._unsub_midnight is not None:
+            self._unsub_midnight()
+            self._unsub_midnight = None
+        await super().async_shutdown()
+
+    async def _async_handle_midnight(self, now: datetime) -> None:
+        """Advance snapshots to the new local day."""
+        today = dt_util.as_local(now).date()
+        if self.reference_date is None or (today - self.reference_date).days != 1:
+            # Missed a day (or never refreshed): evaluate everything.
+            await self.async_refresh()
+            return
+
+        snapshots = self.snapshots
+        for entry_id, anniversary in self.anniversaries.items():
+            snapshot = snapshots.get(entry_id)
+            if snapshot is None or snapshot.anniversary is not anniversary:
+                snapshots[entry_id] = anniversary.snapshot(today)
+            else:
+                snapshots[entry_id] = snapshot.advance(today)
+        self.reference_date = today
+        self._update_upcoming()
+        self.async_set_updated_data(self.anniversaries)
 
     async def _async_update_data(self) -> dict[str, "AnniversaryData"]:
         """Fetch the latest data."""
         try:
-            today = date.today()
-            candidates = [
-                a for a in self.anniversaries.values()
-                if not (a.is_one_time and a.date < today)
-            ]
-            # Use days_remaining to ensure correct ordering for same-year rollover
-            self.upcoming = heapq.nsmallest(
-                5,
-                candidates,
-                key=lambda x: x.days_remaining,
-            )
+            today = dt_util.now().date()
+            self.reference_date = today
+            # Evaluate every anniversary exactly once for this refresh; entities
+            # read the cached snapshot instead of re-deriving dates per property.
+            # NumPy is imported in the executor, never here on the loop.
+            await async_load_numpy(self.hass)
+            if self._columns is None:
+                self._columns = build_columns(self.anniversaries)
+            self.snapshots = evaluate_snapshots(self.anniversaries, today, self._columns)
+            self._update_upcoming()
             # Return the anniversaries dict as the coordinator data
             return self.anniversaries
-            
+
         except Exception as e:
             _LOGGER.error(f"Error updating anniversary data: {e}")
             return self.anniversaries
 
+    def _update_upcoming(self) -> None:
+        """Read the next upcoming anniversaries from the upcoming ring."""
+        self.upcoming = [
+            self.get_snapshot(entry_id)
+            for _, entry_id in self._upcoming_ring.upcoming(
+                self.reference_date, self.upcoming_count
+            )
+        ]
+
+    def get_snapshot(self, entry_id: str) -> AnniversarySnapshot | None:
+        """Return the cached snapshot for an anniversary, evaluating it if stale."""
+        anniversary = self.anniversaries.get(entry_id)
+        if anniversary is None:
+            return None
+        snapshot = self.snapshots.get(entry_id)
+        if snapshot is None or snapshot.anniversary is not anniversary:
+            snapshot = anniversary.snapshot(self.reference_date or dt_util.now().date())
+            self.snapshots[entry_id] = snapshot
+        return snapshot
+
+    def snapshots_for(self, day: date | None = None) -> dict[str, AnniversarySnapshot]:
+        """Return the snapshot of every anniversary for a date.
+
+        The cached snapshots are reused for the coordinator's reference date
+        (the default); other dates are evaluated in bulk.
+        """
+        if day is None or day == self.reference_date:
+            return {entry_id: self.get_snapshot(entry_id) for entry_id in self.anniversaries}
+        if self._columns is None:
+            self._columns = build_columns(self.anniversaries)
+        return evaluate_snapshots(self.anniversaries, day, self._columns)
+
+    def category_snapshots(self, category: str) -> list[AnniversarySnapshot]:
+        """Return the snapshots of the anniversaries of a category."""
+        return [self.get_snapshot(entry_id) for entry_id in self._categories.get(category, ())]
+
+    def anniversaries_in_next_days(self, days: int) -> Iterator[tuple[date, AnniversaryData]]:
+        """Yield (date, anniversary) for occurrences from today over the next days."""
+        today = self.reference_date or dt_util.now().date()
+        return self.anniversaries_between(today, date.fromordinal(today.toordinal() + days))
+
     @property
     def upcoming_anniversaries(self) -> list["AnniversaryData"]:
-        """Return a sorted list of the next 5 upcoming anniversaries."""
+        """Return a sorted list of the next upcoming anniversaries."""
+        return [s.anniversary for s in self.upcoming]
+
+    @property
+    def upcoming_snapshots(self) -> list[AnniversarySnapshot]:
+        """Return snapshots of the next upcoming anniversaries, soonest first."""
         return self.upcoming
+
+
+def _occurs_in_year(anniversary: AnniversaryData, year: int) -> bool:
+    """Return True if the anniversary has an occurrence in the given year."""
+    if anniversary.unknown_year:
+        return True
+    if anniversary.is_one_time:
+        return anniversary.date.year == year
+    return anniversary.date.year <= year
@@ -1,7 +1,21 @@
-from dataclasses import dataclass, field
-from datetime import date, datetime
-
-from dateutil.relativedelta import relativedelta
+from collections.abc import Iterator
+from dataclasses import InitVar, dataclass
+from datetime import date
+import heapq
+import sys
+from typing import NamedTuple
+
+from .datemath import (
+    add_months,
+    is_milestone as _is_milestone,
+    last_occurrence,
+    named_anniversary as _named_anniversary,
+    next_occurrence,
+    observed_date,
+    years_between,
+)
+from .dateparse import parse_date
+from .index import SLOT_COUNT, day_slot
 
 # Generation Alpha is ongoing, estimated end year
 GEN_ALPHA_END_YEAR = 2025
@@ -74,9 +88,136 @@ def get_zodiac_sign(day, month):
         return "Capricorn"
 
 
-@dataclass
+class DayTraits(NamedTuple):
+    """Traits that depend only on the month and day."""
+
+    zodiac_sign: str
+    birthstone: str
+    birth_flower: str
+
+
+class YearTraits(NamedTuple):
+    """Traits that depend only on the year."""
+
+    generation: str | None
+
+
+def _generation_of(year: int) -> str | None:
+    """Return the generation for a birth year."""
+    for name, start, end in _GENERATIONS:
+        if start <= year <= end:
+            return name
+    return None
+
+
+def _build_day_traits() -> tuple[DayTraits, ...]:
+    """Return the traits of every day-of-year slot, taken from a leap year."""
+    first = date(2000, 1, 1).toordinal()
+    traits = []
+    for slot in range(SLOT_COUNT):
+        day = date.fromordinal(first + slot)
+        traits.append(
+            DayTraits(
+                zodiac_sign=get_zodiac_sign(day.day, day.month),
+                birthstone=_BIRTHSTONES[day.month],
+                birth_flower=_BIRTH_FLOWERS[day.month],
+            )
+        )
+    return tuple(traits)
+
+
+# Traits by day-of-year slot (February 29th included) and by year, built
+# once at import so lookups are plain tuple indexing.
+_DAY_TRAITS = _build_day_traits()
+
+_FIRST_TRAIT_YEAR = _GENERATIONS[0][1]
+_YEAR_TRAITS = tuple(
+    YearTraits(generation=_generation_of(year))
+    for year in range(_FIRST_TRAIT_YEAR, GEN_ALPHA_END_YEAR + 1)
+)
+_NO_YEAR_TRAITS = YearTraits(generation=None)
+
+
+def day_traits(month: int, day: int) -> DayTraits:
+    """Return the zodiac sign, birthstone and birth flower for a month/day."""
+    return _DAY_TRAITS[day_slot(month, day)]
+
+
+def year_traits(year: int) -> YearTraits:
+    """Return the traits for a year."""
+    index = year - _FIRST_TRAIT_YEAR
+    if 0 <= index < len(_YEAR_TRAITS):
+        return _YEAR_TRAITS[index]
+    return _NO_YEAR_TRAITS
+
+
+@dataclass(frozen=True, slots=True)
+class AnniversarySnapshot:
+    """Date-dependent anniversary values evaluated for one reference date."""
+
+    anniversary: "AnniversaryData"
+    reference_date: date
+    next_anniversary_date: date
+    last_anniversary_date: date
+    days_remaining: int
+    weeks_remaining: int
+    current_years: int | None
+    next_years: int | None
+    years_since_last: int | None
+    days_since_last: int
+    is_milestone: bool
+    named_anniversary: str | None
+    half_anniversary_date: date | None
+    days_until_half_anniversary: int | None
+
+    def advance(self, today: date) -> "AnniversarySnapshot":
+        """Return the snapshot for the day after this one's reference date.
+
+        Only the day counters move, unless the anniversary or its half
+        anniversary falls on the new day or has just passed, in which case
+        the anniversary is fully re-evaluated. The observed month/day is
+        checked too, as a first anniversary still years ahead does not
+        bring days_remaining down on it.
+        """
+        half_days = self.days_until_half_anniversary
+        anniversary = self.anniversary
+        if (
+            (today - self.reference_date).days != 1
+            or anniversary.is_one_time
+            or self.days_remaining < 2
+            or (half_days is not None and half_days < 2)
+            or self.reference_date == self.last_anniversary_date
+            or last_occurrence(anniversary.date.month, anniversary.date.day, today)
+            != self.last_anniversary_date
+        ):
+            return anniversary.snapshot(today)
+
+        days_remaining = self.days_remaining - 1
+        return AnniversarySnapshot(
+            anniversary=anniversary,
+            reference_date=today,
+            next_anniversary_date=self.next_anniversary_date,
+            last_anniversary_date=self.last_anniversary_date,
+            days_remaining=days_remaining,
+            weeks_remaining=days_remaining // 7,
+            current_years=self.current_years,
+            next_years=self.next_years,
+            years_since_last=self.years_since_last,
+            days_since_last=self.days_since_last + 1,
+            is_milestone=self.is_milestone,
+            named_anniversary=self.named_anniversary,
+            half_anniversary_date=self.half_anniversary_date,
+            days_until_half_anniversary=None if half_days is None else half_days - 1,
+        )
+
+
+@dataclass(slots=True)
 class AnniversaryData:
-    """A class to hold anniversary data."""
+    """A class to hold anniversary data.
+
+    Instances are slotted and do not keep the config they were built from;
+    the config entry stays the source of truth for everything else.
+    """
 
     name: str
     date: date
@@ -85,39 +226,33 @@ class AnniversaryData:
     category: str = "other"
     emoji: str = "🎉"
     unknown_year: bool = False
-    config: dict = field(default_factory=dict)
+    # Accepted for compatibility with older callers, but not stored
+    config: InitVar[dict | None] = None
+
+    @property
+    def day_traits(self) -> DayTraits:
+        """Return the month/day traits of the anniversary date."""
+        return _DAY_TRAITS[day_slot(self.date.month, self.date.day)]
 
     @property
     def birthstone(self) -> str | None:
         """Return the birthstone for the anniversary month."""
-        return _BIRTHSTONES.get(self.date.month)
+        return self.day_traits.birthstone
 
     @property
     def birth_flower(self) -> str | None:
         """Return the birth flower for the anniversary month."""
-        return _BIRTH_FLOWERS.get(self.date.month)
+        return self.day_traits.birth_flower
 
     @property
     def zodiac_sign(self) -> str | None:
         """Return the zodiac sign of the anniversary."""
-        return get_zodiac_sign(self.date.day, self.date.month)
+        return self.day_traits.zodiac_sign
 
     @property
     def named_anniversary(self) -> str | None:
         """Return the name of the anniversary if it's a known one."""
-        named_anniversaries = {
-            1: "Paper",
-            5: "Wood",
-            10: "Tin",
-            15: "Crystal",
-            20: "China",
-            25: "Silver",
-            30: "Pearl",
-            40: "Ruby",
-            50: "Golden",
-            60: "Diamond",
-        }
-        return named_anniversaries.get(self.next_years)
+        return _named_anniversary(self.next_years)
 
     @property
     def category_default_icon(self) -> str:
@@ -130,23 +265,12 @@ class AnniversaryData:
         """Return the generation of the person."""
         if self.unknown_year:
             return None
-        year = self.date.year
-
-        for name, start, end in _GENERATIONS:
-            if start <= year <= end:
-                return name
-
-        return None
+        return year_traits(self.date.year).generation
 
     @property
     def is_milestone(self) -> bool:
         """Return true if the anniversary is a milestone."""
-        milestone_years = [1, 5, 10, 18, 21, 25, 50, 75, 100]
-        if self.next_years in milestone_years:
-            return True
-        if self.next_years is not None and self.next_years > 0 and self.next_years % 10 == 0:
-            return True
-        return False
+        return _is_milestone(self.next_years)
 
     @property
     def days_remaining(self) -> int:
@@ -158,47 +282,41 @@ class AnniversaryData:
     @property
     def next_anniversary_date(self) -> date:
         """Calculate the date of the next anniversary."""
-        today = date.today()
-        anniversary_date = self.date
-        if self.unknown_year:
-            anniversary_date = anniversary_date.replace(year=today.year)
-
-        if self.is_one_time and anniversary_date < today:
-            return anniversary_date  # Past one-time event
+        return self._next_anniversary_date(date.today())
 
-        next_date = anniversary_date
-        if today >= next_date:
-            next_date = next_date.replace(year=today.year)
-        if today > next_date:
-            next_date = next_date.replace(year=today.year + 1)
-        return next_date
+    def _next_anniversary_date(self, today: date) -> date:
+        """Calculate the date of the next anniversary as seen from today."""
+        month, day = self.date.month, self.date.day
+        if self.unknown_year:
+            if self.is_one_time:
+                return observed_date(today.year, month, day)
+            return next_occurrence(month, day, today)
+        if today < self.date or self.is_one_time:
+            return self.date  # First occurrence ahead, or a one-time event
+        return next_occurrence(month, day, today)
 
     @property
     def last_anniversary_date(self) -> date:
         """Calculate the date of the last anniversary."""
-        today = date.today()
-        anniversary_date = self.date
-        if self.unknown_year:
-            anniversary_date = anniversary_date.replace(year=today.year)
+        return self._last_anniversary_date(date.today())
 
-        last_date = anniversary_date.replace(year=today.year)
-        if today < last_date:
-            last_date = last_date.replace(year=today.year - 1)
-        return last_date
+    def _last_anniversary_date(self, today: date) -> date:
+        """Calculate the date of the last anniversary as seen from today."""
+        return last_occurrence(self.date.month, self.date.day, today)
 
     @property
     def current_years(self) -> int | None:
         """Calculate the current number of years."""
         if self.unknown_year:
             return None
-        return relativedelta(date.today(), self.date).years
+        return years_between(date.today(), self.date)
 
     @property
     def next_years(self) -> int | None:
         """Calculate the number of years at the next anniversary."""
         if self.unknown_year:
             return None
-        return relativedelta(self.next_anniversary_date, self.date).years
+        return years_between(self.next_anniversary_date, self.date)
 
     @property
     def weeks_remaining(self) -> int:
@@ -210,17 +328,19 @@ class AnniversaryData:
         """Calculate the half anniversary date."""
         if not self.show_half_anniversary:
             return None
+        return self._half_anniversary_date(date.today())
 
-        today = date.today()
-        half_date = self.date + relativedelta(months=+6)
-
-        next_half_date = half_date
-        if today >= next_half_date:
-            next_half_date = next_half_date.replace(year=today.year)
-        if today > next_half_date:
-            next_half_date = next_half_date.replace(year=today.year + 1)
+    @property
+    def first_half_anniversary_date(self) -> date:
+        """Return the date of the first half anniversary."""
+        return add_months(self.date, 6)
 
-        return next_half_date
+    def _half_anniversary_date(self, today: date) -> date:
+        """Calculate the next half anniversary date as seen from today."""
+        half_date = self.first_half_anniversary_date
+        if today < half_date:
+            return half_date
+        return next_occurrence(half_date.month, half_date.day, today)
 
     @property
     def days_until_half_anniversary(self) -> int | None:
@@ -254,11 +374,90 @@ class AnniversaryData:
         
         if self.is_one_time:
             # For one-time events: return years from the event date
-            return relativedelta(date.today(), self.date).years
+            return years_between(date.today(), self.date)
         else:
             # For recurring anniversaries: return years at last anniversary
             last_anniversary = self.last_anniversary_date
-            return relativedelta(last_anniversary, self.date).years
+            return years_between(last_anniversary, self.date)
+
+    def occurrences(self, start: date, end: date) -> Iterator[tuple[date, int | None, bool]]:
+        """Lazily yield (date, years, is_half) for every occurrence in [start, end].
+
+        Occurrences are yielded in date order, including half anniversaries
+        when enabled. years is the number of completed years on that date, or
+        None when the year is unknown. Work is O(years in range).
+        """
+        streams = [self._iter_yearly(self.date, start, end, False)]
+        if self.show_half_anniversary:
+            streams.append(
+                self._iter_yearly(self.first_half_anniversary_date, start, end, True)
+            )
+        return heapq.merge(*streams, key=lambda occurrence: occurrence[0])
+
+    def _iter_yearly(
+        self, first: date, start: date, end: date, is_half: bool
+    ) -> Iterator[tuple[date, int | None, bool]]:
+        """Yield yearly occurrences of first's month/day within [start, end]."""
+        if self.is_one_time and not self.unknown_year:
+            if start <= first <= end and not is_half:
+                yield first, 0, False
+            return
+
+        first_year = start.year if self.unknown_year else max(start.year, first.year)
+        for year in range(first_year, end.year + 1):
+            occurrence = observed_date(year, first.month, first.day)
+            if occurrence < start:
+                continue
+            if occurrence > end:
+                return
+            yield occurrence, None if self.unknown_year else year - first.year, is_half
+
+    def snapshot(self, today: date | None = None) -> "AnniversarySnapshot":
+        """Evaluate every date-dependent value once for the given reference date."""
+        if today is None:
+            today = date.today()
+
+        next_date = self._next_anniversary_date(today)
+        last_date = self._last_anniversary_date(today)
+        days_remaining = (next_date - today).days
+
+        if self.unknown_year:
+            current_years = next_years = years_since_last = None
+        else:
+            current_years = years_between(today, self.date)
+            next_years = years_between(next_date, self.date)
+            if self.is_one_time:
+                years_since_last = current_years
+            else:
+                years_since_last = years_between(last_date, self.date)
+
+        if self.is_one_time:
+            days_since_last = (today - self.date).days
+        else:
+            days_since_last = (today - last_date).days
+
+        half_date = None
+        half_days = None
+        if self.show_half_anniversary:
+            half_date = self._half_anniversary_date(today)
+            half_days = (half_date - today).days
+
+        return AnniversarySnapshot(
+            anniversary=self,
+            reference_date=today,
+            next_anniversary_date=next_date,
+            last_anniversary_date=last_date,
+            days_remaining=days_remaining,
+            weeks_remaining=days_remaining // 7,
+            current_years=current_years,
+            next_years=next_years,
+            years_since_last=years_since_last,
+            days_since_last=days_since_last,
+            is_milestone=_is_milestone(next_years),
+            named_anniversary=_named_anniversary(next_years),
+            half_anniversary_date=half_date,
+            days_until_half_anniversary=half_days,
+        )
 
     @classmethod
     def from_config(cls, config: dict) -> "AnniversaryData":
@@ -272,7 +471,7 @@ class AnniversaryData:
         # Debug logging
         import logging
         _LOGGER = logging.getLogger(__name__)
-        _LOGGER.debug(f"Creating anniversary from config: {config}")
+        _LOGGER.debug("Creating anniversary from config: %s", config)
         
         # Parse the date
         date_str = config.get(CONF_DATE, "")
@@ -288,14 +487,10 @@ class AnniversaryData:
             raise ValueError(f"Date is required. Config keys: {list(config.keys())}")
             
         try:
-            anniversary_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            unknown_year = False
-        except ValueError:
-            try:
-                anniversary_date = datetime.strptime(date_str, "%m-%d").date().replace(year=1900)
-                unknown_year = True
-            except ValueError:
-                raise ValueError(f"Invalid date format: {date_str}")
+            # Memoized: roster members and bulk imports repeat the same dates
+            anniversary_date, unknown_year = parse_date(date_str)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid date format: {date_str}")
         
         # Validate and sanitize category
         category = config.get(CONF_CATEGORY, DEFAULT_CATEGORY)
@@ -313,8 +508,8 @@ class AnniversaryData:
             date=anniversary_date,
             is_one_time=config.get(CONF_ONE_TIME, False),
             show_half_anniversary=config.get(CONF_HALF_ANNIVERSARY, False),
-            category=category,
-            emoji=emoji,
+            # Categories and emojis repeat across entries; share one string each
+            category=sys.intern(category),
+            emoji=sys.intern(emoji),
             unknown_year=unknown_year,
-            config=config
         )
@@ -0,0 +1,121 @@
+"""Anniversary dates rendered from a template, e.g. an input_datetime's state."""
+from __future__ import annotations
+
+from datetime import date, datetime
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import TemplateError
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    TrackTemplateResult,
+    async_track_template_result,
+)
+from homeassistant.helpers.template import Template
+
+from .const import CONF_DATE, CONF_DATE_TEMPLATE
+from .coordinator import AnniversaryDataUpdateCoordinator
+from .data import AnniversaryData
+from .dateparse import parse_date
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def has_date_template(config: dict[str, Any]) -> bool:
+    """Return True if an anniversary takes its date from a template."""
+    return bool(config.get(CONF_DATE_TEMPLATE))
+
+
+def rendered_date(result: Any) -> str | None:
+    """Return the date string of a template result, or None if it has none.
+
+    Datetimes, such as the state of an input_datetime with a time, keep
+    their date part.
+    """
+    if isinstance(result, datetime):
+        return result.date().isoformat()
+    if isinstance(result, date):
+        return result.isoformat()
+    text = str(result).strip()
+    if len(text) > 10 and text[10] in "T ":
+        text = text[:10]
+    try:
+        parse_date(text)
+    except ValueError:
+        return None
+    return text
+
+
+class DateTemplateTracker:
+    """Re-render date templates only when the entities they read change.
+
+    Each template is tracked with Home Assistant's template result tracking,
+    so nothing is polled. A new date replaces that one anniversary in the
+    coordinator, which only updates its index slots and its entities.
+    """
+
+    def __init__(self, hass: HomeAssistant, coordinator: AnniversaryDataUpdateCoordinator) -> None:
+        """Initialize the tracker."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._tracked: dict[str, tuple[dict[str, Any], CALLBACK_TYPE]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if the anniversary's date template is tracked."""
+        return key in self._tracked
+
+    def __len__(self) -> int:
+        """Return the number of tracked templates."""
+        return len(self._tracked)
+
+    @property
+    def keys(self) -> list[str]:
+        """Return the coordinator keys of the tracked anniversaries."""
+        return list(self._tracked)
+
+    @callback
+    def async_track(self, key: str, config: dict[str, Any]) -> None:
+        """Render an anniversary's date template now and whenever its inputs change."""
+        if (tracked := self._tracked.get(key)) is not None and tracked[0] == config:
+            return
+        self.async_untrack(key)
+        template = Template(config[CONF_DATE_TEMPLATE], self._hass)
+
+        @callback
+        def _async_rendered(
+            event: Event | None, updates: list[TrackTemplateResult]
+        ) -> None:
+            self._async_apply(key, config, updates[-1].result)
+
+        info = async_track_template_result(
+            self._hass, [TrackTemplate(template, None)], _async_rendered
+        )
+        self._tracked[key] = (config, info.async_remove)
+        info.async_refresh()
+
+    @callback
+    def async_untrack(self, key: str) -> None:
+        """Stop tracking an anniversary's date template."""
+        if (tracked := self._tracked.pop(key, None)) is not None:
+            tracked[1]()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking every template."""
+        for key in self.keys:
+            self.async_untrack(key)
+
+    @callback
+    def _async_apply(self, key: str, config: dict[str, Any], result: Any) -> None:
+        """Replace the anniversary with the rendered date, if it changed."""
+        if isinstance(result, TemplateError):
+            _LOGGER.warning("Date template of %s failed to render: %s", key, result)
+            return
+        if (text := rendered_date(result)) is None:
+            # Unknown or unavailable entities: keep the last date
+            _LOGGER.debug("Date template of %s rendered no date: %s", key, result)
+            return
+        anniversary = AnniversaryData.from_config({**config, CONF_DATE: text})
+        if self._coordinator.anniversaries.get(key) != anniversary:
+            self._coordinator.async_set_anniversary(key, anniversary)
@@ -0,0 +1,94 @@
+"""Integer date arithmetic for anniversaries.
+
+February 29th policy: an anniversary on February 29th is observed on
+February 28th in common years, and a full year is counted on that day.
+This matches dateutil's relativedelta, which clamps the day to the end of
+the month, so years_between(a, b) == relativedelta(a, b).years.
+"""
+from __future__ import annotations
+
+from calendar import isleap
+from datetime import date
+from types import MappingProxyType
+
+NAMED_ANNIVERSARIES = MappingProxyType(
+    {
+        1: "Paper",
+        5: "Wood",
+        10: "Tin",
+        15: "Crystal",
+        20: "China",
+        25: "Silver",
+        30: "Pearl",
+        40: "Ruby",
+        50: "Golden",
+        60: "Diamond",
+    }
+)
+
+MILESTONE_YEARS = frozenset((1, 5, 10, 18, 21, 25, 50, 75, 100))
+
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_milestone(years: int | None) -> bool:
+    """Return true if the given number of years is a milestone."""
+    if years is None:
+        return False
+    return years in MILESTONE_YEARS or (years > 0 and years % 10 == 0)
+
+
+def named_anniversary(years: int | None) -> str | None:
+    """Return the traditional name for a number of years, if it has one."""
+    return NAMED_ANNIVERSARIES.get(years)
+
+
+def observed_day(year: int, month: int, day: int) -> int:
+    """Return the day of month a month/day is observed on in a year."""
+    if day == 29 and month == 2 and not isleap(year):
+        return 28
+    return day
+
+
+def observed_date(year: int, month: int, day: int) -> date:
+    """Return the date a month/day is observed on in a year (Feb 29 -> Feb 28)."""
+    return date(year, month, observed_day(year, month, day))
+
+
+def years_between(later: date, earlier: date) -> int:
+    """Return the whole years from earlier to later, negative if reversed."""
+    years = later.year - earlier.year
+    # earlier's month/day as observed in later's year
+    month = earlier.month
+    day = observed_day(later.year, month, earlier.day)
+    if later >= earlier:
+        if later.month < month or (later.month == month and later.day < day):
+            years -= 1
+    elif later.month > month or (later.month == month and later.day > day):
+        years += 1
+    return years
+
+
+def next_occurrence(month: int, day: int, today: date) -> date:
+    """Return the first observed month/day on or after today."""
+    occurrence = observed_date(today.year, month, day)
+    if occurrence < today:
+        occurrence = observed_date(today.year + 1, month, day)
+    return occurrence
+
+
+def last_occurrence(month: int, day: int, today: date) -> date:
+    """Return the last observed month/day on or before today."""
+    occurrence = observed_date(today.year, month, day)
+    if occurrence > today:
+        occurrence = observed_date(today.year - 1, month, day)
+    return occurrence
+
+
+def add_months(value: date, months: int) -> date:
+    """Return value moved by whole months, clamping the day to the month end."""
+    index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(index, 12)
+    month += 1
+    length = _DAYS_IN_MONTH[month - 1] + (month == 2 and isleap(year))
+    return date(year, month, min(value.day, length))
@@ -0,0 +1,91 @@
+"""Parse the date of an anniversary, shared by the config flow and from_config.
+
+Accepted formats:
+
+- ``YYYY-MM-DD`` (ISO 8601), ``YYYY/MM/DD`` and ``DD.MM.YYYY``
+- ``YYYY-Www-D`` or ``YYYYWwwD`` (ISO week date)
+- ``MM-DD`` or ``--MM-DD`` when the year is unknown
+
+A date without a year is stored in UNKNOWN_YEAR, or in UNKNOWN_LEAP_YEAR
+for February 29th, which does not exist in 1900.
+"""
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+from typing import NamedTuple
+
+UNKNOWN_YEAR = 1900
+UNKNOWN_LEAP_YEAR = 1904
+
+# Distinct date strings kept parsed; bulk loads repeat many of them
+CACHE_SIZE = 4096
+
+
+class ParsedDate(NamedTuple):
+    """A parsed anniversary date."""
+
+    date: date
+    unknown_year: bool
+
+
+def _number(text: str, digits: tuple[int, ...]) -> int:
+    """Return the value of a field of ASCII digits with an allowed length."""
+    if len(text) not in digits or not text.isascii() or not text.isdigit():
+        raise ValueError(f"Invalid date field: {text!r}")
+    return int(text)
+
+
+def _week_date(text: str) -> date:
+    """Parse an ISO week date: YYYY-Www-D or YYYYWwwD."""
+    year, _, rest = text.upper().partition("W")
+    week, day = (rest[:-2], rest[-1]) if year.endswith("-") else (rest[:2], rest[2:])
+    return date.fromisocalendar(
+        _number(year.rstrip("-"), (4,)), _number(week, (2,)), _number(day, (1,))
+    )
+
+
+def _month_day(month: int, day: int) -> date:
+    """Return a month and day as a date in the placeholder year."""
+    if month == 2 and day == 29:
+        return date(UNKNOWN_LEAP_YEAR, 2, 29)
+    return date(UNKNOWN_YEAR, month, day)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_date(value: str) -> ParsedDate:
+    """Parse a date string; raise ValueError if it matches no format."""
+    text = value.strip()
+    if "W" in text or "w" in text:
+        return ParsedDate(_week_date(text), False)
+    if text.startswith("--"):
+        month, _, day = text[2:].partition("-")
+        return ParsedDate(_month_day(_number(month, (1, 2)), _number(day, (1, 2))), True)
+    for separator in "-/.":
+        parts = text.split(separator)
+        if len(parts) > 1:
+            break
+    else:
+        raise ValueError(f"Invalid date format: {value!r}")
+
+    if separator == "-" and len(parts) == 2:
+        month, day = parts
+        return ParsedDate(_month_day(_number(month, (1, 2)), _number(day, (1, 2))), True)
+    if len(parts) != 3:
+        raise ValueError(f"Invalid date format: {value!r}")
+    if separator == ".":
+        day, month, year = parts
+    else:
+        year, month, day = parts
+    return ParsedDate(
+        date(_number(year, (4,)), _number(month, (1, 2)), _number(day, (1, 2))), False
+    )
+
+
+def is_valid_date(value: str, one_time: bool = False) -> bool:
+    """Return True if value parses; a one-time event needs the year."""
+    try:
+        parsed = parse_date(value)
+    except (TypeError, ValueError):
+        return False
+    return not (one_time and parsed.unknown_year)
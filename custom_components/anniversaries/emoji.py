@@ -0,0 +1,355 @@
+"""Emoji catalog offered by the config flow, searchable by keyword."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import NamedTuple
+
+# Group -> (emoji, name, extra search keywords); every emoji appears once
+EMOJI_CATALOG: dict[str, tuple[tuple[str, str, str], ...]] = {
+    "Celebrations": (
+        ("🎉", "Party popper", "celebration tada congratulations"),
+        ("🎊", "Confetti ball", "celebration party"),
+        ("🎈", "Balloon", "party birthday"),
+        ("🎁", "Wrapped gift", "present birthday christmas"),
+        ("🎂", "Birthday cake", "party dessert candles"),
+        ("🎄", "Christmas tree", "xmas holiday"),
+        ("🎅", "Santa Claus", "christmas xmas father"),
+        ("🤶", "Mrs. Claus", "christmas xmas mother"),
+        ("🎃", "Jack-o-lantern", "halloween pumpkin"),
+        ("👻", "Ghost", "halloween spooky"),
+        ("🗽", "Statue of Liberty", "independence july usa"),
+        ("🦃", "Turkey", "thanksgiving"),
+        ("🍂", "Fallen leaf", "autumn fall thanksgiving"),
+        ("🍁", "Maple leaf", "autumn fall canada"),
+        ("🎆", "Fireworks", "new year independence"),
+        ("🎇", "Sparkler", "fireworks new year"),
+        ("💘", "Heart with arrow", "valentine cupid love"),
+        ("💝", "Heart with ribbon", "valentine gift love"),
+        ("💌", "Love letter", "valentine mail"),
+        ("🌹", "Rose", "flower love memorial valentine"),
+        ("💕", "Two hearts", "love anniversary"),
+        ("🍀", "Four leaf clover", "luck st patrick irish"),
+        ("🌈", "Rainbow", "pride"),
+        ("🎩", "Top hat", "new year formal"),
+        ("💚", "Green heart", "st patrick love"),
+        ("🐰", "Rabbit face", "easter bunny pet"),
+        ("🥚", "Egg", "easter"),
+        ("🌸", "Cherry blossom", "spring flower"),
+        ("🌷", "Tulip", "spring flower mother"),
+        ("🐣", "Hatching chick", "easter spring"),
+        ("👑", "Crown", "king queen royal"),
+        ("🕷️", "Spider", "halloween"),
+        ("🦇", "Bat", "halloween"),
+        ("🕸️", "Spider web", "halloween"),
+        ("🥧", "Pie", "thanksgiving pi dessert"),
+        ("🥳", "Partying face", "birthday celebration"),
+        ("🧨", "Firecracker", "lunar new year chinese"),
+        ("🏮", "Red paper lantern", "lunar new year chinese"),
+        ("🌮", "Taco", "cinco de mayo mexican"),
+        ("🌯", "Burrito", "mexican"),
+        ("🎌", "Crossed flags", "japan"),
+        ("🪔", "Diya lamp", "diwali"),
+    ),
+    "Religious & Spiritual": (
+        ("🕊️", "Dove", "peace memorial"),
+        ("🙏", "Folded hands", "prayer thanks"),
+        ("📿", "Prayer beads", "rosary"),
+        ("🕎", "Menorah", "hanukkah jewish"),
+        ("🕯️", "Candle", "memorial hanukkah"),
+        ("🍯", "Honey pot", "rosh hashanah"),
+        ("🕌", "Mosque", "eid islam"),
+        ("🌙", "Crescent moon", "eid ramadan night"),
+        ("✝️", "Latin cross", "christian easter"),
+        ("⛪", "Church", "christian wedding baptism"),
+        ("🧘", "Person in lotus position", "yoga meditation"),
+        ("🔯", "Dotted six-pointed star", "star"),
+        ("🌟", "Glowing star", "shine"),
+        ("💫", "Dizzy", "star"),
+        ("✨", "Sparkles", "star magic"),
+        ("⭐", "Star", "favorite"),
+    ),
+    "Love & Relationships": (
+        ("💍", "Ring", "engagement wedding proposal"),
+        ("💒", "Wedding", "chapel marriage"),
+        ("👰", "Person with veil", "bride wedding"),
+        ("🤵", "Person in tuxedo", "groom wedding"),
+        ("💐", "Bouquet", "flowers wedding"),
+        ("💖", "Sparkling heart", "love"),
+        ("💗", "Growing heart", "love"),
+        ("💓", "Beating heart", "love"),
+        ("👫", "Woman and man holding hands", "couple"),
+        ("👬", "Men holding hands", "couple"),
+        ("👭", "Women holding hands", "couple"),
+        ("👩‍❤️‍👨", "Couple with heart", "love woman man"),
+        ("👩‍❤️‍👩", "Couple with heart", "love women"),
+        ("👨‍❤️‍👨", "Couple with heart", "love men"),
+        ("👩‍❤️‍💋‍👨", "Kiss", "couple love woman man"),
+        ("👩‍❤️‍💋‍👩", "Kiss", "couple love women"),
+        ("👨‍❤️‍💋‍👨", "Kiss", "couple love men"),
+        ("👨‍👩‍👧", "Family", "parents daughter"),
+        ("👨‍👩‍👧‍👦", "Family", "parents children"),
+        ("👩‍👩‍👦", "Family", "mothers son"),
+        ("👨‍👨‍👦", "Family", "fathers son"),
+        ("❤️", "Red heart", "love"),
+        ("🥂", "Clinking glasses", "toast cheers champagne"),
+        ("🍾", "Bottle with popping cork", "champagne celebration"),
+        ("💎", "Gem stone", "diamond jewel"),
+    ),
+    "Seasons": (
+        ("🌺", "Hibiscus", "flower summer"),
+        ("🌻", "Sunflower", "flower summer"),
+        ("🦋", "Butterfly", "spring"),
+        ("☀️", "Sun", "summer weather"),
+        ("🌞", "Sun with face", "summer"),
+        ("🏖️", "Beach with umbrella", "summer vacation"),
+        ("🌊", "Water wave", "ocean sea"),
+        ("🍉", "Watermelon", "summer fruit"),
+        ("🌰", "Chestnut", "autumn fall"),
+        ("🌾", "Sheaf of rice", "harvest autumn"),
+        ("🌨️", "Cloud with snow", "winter weather"),
+        ("🧊", "Ice", "winter cold"),
+        ("🔥", "Fire", "hot flame"),
+        ("🧤", "Gloves", "winter"),
+        ("🧣", "Scarf", "winter"),
+        ("🛷", "Sled", "winter snow"),
+        ("⛸️", "Ice skate", "winter skating"),
+        ("🏂", "Snowboarder", "winter snow"),
+        ("🎿", "Skis", "winter snow skiing"),
+    ),
+    "Travel & Vacations": (
+        ("✈️", "Airplane", "flight travel trip"),
+        ("🚗", "Automobile", "car drive road trip"),
+        ("🚢", "Ship", "cruise boat"),
+        ("🚂", "Locomotive", "train"),
+        ("🗺️", "World map", "travel"),
+        ("🏔️", "Snow-capped mountain", "hiking"),
+        ("🏝️", "Desert island", "vacation tropical"),
+        ("🌴", "Palm tree", "vacation tropical"),
+        ("🧳", "Luggage", "travel suitcase"),
+        ("📷", "Camera", "photo"),
+        ("🏕️", "Camping", "tent outdoors"),
+        ("🏜️", "Desert", "travel"),
+        ("🧭", "Compass", "travel adventure"),
+        ("🎒", "Backpack", "school travel"),
+        ("🕶️", "Sunglasses", "summer cool"),
+        ("👒", "Woman's hat", "summer"),
+        ("🗼", "Tokyo tower", "travel landmark"),
+        ("🏰", "Castle", "travel landmark"),
+        ("🎡", "Ferris wheel", "fair amusement"),
+        ("🎢", "Roller coaster", "amusement park"),
+    ),
+    "Health & Medical": (
+        ("🏥", "Hospital", "medical health"),
+        ("🩺", "Stethoscope", "doctor checkup"),
+        ("🦷", "Tooth", "dentist"),
+        ("👁️", "Eye", "optician checkup"),
+        ("🧠", "Brain", "mind"),
+        ("🩹", "Adhesive bandage", "injury recovery"),
+        ("💪", "Flexed biceps", "strong fitness"),
+        ("🏃", "Person running", "run marathon fitness"),
+        ("🥗", "Green salad", "diet health"),
+        ("🔬", "Microscope", "science lab"),
+        ("🧪", "Test tube", "science lab"),
+        ("📋", "Clipboard", "checklist"),
+        ("📊", "Bar chart", "stats"),
+        ("📈", "Chart increasing", "growth progress"),
+    ),
+    "Work & Career": (
+        ("💼", "Briefcase", "work job office"),
+        ("👔", "Necktie", "work office"),
+        ("💻", "Laptop", "computer work"),
+        ("🎓", "Graduation cap", "graduation school degree"),
+        ("✏️", "Pencil", "school write"),
+        ("🖊️", "Pen", "write sign"),
+        ("📝", "Memo", "note write"),
+        ("🏆", "Trophy", "achievement award winner"),
+        ("🥇", "First place medal", "gold achievement winner"),
+        ("🎯", "Bullseye", "goal target"),
+        ("🤝", "Handshake", "deal agreement"),
+        ("📞", "Telephone receiver", "call phone"),
+        ("✉️", "Envelope", "mail letter"),
+        ("📧", "E-mail", "mail"),
+        ("📅", "Calendar", "date event"),
+    ),
+    "Home & Life": (
+        ("🏠", "House", "home move"),
+        ("🔑", "Key", "new home"),
+        ("📦", "Package", "box move"),
+        ("🛋️", "Couch and lamp", "home living room"),
+        ("🚚", "Delivery truck", "moving"),
+        ("👶", "Baby", "birth newborn"),
+        ("🍼", "Baby bottle", "birth newborn"),
+        ("👪", "Family", "parents"),
+        ("💙", "Blue heart", "love"),
+        ("👵", "Old woman", "grandmother grandma"),
+        ("👴", "Old man", "grandfather grandpa"),
+        ("🧓", "Older person", "grandparent"),
+        ("✍️", "Writing hand", "sign contract"),
+        ("💰", "Money bag", "finance savings"),
+        ("🏦", "Bank", "finance mortgage"),
+    ),
+    "Community & Social": (
+        ("🏘️", "Houses", "neighborhood community"),
+        ("🏢", "Office building", "work company"),
+        ("🏫", "School", "education"),
+        ("🏛️", "Classical building", "government museum"),
+    ),
+    "Animals & Pets": (
+        ("🐕", "Dog", "pet puppy"),
+        ("🐱", "Cat face", "pet kitten"),
+        ("🐹", "Hamster", "pet"),
+        ("🐦", "Bird", "pet"),
+        ("🐴", "Horse face", "pony"),
+        ("🐮", "Cow face", "farm"),
+        ("🐷", "Pig face", "farm"),
+        ("🐸", "Frog", ""),
+        ("🐢", "Turtle", "pet tortoise"),
+        ("🦎", "Lizard", "pet reptile"),
+        ("🐍", "Snake", "pet reptile"),
+        ("🐝", "Honeybee", "bee"),
+        ("🐾", "Paw prints", "pet adoption"),
+    ),
+    "Hobbies & Interests": (
+        ("🎨", "Artist palette", "art painting"),
+        ("🖌️", "Paintbrush", "art painting"),
+        ("🖍️", "Crayon", "art drawing"),
+        ("📸", "Camera with flash", "photo photography"),
+        ("🎵", "Musical note", "music song"),
+        ("🎶", "Musical notes", "music song"),
+        ("🎸", "Guitar", "music"),
+        ("🎹", "Musical keyboard", "piano music"),
+        ("🎤", "Microphone", "karaoke singing"),
+        ("🥁", "Drum", "music"),
+        ("🎧", "Headphone", "music"),
+        ("🎼", "Musical score", "music"),
+        ("🎷", "Saxophone", "music jazz"),
+        ("🎺", "Trumpet", "music"),
+        ("🎻", "Violin", "music"),
+        ("🪕", "Banjo", "music"),
+        ("🪗", "Accordion", "music"),
+        ("🪘", "Long drum", "music"),
+        ("🪈", "Flute", "music"),
+        ("🪇", "Maracas", "music"),
+        ("🪄", "Magic wand", "magic"),
+        ("🩰", "Ballet shoes", "dance"),
+        ("🎮", "Video game", "gaming controller"),
+        ("🎲", "Game die", "board game dice"),
+        ("🃏", "Joker", "cards game"),
+        ("🚴", "Person biking", "cycling bike"),
+        ("🏊", "Person swimming", "swim"),
+        ("⚽", "Soccer ball", "football sport"),
+        ("🏀", "Basketball", "sport"),
+        ("🧩", "Puzzle piece", "jigsaw game"),
+        ("🧶", "Yarn", "knitting craft"),
+        ("✂️", "Scissors", "craft cut"),
+        ("🧵", "Thread", "sewing craft"),
+    ),
+    "General & Time": (
+        ("⏰", "Alarm clock", "time reminder"),
+        ("⏳", "Hourglass not done", "time countdown"),
+        ("⌛", "Hourglass done", "time"),
+        ("🎪", "Circus tent", "event show"),
+        ("🎖️", "Military medal", "veterans memorial award"),
+        ("☂️", "Umbrella", "rain"),
+        ("⚡", "High voltage", "lightning energy"),
+    ),
+}
+
+
+class EmojiEntry(NamedTuple):
+    """One emoji of the catalog."""
+
+    emoji: str
+    name: str
+    group: str
+
+    @property
+    def label(self) -> str:
+        """Return the text shown in the emoji picker."""
+        return f"{self.emoji} {self.name}"
+
+
+class EmojiIndex:
+    """Look up catalog emojis by the prefix of any word of their name or keywords."""
+
+    def __init__(self, catalog: dict[str, tuple[tuple[str, str, str], ...]]) -> None:
+        """Index a catalog; emojis listed twice keep their first group."""
+        self.entries: dict[str, EmojiEntry] = {}
+        words: set[tuple[str, int]] = set()
+        for group, emojis in catalog.items():
+            for emoji, name, keywords in emojis:
+                if emoji in self.entries:
+                    continue
+                position = len(self.entries)
+                self.entries[emoji] = EmojiEntry(emoji, name, group)
+                text = f"{name} {keywords} {group}".casefold().replace("&", " ")
+                words.update((word, position) for word in _words(text))
+        self._order = list(self.entries)
+        # Sorted (word, catalog position) pairs: a prefix is a contiguous run
+        self._words = sorted(words)
+
+    def __contains__(self, emoji: object) -> bool:
+        """Return True if the emoji is in the catalog."""
+        return emoji in self.entries
+
+    def _prefix_matches(self, prefix: str) -> set[int]:
+        """Return the positions of the emojis with a word starting with prefix."""
+        matches = set()
+        for i in range(bisect_left(self._words, (prefix, -1)), len(self._words)):
+            word, position = self._words[i]
+            if not word.startswith(prefix):
+                break
+            matches.add(position)
+        return matches
+
+    def search(self, query: str, limit: int | None = None) -> list[str]:
+        """Return the emojis matching every word of a query, in catalog order."""
+        query = query.strip()
+        if query in self.entries:
+            return [query]
+        found: set[int] | None = None
+        for prefix in _words(query.casefold()):
+            matches = self._prefix_matches(prefix)
+            found = matches if found is None else found & matches
+            if not found:
+                return []
+        if found is None:
+            return []
+        return [self._order[position] for position in sorted(found)[:limit]]
+
+
+def _words(text: str) -> list[str]:
+    """Split text into lowercase search words."""
+    return "".join(c if c.isalnum() else " " for c in text).split()
+
+
+@lru_cache(maxsize=1)
+def emoji_index() -> EmojiIndex:
+    """Return the catalog index, built the first time a flow asks for it."""
+    return EmojiIndex(EMOJI_CATALOG)
+
+
+def resolve_emoji(value: str, limit: int = 20) -> tuple[str | None, list[str]]:
+    """Resolve what was typed into the emoji picker.
+
+    Returns (emoji, []) when the value is an emoji - from the catalog or not -
+    or a keyword matching a single catalog emoji, and (None, matches) when
+    it is a keyword matching several or no emojis.
+    """
+    value = value.strip()
+    index = emoji_index()
+    if not value or value in index:
+        return value, []
+    matches = index.search(value, limit)
+    if len(matches) == 1:
+        return matches[0], []
+    if (
+        not matches
+        and len(value) <= 16
+        and not value.isascii()
+        and not any(c.isalpha() or c.isspace() for c in value)
+    ):
+        # An emoji missing from the catalog
+        return value, []
+    return None, matches
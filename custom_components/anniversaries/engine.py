@@ -0,0 +1,283 @@
+"""Bulk evaluation of anniversary snapshots.
+
+When NumPy is available, every date-dependent value is computed for all
+anniversaries at once from columns of ordinals, months, days and flags.
+Without NumPy, each anniversary is evaluated on its own with
+AnniversaryData.snapshot. Both paths produce identical snapshots.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import date
+
+from homeassistant.core import HomeAssistant
+
+from .data import AnniversaryData, AnniversarySnapshot
+from .datemath import MILESTONE_YEARS, named_anniversary
+
+# NumPy is optional and slow to import, so it is loaded by async_load_numpy
+# in the import executor; until then every evaluation takes the Python path
+np = None
+_numpy_loaded = False
+
+# Days before each month, and days in each month, of a common year
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+class AnniversaryColumns:
+    """Anniversaries stored column-wise in NumPy arrays."""
+
+    __slots__ = (
+        "keys",
+        "anniversaries",
+        "ordinal",
+        "year",
+        "month",
+        "day",
+        "is_one_time",
+        "unknown_year",
+        "show_half",
+    )
+
+    def __init__(self, anniversaries: Mapping[str, AnniversaryData]) -> None:
+        """Build the columns from a mapping of key to anniversary."""
+        self.keys = list(anniversaries)
+        self.anniversaries = list(anniversaries.values())
+        count = len(self.anniversaries)
+        dates = [anniversary.date for anniversary in self.anniversaries]
+        self.ordinal = np.fromiter((d.toordinal() for d in dates), np.int64, count)
+        self.year = np.fromiter((d.year for d in dates), np.int64, count)
+        self.month = np.fromiter((d.month for d in dates), np.int64, count)
+        self.day = np.fromiter((d.day for d in dates), np.int64, count)
+        self.is_one_time = np.fromiter(
+            (a.is_one_time for a in self.anniversaries), bool, count
+        )
+        self.unknown_year = np.fromiter(
+            (a.unknown_year for a in self.anniversaries), bool, count
+        )
+        self.show_half = np.fromiter(
+            (a.show_half_anniversary for a in self.anniversaries), bool, count
+        )
+
+    def __len__(self) -> int:
+        """Return the number of anniversaries."""
+        return len(self.keys)
+
+    def snapshots(self, today: date) -> dict[str, AnniversarySnapshot]:
+        """Evaluate the snapshot of every anniversary for the given date."""
+        if not self.keys:
+            return {}
+        today_ordinal = today.toordinal()
+        this_year = np.full(len(self), today.year, np.int64)
+        month, day = self.month, self.day
+        one_time, unknown = self.is_one_time, self.unknown_year
+
+        # Next anniversary, following AnniversaryData._next_anniversary_date
+        this_ordinal, this_day = _observed(this_year, month, day)
+        next_year_ordinal, next_year_day = _observed(this_year + 1, month, day)
+        base_ordinal = np.where(unknown, this_ordinal, self.ordinal)
+        next_ordinal = base_ordinal
+        next_year = np.where(unknown, this_year, self.year)
+        next_day = np.where(unknown, this_day, day)
+        rolled = today_ordinal >= next_ordinal
+        next_ordinal = np.where(rolled, this_ordinal, next_ordinal)
+        next_year = np.where(rolled, this_year, next_year)
+        next_day = np.where(rolled, this_day, next_day)
+        rolled = today_ordinal > next_ordinal
+        next_ordinal = np.where(rolled, next_year_ordinal, next_ordinal)
+        next_year = np.where(rolled, this_year + 1, next_year)
+        next_day = np.where(rolled, next_year_day, next_day)
+        past_event = one_time & (base_ordinal < today_ordinal)
+        next_ordinal = np.where(past_event, base_ordinal, next_ordinal)
+        next_year = np.where(past_event, np.where(unknown, this_year, self.year), next_year)
+        next_day = np.where(past_event, np.where(unknown, this_day, day), next_day)
+
+        # Last anniversary, following AnniversaryData._last_anniversary_date
+        last_year_ordinal, last_year_day = _observed(this_year - 1, month, day)
+        before = today_ordinal < this_ordinal
+        last_ordinal = np.where(before, last_year_ordinal, this_ordinal)
+        last_year = np.where(before, this_year - 1, this_year)
+        last_day = np.where(before, last_year_day, this_day)
+
+        days_remaining = next_ordinal - today_ordinal
+        days_since_last = today_ordinal - np.where(one_time, self.ordinal, last_ordinal)
+
+        today_day = np.full(len(self), today.day, np.int64)
+        today_month = np.full(len(self), today.month, np.int64)
+        current_years = self._years_to(
+            np.full(len(self), today_ordinal, np.int64), this_year, today_month, today_day
+        )
+        next_years = self._years_to(next_ordinal, next_year, month, next_day)
+        years_since_last = np.where(
+            one_time, current_years, self._years_to(last_ordinal, last_year, month, last_day)
+        )
+        is_milestone = ~unknown & (
+            np.isin(next_years, sorted(MILESTONE_YEARS)) | ((next_years > 0) & (next_years % 10 == 0))
+        )
+
+        # Half anniversaries recur on the month/day six months after the date
+        half_carry = month > 6
+        half_month = np.where(half_carry, month - 6, month + 6)
+        half_year = self.year + half_carry
+        half_day = np.minimum(day, _days_in_month(half_year, half_month))
+        half_ordinal = _ordinal(half_year, half_month, half_day)
+        half_this_ordinal, _ = _observed(this_year, half_month, half_day)
+        half_next_ordinal, _ = _observed(this_year + 1, half_month, half_day)
+        half_ordinal = np.where(today_ordinal >= half_ordinal, half_this_ordinal, half_ordinal)
+        half_ordinal = np.where(today_ordinal > half_ordinal, half_next_ordinal, half_ordinal)
+
+        from_ordinal = date.fromordinal
+        snapshots = {}
+        for (
+            key,
+            anniversary,
+            unknown_year,
+            show_half,
+            next_value,
+            last_value,
+            remaining,
+            since_last,
+            current,
+            upcoming,
+            since,
+            milestone,
+            half_value,
+        ) in zip(
+            self.keys,
+            self.anniversaries,
+            unknown.tolist(),
+            self.show_half.tolist(),
+            next_ordinal.tolist(),
+            last_ordinal.tolist(),
+            days_remaining.tolist(),
+            days_since_last.tolist(),
+            current_years.tolist(),
+            next_years.tolist(),
+            years_since_last.tolist(),
+            is_milestone.tolist(),
+            half_ordinal.tolist(),
+        ):
+            if unknown_year:
+                current = upcoming = since = None
+            half_date = from_ordinal(half_value) if show_half else None
+            snapshots[key] = AnniversarySnapshot(
+                anniversary=anniversary,
+                reference_date=today,
+                next_anniversary_date=from_ordinal(next_value),
+                last_anniversary_date=from_ordinal(last_value),
+                days_remaining=remaining,
+                weeks_remaining=remaining // 7,
+                current_years=current,
+                next_years=upcoming,
+                years_since_last=since,
+                days_since_last=since_last,
+                is_milestone=milestone,
+                named_anniversary=named_anniversary(upcoming),
+                half_anniversary_date=half_date,
+                days_until_half_anniversary=(
+                    half_value - today_ordinal if show_half else None
+                ),
+            )
+        return snapshots
+
+    def _years_to(self, ordinal, year, month, day):
+        """Return years_between(target, anniversary date) for each entry."""
+        return _relative_years(ordinal, year, month, day, self.ordinal, self.year, self.month, self.day)
+
+
+def _load_numpy() -> bool:
+    """Import NumPy on first use; return True if it is available."""
+    global np, _numpy_loaded
+    if not _numpy_loaded:
+        _numpy_loaded = True
+        try:
+            import numpy
+        except ImportError:
+            pass
+        else:
+            np = numpy
+    return np is not None
+
+
+async def async_load_numpy(hass: HomeAssistant) -> bool:
+    """Import NumPy in the import executor; return True if it is available."""
+    if _numpy_loaded:
+        return np is not None
+    return await hass.async_add_import_executor_job(_load_numpy)
+
+
+def build_columns(
+    anniversaries: Mapping[str, AnniversaryData],
+) -> AnniversaryColumns | None:
+    """Return the columns for the anniversaries, or None without NumPy.
+
+    Never imports NumPy itself, so it is safe to call on the event loop.
+    """
+    if np is None:
+        return None
+    return AnniversaryColumns(anniversaries)
+
+
+def evaluate_snapshots(
+    anniversaries: Mapping[str, AnniversaryData],
+    today: date,
+    columns: AnniversaryColumns | None = None,
+) -> dict[str, AnniversarySnapshot]:
+    """Evaluate the snapshot of every anniversary for the given date.
+
+    Uses the vectorized columns once NumPy is loaded (building them if not
+    given) and falls back to evaluating each anniversary otherwise.
+    """
+    if columns is None:
+        columns = build_columns(anniversaries)
+    if columns is None:
+        return {
+            key: anniversary.snapshot(today)
+            for key, anniversary in anniversaries.items()
+        }
+    return columns.snapshots(today)
+
+
+def _is_leap(year):
+    """Return a leap-year mask for an array of years."""
+    return (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+
+
+def _days_in_month(year, month):
+    """Return the number of days in each year/month."""
+    return np.take(_DAYS_IN_MONTH, month - 1) + ((month == 2) & _is_leap(year))
+
+
+def _ordinal(year, month, day):
+    """Return proleptic Gregorian ordinals, as date.toordinal does."""
+    previous = year - 1
+    return (
+        previous * 365
+        + previous // 4
+        - previous // 100
+        + previous // 400
+        + np.take(_DAYS_BEFORE_MONTH, month - 1)
+        + ((month > 2) & _is_leap(year))
+        + day
+    )
+
+
+def _observed(year, month, day):
+    """Return (ordinal, day) of each month/day in a year (Feb 29 -> Feb 28)."""
+    day = np.where((month == 2) & (day == 29) & ~_is_leap(year), 28, day)
+    return _ordinal(year, month, day), day
+
+
+def _relative_years(ordinal1, year1, month1, day1, ordinal2, year2, month2, day2):
+    """Return datemath.years_between(date1, date2) for arrays of dates.
+
+    date2's day is clamped to its month in date1's year, so February 29th
+    counts a full year on February 28th of a common year.
+    """
+    _, clamped = _observed(year1, month2, day2)
+    month_day1 = month1 * 32 + day1
+    month_day2 = month2 * 32 + clamped
+    forward = (year1 - year2) - (month_day1 < month_day2)
+    backward = (year1 - year2) + (month_day1 > month_day2)
+    return np.where(ordinal1 >= ordinal2, forward, backward)
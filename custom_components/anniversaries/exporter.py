@@ -0,0 +1,209 @@
+"""Export every anniversary with its derived values to a file."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import date
+import json
+import logging
+import os
+from pathlib import Path
+from typing import IO, Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_CATEGORY,
+    CONF_DATE,
+    CONF_EMOJI,
+    CONF_HALF_ANNIVERSARY,
+    CONF_NAME,
+    CONF_ONE_TIME,
+    DOMAIN,
+)
+from .data import AnniversarySnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# Columns of an exported row. The leading configuration columns use the
+# import_file names, so a CSV or JSON Lines export can be imported again.
+EXPORT_FIELDS = (
+    CONF_NAME,
+    CONF_DATE,
+    CONF_CATEGORY,
+    CONF_EMOJI,
+    CONF_ONE_TIME,
+    CONF_HALF_ANNIVERSARY,
+    "entry_id",
+    "reference_date",
+    "next_date",
+    "days_remaining",
+    "weeks_remaining",
+    "current_years",
+    "years_at_anniversary",
+    "last_anniversary_date",
+    "days_since_last",
+    "years_since_last",
+    "is_milestone",
+    "named_anniversary",
+    "half_anniversary_date",
+    "days_until_half_anniversary",
+)
+
+
+def export_row(entry_id: str, snap: AnniversarySnapshot) -> dict[str, Any]:
+    """Return the export row for one anniversary snapshot."""
+    ann = snap.anniversary
+    return {
+        CONF_NAME: ann.name,
+        CONF_DATE: ann.date.strftime("%m-%d" if ann.unknown_year else "%Y-%m-%d"),
+        CONF_CATEGORY: ann.category,
+        CONF_EMOJI: ann.emoji,
+        CONF_ONE_TIME: ann.is_one_time,
+        CONF_HALF_ANNIVERSARY: ann.show_half_anniversary,
+        "entry_id": entry_id,
+        "reference_date": snap.reference_date,
+        "next_date": snap.next_anniversary_date,
+        "days_remaining": snap.days_remaining,
+        "weeks_remaining": snap.weeks_remaining,
+        "current_years": snap.current_years,
+        "years_at_anniversary": snap.next_years,
+        "last_anniversary_date": snap.last_anniversary_date,
+        "days_since_last": snap.days_since_last,
+        "years_since_last": snap.years_since_last,
+        "is_milestone": snap.is_milestone,
+        "named_anniversary": snap.named_anniversary,
+        "half_anniversary_date": snap.half_anniversary_date,
+        "days_until_half_anniversary": snap.days_until_half_anniversary,
+    }
+
+
+def _json_default(value: Any) -> str:
+    """Serialize dates for JSON."""
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def write_json(handle: IO[str], rows: Iterable[dict[str, Any]]) -> None:
+    """Write rows as a JSON array, one row at a time."""
+    handle.write("[")
+    separator = "\n"
+    for row in rows:
+        handle.write(separator)
+        handle.write(json.dumps(row, default=_json_default, ensure_ascii=False))
+        separator = ",\n"
+    handle.write("\n]\n")
+
+
+def write_json_lines(handle: IO[str], rows: Iterable[dict[str, Any]]) -> None:
+    """Write rows as JSON Lines."""
+    for row in rows:
+        handle.write(json.dumps(row, default=_json_default, ensure_ascii=False))
+        handle.write("\n")
+
+
+def write_csv(handle: IO[str], rows: Iterable[dict[str, Any]]) -> None:
+    """Write rows as CSV with a header line."""
+    writer = csv.DictWriter(handle, EXPORT_FIELDS)
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(
+            {key: "" if value is None else value for key, value in row.items()}
+        )
+
+
+def _ics_text(value: str) -> str:
+    """Escape a value for an iCalendar TEXT property."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def _ics_event(row: dict[str, Any]) -> Iterator[str]:
+    """Yield the content lines of one anniversary's next occurrence."""
+    next_date: date = row["next_date"]
+    yield "BEGIN:VEVENT"
+    yield f"UID:{row['entry_id']}@{DOMAIN}"
+    yield f"DTSTAMP:{row['reference_date']:%Y%m%d}T000000Z"
+    yield f"DTSTART;VALUE=DATE:{next_date:%Y%m%d}"
+    yield f"DTEND;VALUE=DATE:{date.fromordinal(next_date.toordinal() + 1):%Y%m%d}"
+    yield f"SUMMARY:{_ics_text(row[CONF_NAME])}"
+    if not row[CONF_ONE_TIME]:
+        yield "RRULE:FREQ=YEARLY"
+    yield f"CATEGORIES:{row[CONF_CATEGORY].upper()}"
+    if (years := row["years_at_anniversary"]) is not None:
+        yield f"DESCRIPTION:{_ics_text(row[CONF_NAME])} - {years} years"
+    yield "END:VEVENT"
+
+
+def write_icalendar(handle: IO[str], rows: Iterable[dict[str, Any]]) -> None:
+    """Write the next occurrence of every row as an iCalendar file."""
+    handle.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//{DOMAIN}//export//EN\r\n")
+    for row in rows:
+        for line in _ics_event(row):
+            handle.write(line)
+            handle.write("\r\n")
+    handle.write("END:VCALENDAR\r\n")
+
+
+_WRITERS = {
+    ".json": write_json,
+    ".jsonl": write_json_lines,
+    ".csv": write_csv,
+    ".ics": write_icalendar,
+}
+
+
+def write_export(path: Path, snapshots: list[tuple[str, AnniversarySnapshot]]) -> None:
+    """Stream the rows to a temporary file and move it into place (runs in the executor)."""
+    writer = _WRITERS[path.suffix.lower()]
+    temporary = path.with_name(f".{path.name}.tmp")
+    try:
+        with temporary.open("w", encoding="utf-8", newline="") as handle:
+            writer(handle, (export_row(entry_id, snap) for entry_id, snap in snapshots))
+        os.replace(temporary, path)
+    finally:
+        temporary.unlink(missing_ok=True)
+
+
+async def async_export(
+    hass: HomeAssistant, file_path: str, reference_date: date | None = None
+) -> dict[str, Any]:
+    """Export every anniversary and its derived values for a reference date.
+
+    Snapshots come from the coordinator's cache when the reference date is
+    today, or from a single bulk evaluation otherwise; the file itself is
+    written in the executor.
+    """
+    path = Path(file_path)
+    if not hass.config.is_allowed_path(str(path)):
+        raise ServiceValidationError(f"Access to {file_path} is not allowed")
+    if path.suffix.lower() not in _WRITERS:
+        raise ServiceValidationError(
+            f"Unsupported file type '{path.suffix}', expected one of {', '.join(_WRITERS)}"
+        )
+
+    snapshots: list[tuple[str, AnniversarySnapshot]] = []
+    if coordinator := hass.data.get(DOMAIN, {}).get("coordinator"):
+        snapshots = list(coordinator.snapshots_for(reference_date).items())
+    if reference_date is None:
+        reference_date = snapshots[0][1].reference_date if snapshots else dt_util.now().date()
+    snapshots.sort(key=lambda item: (item[1].days_remaining, item[1].anniversary.name))
+
+    try:
+        await hass.async_add_executor_job(write_export, path, snapshots)
+    except OSError as err:
+        raise ServiceValidationError(f"Cannot write {file_path}: {err}") from err
+
+    _LOGGER.info("Exported %s anniversaries to %s", len(snapshots), file_path)
+    return {
+        "file_path": str(path),
+        "reference_date": reference_date.isoformat(),
+        "count": len(snapshots),
+    }
@@ -0,0 +1,348 @@
+"""Bulk import of anniversaries from CSV, JSON Lines and iCalendar files."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Iterator
+import csv
+from functools import partial
+from itertools import islice
+import json
+import logging
+from pathlib import Path
+import sys
+from typing import IO, Any
+
+from homeassistant.components import persistent_notification
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ServiceValidationError
+
+from .config_flow import is_not_date
+from .const import (
+    CATEGORY_OPTIONS,
+    CONF_CATEGORY,
+    CONF_DATE,
+    CONF_EMOJI,
+    CONF_HALF_ANNIVERSARY,
+    CONF_MEMBER_ID,
+    CONF_MEMBERS,
+    CONF_NAME,
+    CONF_ONE_TIME,
+    CONTEXT_BULK_IMPORT,
+    DEFAULT_CATEGORY,
+    DOMAIN,
+)
+from .roster import is_roster, new_member_id, roster_members
+
+_LOGGER = logging.getLogger(__name__)
+
+IMPORT_BATCH_SIZE = 100
+IMPORT_NOTIFICATION_ID = f"{DOMAIN}_import"
+MAX_REPORTED_ERRORS = 50
+
+_TRUE_VALUES = {"1", "true", "yes", "y", "on"}
+
+# A raw row: (line number, field mapping) or (line number, error message)
+RawRow = tuple[int, dict[str, Any] | str]
+
+
+def iter_csv(handle: IO[str]) -> Iterator[RawRow]:
+    """Yield the rows of a CSV file with a header line."""
+    reader = csv.DictReader(handle)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_json_lines(handle: IO[str]) -> Iterator[RawRow]:
+    """Yield the objects of a JSON Lines file."""
+    for line_number, line in enumerate(handle, 1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as err:
+            yield line_number, f"invalid JSON: {err}"
+            continue
+        if not isinstance(row, dict):
+            yield line_number, "expected a JSON object"
+            continue
+        yield line_number, row
+
+
+def _unfolded_lines(handle: IO[str]) -> Iterator[tuple[int, str]]:
+    """Yield iCalendar content lines with folded continuations joined."""
+    pending: str | None = None
+    pending_number = 0
+    for line_number, line in enumerate(handle, 1):
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and pending is not None:
+            pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending_number, pending
+        pending, pending_number = line, line_number
+    if pending is not None:
+        yield pending_number, pending
+
+
+def iter_icalendar(handle: IO[str]) -> Iterator[RawRow]:
+    """Yield one row per VEVENT of an iCalendar file.
+
+    Events with a yearly RRULE are imported as recurring anniversaries,
+    everything else as one-time events.
+    """
+    event: dict[str, str] | None = None
+    start_line = 0
+    for line_number, line in _unfolded_lines(handle):
+        name, _, value = line.partition(":")
+        name = name.split(";", 1)[0].upper()
+        if name == "BEGIN" and value.upper() == "VEVENT":
+            event, start_line = {}, line_number
+        elif event is None:
+            continue
+        elif name == "END" and value.upper() == "VEVENT":
+            yield start_line, _event_row(event)
+            event = None
+        elif name in ("SUMMARY", "DTSTART", "RRULE", "CATEGORIES"):
+            event.setdefault(name, value)
+
+
+def _event_row(event: dict[str, str]) -> dict[str, Any] | str:
+    """Convert the properties of a VEVENT to an import row."""
+    start = event.get("DTSTART", "")[:8]
+    if len(start) != 8 or not start.isdigit():
+        return "missing or invalid DTSTART"
+    row: dict[str, Any] = {
+        CONF_NAME: event.get("SUMMARY", "").replace("\\,", ",").replace("\\;", ";"),
+        CONF_DATE: f"{start[:4]}-{start[4:6]}-{start[6:]}",
+        CONF_ONE_TIME: "FREQ=YEARLY" not in event.get("RRULE", "").upper(),
+    }
+    if categories := event.get("CATEGORIES"):
+        row[CONF_CATEGORY] = categories.split(",", 1)[0].strip().lower()
+    return row
+
+
+_READERS = {
+    ".csv": iter_csv,
+    ".jsonl": iter_json_lines,
+    ".ndjson": iter_json_lines,
+    ".ics": iter_icalendar,
+}
+
+
+def _as_bool(value: Any) -> bool:
+    """Return a boolean from a CSV, JSON or iCalendar value."""
+    if isinstance(value, str):
+        return value.strip().lower() in _TRUE_VALUES
+    return bool(value)
+
+
+def validate_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Return the config entry data for a row, or raise ValueError."""
+    name = str(row.get(CONF_NAME) or "").strip()
+    if not name:
+        raise ValueError("missing name")
+    if name.lower().startswith("anniversary_"):
+        raise ValueError("name must not start with 'anniversary_'")
+    anniversary_date = str(row.get(CONF_DATE) or "").strip()
+    one_time = _as_bool(row.get(CONF_ONE_TIME, False))
+    if is_not_date(anniversary_date, one_time):
+        raise ValueError(f"invalid date '{anniversary_date}'")
+
+    category = str(row.get(CONF_CATEGORY) or DEFAULT_CATEGORY).strip().lower()
+    if category not in CATEGORY_OPTIONS:
+        raise ValueError(f"unknown category '{category}'")
+
+    data = {
+        CONF_NAME: name,
+        CONF_DATE: anniversary_date,
+        CONF_CATEGORY: category,
+        CONF_ONE_TIME: one_time,
+        CONF_HALF_ANNIVERSARY: _as_bool(row.get(CONF_HALF_ANNIVERSARY, False)),
+    }
+    if emoji := str(row.get(CONF_EMOJI) or "").strip():
+        data[CONF_EMOJI] = emoji
+    return data
+
+
+def read_batch(
+    rows: Iterator[RawRow], size: int
+) -> tuple[list[dict[str, Any]], list[str], bool]:
+    """Read and validate the next batch of rows (runs in the executor).
+
+    Returns (valid entry data, error messages, exhausted).
+    """
+    valid: list[dict[str, Any]] = []
+    errors: list[str] = []
+    count = 0
+    for line_number, row in islice(rows, size):
+        count += 1
+        if isinstance(row, str):
+            errors.append(f"line {line_number}: {row}")
+            continue
+        try:
+            valid.append(validate_row(row))
+        except ValueError as err:
+            errors.append(f"line {line_number}: {err}")
+    return valid, errors, count < size
+
+
+def _open_rows(path: Path) -> tuple[IO[str], Iterator[RawRow]]:
+    """Open a file and return it with its row iterator (runs in the executor)."""
+    handle = path.open(encoding="utf-8-sig", newline="")
+    return handle, _READERS[path.suffix.lower()](handle)
+
+
+def read_file(path: Path) -> tuple[list[dict[str, Any]], list[str]]:
+    """Read and validate every row of a file (runs in the executor)."""
+    handle, rows = _open_rows(path)
+    with handle:
+        valid, errors, _ = read_batch(rows, sys.maxsize)
+    return valid, errors
+
+
+def _check_path(hass: HomeAssistant, file_path: str) -> Path:
+    """Return the path of an importable file, or raise ServiceValidationError."""
+    path = Path(file_path)
+    if not hass.config.is_allowed_path(str(path)):
+        raise ServiceValidationError(f"Access to {file_path} is not allowed")
+    if path.suffix.lower() not in _READERS:
+        raise ServiceValidationError(
+            f"Unsupported file type '{path.suffix}', expected one of {', '.join(_READERS)}"
+        )
+    return path
+
+
+async def async_read_file(
+    hass: HomeAssistant, file_path: str
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Return the valid rows and the error messages of an import file."""
+    path = _check_path(hass, file_path)
+    try:
+        return await hass.async_add_executor_job(read_file, path)
+    except OSError as err:
+        raise ServiceValidationError(f"Cannot read {file_path}: {err}") from err
+
+
+def add_members(
+    members: list[dict[str, Any]], rows: Iterable[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], int]:
+    """Return the roster members with the new rows appended, and the rows skipped.
+
+    Like the import flow, a row whose name and date are already in the
+    roster is skipped, so importing a file twice is a no-op.
+    """
+    members = list(members)
+    seen = {(member[CONF_NAME], member.get(CONF_DATE)) for member in members}
+    skipped = 0
+    for row in rows:
+        if (row[CONF_NAME], row[CONF_DATE]) in seen:
+            skipped += 1
+            continue
+        seen.add((row[CONF_NAME], row[CONF_DATE]))
+        members.append({CONF_MEMBER_ID: new_member_id(), **row})
+    return members, skipped
+
+
+async def async_import_file(
+    hass: HomeAssistant, file_path: str, roster: str | None = None
+) -> dict[str, Any]:
+    """Create an anniversary for every valid row of a file.
+
+    Rows become config entries of their own, or members of the roster
+    config entry given by its entry id. The file is read and validated
+    in the executor, one batch at a time, so even large files never
+    block the event loop. Progress is reported in a persistent
+    notification and the coordinator is refreshed once at the end.
+    """
+    path = _check_path(hass, file_path)
+    if roster is not None:
+        return await _async_import_roster(hass, path, roster)
+    try:
+        handle, rows = await hass.async_add_executor_job(_open_rows, path)
+    except OSError as err:
+        raise ServiceValidationError(f"Cannot read {file_path}: {err}") from err
+
+    created = skipped = processed = 0
+    errors: list[str] = []
+    try:
+        exhausted = False
+        while not exhausted:
+            valid, batch_errors, exhausted = await hass.async_add_executor_job(
+                read_batch, rows, IMPORT_BATCH_SIZE
+            )
+            errors.extend(batch_errors)
+            results = await _async_create_entries(hass, valid)
+            created += sum(results)
+            skipped += len(results) - sum(results)
+            processed += len(valid) + len(batch_errors)
+            persistent_notification.async_create(
+                hass,
+                f"Importing {path.name}: {processed} rows read, {created} anniversaries created.",
+                title="Anniversaries import",
+                notification_id=IMPORT_NOTIFICATION_ID,
+            )
+    finally:
+        await hass.async_add_executor_job(handle.close)
+
+    if coordinator := hass.data.get(DOMAIN, {}).get("coordinator"):
+        await coordinator.async_refresh()
+
+    _LOGGER.info("Imported %s anniversaries from %s", created, file_path)
+    return _async_report(hass, path, created, skipped, errors)
+
+
+async def _async_import_roster(
+    hass: HomeAssistant, path: Path, roster: str
+) -> dict[str, Any]:
+    """Append the valid rows of a file to a roster config entry.
+
+    The roster is updated once, so its entities are reloaded once however
+    many rows the file has.
+    """
+    entry = hass.config_entries.async_get_entry(roster)
+    if entry is None or entry.domain != DOMAIN or not is_roster(entry):
+        raise ServiceValidationError(f"{roster} is not an anniversaries roster")
+    valid, errors = await async_read_file(hass, str(path))
+    members, skipped = add_members(roster_members(entry), valid)
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_MEMBERS: members}
+    )
+    created = len(valid) - skipped
+    _LOGGER.info("Imported %s anniversaries from %s into %s", created, path, entry.title)
+    return _async_report(hass, path, created, skipped, errors)
+
+
+@callback
+def _async_report(
+    hass: HomeAssistant, path: Path, created: int, skipped: int, errors: list[str]
+) -> dict[str, Any]:
+    """Notify the outcome of an import and return its summary."""
+    message = (
+        f"Imported {created} anniversaries from {path.name}. "
+        f"{skipped} already existed and {len(errors)} rows were invalid."
+    )
+    if errors:
+        message += "\n\n" + "\n".join(f"- {error}" for error in errors[:10])
+    persistent_notification.async_create(
+        hass, message, title="Anniversaries import", notification_id=IMPORT_NOTIFICATION_ID
+    )
+    return {
+        "created": created,
+        "skipped": skipped,
+        "invalid": len(errors),
+        "errors": errors[:MAX_REPORTED_ERRORS],
+    }
+
+
+async def _async_create_entries(
+    hass: HomeAssistant, rows: Iterable[dict[str, Any]]
+) -> list[bool]:
+    """Run one import flow per row; return whether each created an entry."""
+    init = partial(
+        hass.config_entries.flow.async_init,
+        DOMAIN,
+        context={"source": SOURCE_IMPORT, CONTEXT_BULK_IMPORT: True},
+    )
+    results = await asyncio.gather(*(init(data=row) for row in rows))
+    return [result.get("type") == "create_entry" for result in results]
@@ -0,0 +1,201 @@
+"""Day-of-year index of anniversaries."""
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from calendar import isleap
+from collections.abc import Hashable, Iterator
+from datetime import date, timedelta
+import heapq
+from itertools import islice
+
+from .datemath import observed_date
+
+# Slots are numbered on a leap-year calendar so every month/day, including
+# February 29th, has its own bucket.
+SLOT_COUNT = 366
+FEB_28_SLOT = 58
+FEB_29_SLOT = 59
+
+_MONTH_OFFSETS = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+
+def day_slot(month: int, day: int) -> int:
+    """Return the leap-year day-of-year slot (0-365) for a month and day."""
+    return _MONTH_OFFSETS[month - 1] + day - 1
+
+
+# (month, day) for every slot, taken from a leap year.
+_SLOT_MONTH_DAY = tuple(
+    ((d := date.fromordinal(date(2000, 1, 1).toordinal() + slot)).month, d.day)
+    for slot in range(SLOT_COUNT)
+)
+
+
+def slot_date(slot: int, year: int) -> date:
+    """Return the date a slot is observed on in the given year."""
+    return observed_date(year, *_SLOT_MONTH_DAY[slot])
+
+
+def next_slot_date(slot: int, today: date) -> date:
+    """Return the first date on or after today that a slot is observed on."""
+    occurrence = slot_date(slot, today.year)
+    if occurrence < today:
+        occurrence = slot_date(slot, today.year + 1)
+    return occurrence
+
+
+class DayIndex:
+    """Buckets of keys by month/day, answering "what happens on date X".
+
+    February 29th entries are observed on February 28th in common years.
+    """
+
+    __slots__ = ("_slots", "_positions")
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._slots: list[set[Hashable]] = [set() for _ in range(SLOT_COUNT)]
+        self._positions: dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed keys."""
+        return len(self._positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return True if the key is indexed."""
+        return key in self._positions
+
+    def add(self, key: Hashable, month: int, day: int) -> None:
+        """Index a key under a month/day, moving it if already present."""
+        slot = day_slot(month, day)
+        previous = self._positions.get(key)
+        if previous == slot:
+            return
+        if previous is not None:
+            self._slots[previous].discard(key)
+        self._slots[slot].add(key)
+        self._positions[key] = slot
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a key from the index if present."""
+        slot = self._positions.pop(key, None)
+        if slot is not None:
+            self._slots[slot].discard(key)
+
+    def on(self, day: date) -> set[Hashable]:
+        """Return the keys observed on the given date."""
+        slot = day_slot(day.month, day.day)
+        if slot == FEB_28_SLOT and not isleap(day.year):
+            return self._slots[FEB_28_SLOT] | self._slots[FEB_29_SLOT]
+        return set(self._slots[slot])
+
+    def between(self, start: date, end: date) -> Iterator[tuple[date, set[Hashable]]]:
+        """Yield (date, keys) for every date in [start, end] that has keys."""
+        day = start
+        one_day = timedelta(days=1)
+        while day <= end:
+            keys = self.on(day)
+            if keys:
+                yield day, keys
+            day += one_day
+
+
+class UpcomingRing:
+    """Keys ordered by next occurrence, read by rotating from today's slot.
+
+    Recurring keys live in a sorted array of (slot, key); reading the next K
+    starts at today's slot and wraps around the year. Keys with a fixed
+    calendar date (one-time events, and recurring ones first occurring more
+    than a year ahead) live in a second array of (ordinal, key) read from
+    today's ordinal. Both arrays are maintained with bisect, so add/remove
+    locate their position in O(log n) and reading the top K is O(K log n).
+    """
+
+    __slots__ = ("_recurring", "_dated", "_entries")
+
+    def __init__(self) -> None:
+        """Initialize an empty ring."""
+        self._recurring: list[tuple[int, Hashable]] = []
+        self._dated: list[tuple[int, Hashable]] = []
+        # key -> (recurring item or None, dated item or None, first year)
+        self._entries: dict[Hashable, tuple] = {}
+
+    def __len__(self) -> int:
+        """Return the number of keys in the ring."""
+        return len(self._entries)
+
+    def add(
+        self,
+        key: Hashable,
+        first: date,
+        *,
+        recurring: bool = True,
+        unknown_year: bool = False,
+    ) -> None:
+        """Add or move a key whose (first) occurrence is the given date."""
+        self.discard(key)
+        recurring_item = dated_item = None
+        if recurring:
+            recurring_item = (day_slot(first.month, first.day), key)
+            insort(self._recurring, recurring_item)
+        if not unknown_year:
+            dated_item = (first.toordinal(), key)
+            insort(self._dated, dated_item)
+        first_year = None if unknown_year else first.year
+        self._entries[key] = (recurring_item, dated_item, first_year)
+
+    def discard(self, key: Hashable) -> None:
+        """Remove a key from the ring if present."""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        recurring_item, dated_item, _ = entry
+        if recurring_item is not None:
+            del self._recurring[bisect_left(self._recurring, recurring_item)]
+        if dated_item is not None:
+            del self._dated[bisect_left(self._dated, dated_item)]
+
+    def upcoming(self, today: date, count: int) -> list[tuple[int, Hashable]]:
+        """Return up to count (days until, key) pairs from today, soonest first."""
+        if count <= 0:
+            return []
+        return list(
+            islice(
+                heapq.merge(
+                    self._iter_recurring(today),
+                    self._iter_dated(today),
+                    key=lambda item: item[0],
+                ),
+                count,
+            )
+        )
+
+    def _iter_recurring(self, today: date) -> Iterator[tuple[int, Hashable]]:
+        """Yield recurring keys from today's slot around the year."""
+        items = self._recurring
+        size = len(items)
+        start = bisect_left(items, (day_slot(today.month, today.day),))
+        today_ordinal = today.toordinal()
+        for position in range(start, start + size):
+            slot, key = items[position % size]
+            occurrence = next_slot_date(slot, today)
+            first_year = self._entries[key][2]
+            if first_year is not None and occurrence.year < first_year:
+                # Not started yet; served from the dated array instead.
+                continue
+            yield occurrence.toordinal() - today_ordinal, key
+
+    def _iter_dated(self, today: date) -> Iterator[tuple[int, Hashable]]:
+        """Yield fixed-date keys from today onwards."""
+        items = self._dated
+        today_ordinal = today.toordinal()
+        for position in range(bisect_left(items, (today_ordinal,)), len(items)):
+            ordinal, key = items[position]
+            recurring_item, _, first_year = self._entries[key]
+            if (
+                recurring_item is not None
+                and next_slot_date(recurring_item[0], today).year >= first_year
+            ):
+                # Recurring key the ring already yields.
+                continue
+            yield ordinal - today_ordinal, key
@@ -0,0 +1,91 @@
+"""Anniversaries held by a config entry: one for a plain entry, many for a roster."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+import uuid
+
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    CONF_CATEGORY_CALENDARS,
+    CONF_COMBINED_CALENDAR,
+    CONF_ENTRY_CALENDAR,
+    CONF_MEMBER_ID,
+    CONF_MEMBERS,
+    CONF_ROSTER,
+    CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+)
+
+# Options of a plain entry that decide which entities it creates
+ENTITY_OPTIONS = (
+    CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+    CONF_ENTRY_CALENDAR,
+    CONF_COMBINED_CALENDAR,
+    CONF_CATEGORY_CALENDARS,
+)
+
+
+def is_roster(entry: ConfigEntry) -> bool:
+    """Return True if the entry is a roster of anniversaries."""
+    return bool(entry.data.get(CONF_ROSTER))
+
+
+def roster_members(entry: ConfigEntry) -> list[dict[str, Any]]:
+    """Return the member configurations of a roster entry."""
+    return list(entry.options.get(CONF_MEMBERS, entry.data.get(CONF_MEMBERS, [])))
+
+
+def roster_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the options of a roster entry other than its members."""
+    return {key: value for key, value in entry.options.items() if key != CONF_MEMBERS}
+
+
+def entity_settings(entry: ConfigEntry) -> dict[str, Any]:
+    """Return the options an entry's entities were created with.
+
+    A change to any of them needs the entry reloaded; for a roster these
+    are all of its options other than the members.
+    """
+    if is_roster(entry):
+        return roster_settings(entry)
+    return {key: entry.options[key] for key in ENTITY_OPTIONS if key in entry.options}
+
+
+def member_key(entry_id: str, member_id: str) -> str:
+    """Return the coordinator key of a roster member."""
+    return f"{entry_id}_{member_id}"
+
+
+def loaded_keys(entry: ConfigEntry, keys: Iterable[str]) -> set[str]:
+    """Return which of the given coordinator keys belong to the entry.
+
+    Unlike entry_configs, this also finds roster members that have been
+    removed from the entry's options since they were loaded.
+    """
+    if not is_roster(entry):
+        return {entry.entry_id} & set(keys)
+    prefix = f"{entry.entry_id}_"
+    return {key for key in keys if key.startswith(prefix)}
+
+
+def new_member_id() -> str:
+    """Return a new, stable roster member id."""
+    return uuid.uuid4().hex[:12]
+
+
+def entry_configs(entry: ConfigEntry) -> dict[str, dict[str, Any]]:
+    """Return {coordinator key: anniversary config} for a config entry.
+
+    A plain entry holds one anniversary keyed by its entry_id, configured by
+    its data merged with its options. A roster holds one per member.
+    """
+    if is_roster(entry):
+        return {
+            member_key(entry.entry_id, member[CONF_MEMBER_ID]): member
+            for member in roster_members(entry)
+        }
+    config = {**entry.data}
+    if entry.options:
+        config.update(entry.options)
+    return {entry.entry_id: config}
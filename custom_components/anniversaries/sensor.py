@@ -1,9 +1,11 @@
 """Sensor platform for Anniversaries."""
 from __future__ import annotations
 
+import logging
+
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import entity_registry as er
@@ -14,6 +16,7 @@ from .const import (
     ATTR_YEARS_NEXT,
     ATTR_YEARS_CURRENT,
     ATTR_DATE,
+    CONF_DATE,
     ATTR_NEXT_DATE,
     ATTR_WEEKS,
     ATTR_HALF_DATE,
@@ -28,6 +31,7 @@ from .const import (
     ATTR_DAYS_SINCE_LAST,
     ATTR_LAST_ANNIVERSARY_DATE,
     ATTR_YEARS_SINCE_LAST,
+    ATTR_CUSTOM_EMOJI,
     DOMAIN,
     DEFAULT_ICON_NORMAL,
     DEFAULT_ICON_TODAY,
@@ -37,12 +41,24 @@ from .const import (
     CONF_ICON_NORMAL,
     CONF_ICON_TODAY,
     CONF_ICON_SOON,
+    CONF_MEMBER_ENTITIES,
+    CONF_MEMBER_ID,
     CONF_SOON,
     CONF_UNIT_OF_MEASUREMENT,
     CONF_UPCOMING_ANNIVERSARIES_SENSOR,
+    CONF_UPCOMING_COUNT,
+    DEFAULT_UPCOMING_COUNT,
+    STATIC_ATTRIBUTES,
+    CATEGORY_ICONS,
+    CATEGORY_OPTIONS,
+    DEFAULT_MEMBER_ENTITIES,
 )
 from .coordinator import AnniversaryDataUpdateCoordinator
-from .data import AnniversaryData
+from .data import AnniversaryData, AnniversarySnapshot
+from .date_template import has_date_template
+from .roster import entry_configs, is_roster
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -53,9 +69,30 @@ async def async_setup_entry(
     """Set up the sensor entities for a config entry."""
     coordinator: AnniversaryDataUpdateCoordinator = hass.data[DOMAIN]["coordinator"]
 
-    async_add_entities([AnniversarySensor(coordinator, entry.entry_id, entry)])
+    # A roster's members are all added in one call
+    if not is_roster(entry):
+        async_add_entities([AnniversarySensor(coordinator, entry.entry_id, entry)])
+    elif entry.options.get(CONF_MEMBER_ENTITIES, DEFAULT_MEMBER_ENTITIES):
+        async_add_entities(
+            AnniversarySensor(coordinator, key, entry, config)
+            for key, config in entry_configs(entry).items()
+        )
+    else:
+        # Without per-anniversary entities, per-category counts summarize the
+        # roster; the anniversaries themselves are served by the WebSocket API.
+        lock = hass.data[DOMAIN]["coordinator_lock"]
+        async with lock:
+            if "category_sensors_added" not in hass.data[DOMAIN]:
+                async_add_entities(
+                    AnniversaryCategorySensor(coordinator, category)
+                    for category in CATEGORY_OPTIONS
+                )
+                hass.data[DOMAIN]["category_sensors_added"] = True
 
     if entry.options.get(CONF_UPCOMING_ANNIVERSARIES_SENSOR, False):
+        coordinator.async_set_upcoming_count(
+            entry.options.get(CONF_UPCOMING_COUNT, DEFAULT_UPCOMING_COUNT)
+        )
         lock = hass.data[DOMAIN]["coordinator_lock"]
         async with lock:
             if "summary_sensor_added" not in hass.data[DOMAIN]:
@@ -67,6 +104,9 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
     """Sensor for a single anniversary."""
 
     _attr_attribution = ATTRIBUTION
+    # Static attributes only change with the configuration; keep them out of
+    # the recorder's state_attributes history.
+    _unrecorded_attributes = STATIC_ATTRIBUTES
     # Remove device class to allow custom unit like "Days"
 
     def __init__(
@@ -74,19 +114,25 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
         coordinator: AnniversaryDataUpdateCoordinator,
         entry_id: str,
         entry: ConfigEntry,
+        config: dict | None = None,
     ) -> None:
         super().__init__(coordinator)
         self._entry = entry
-        # Properly merge data and options (options override data)
-        self.config = {**entry.data}
-        if entry.options:
-            self.config.update(entry.options)
+        if config is None:
+            # Properly merge data and options (options override data)
+            self.config = {**entry.data}
+            if entry.options:
+                self.config.update(entry.options)
+            short_id = entry.entry_id.split("-")[0]
+        else:
+            # A roster member, configured by its own entry in the roster
+            self.config = config
+            short_id = config[CONF_MEMBER_ID]
         name = self.config.get("name", "anniversary")
         slug = slugify(name)
-        short_id = entry.entry_id.split("-")[0]
         self._internal_key = entry_id
         self._suggested_object_id = f"anniversary_{slug}_{short_id}"
-        self._attr_unique_id = f"{entry.entry_id}_sensor"
+        self._attr_unique_id = f"{entry_id}_sensor"
         self._icon_normal = self.config.get(CONF_ICON_NORMAL, DEFAULT_ICON_NORMAL)
         self._icon_today = self.config.get(CONF_ICON_TODAY, DEFAULT_ICON_TODAY)
         self._icon_soon = self.config.get(CONF_ICON_SOON, DEFAULT_ICON_SOON)
@@ -95,23 +141,35 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
         self._using_default_icon = self.config.get(CONF_ICON_NORMAL) is None
         # Use "Days" as the unit of measurement (no device class restriction)
         self._attr_native_unit_of_measurement = "Days"
+        # Render caches: per snapshot, per configuration, and last written
+        self._rendered_snapshot: AnniversarySnapshot | None = None
+        self._rendered: tuple[int, str, dict[str, any]] | None = None
+        self._static_for: AnniversaryData | None = None
+        self._static_attrs: dict[str, any] = {}
+        self._written: tuple | None = None
 
     async def async_added_to_hass(self) -> None:
         """Handle entity being added to hass."""
         await super().async_added_to_hass()
         
-        # Ensure coordinator has our anniversary data
-        if self._internal_key not in self.coordinator.anniversaries:
+        # Ensure coordinator has our anniversary data; a date template
+        # without a fallback date adds it once it renders
+        if self._internal_key not in self.coordinator.anniversaries and not (
+            has_date_template(self.config) and not self.config.get(CONF_DATE)
+        ):
             # Try to add our anniversary data to the coordinator
             try:
-                from .data import AnniversaryData
-                config = {**self._entry.data}
-                if self._entry.options:
-                    config.update(self._entry.options)
-                anniversary_data = AnniversaryData.from_config(config)
-                self.coordinator.anniversaries[self._internal_key] = anniversary_data
+                anniversary_data = AnniversaryData.from_config(self.config)
+                self.coordinator.async_set_anniversary(self._internal_key, anniversary_data)
             except Exception as e:
                 _LOGGER.error(f"Failed to add anniversary data for {self._internal_key}: {e}")
+
+        # Edits to this anniversary are delivered to this entity only
+        self.async_on_remove(
+            self.coordinator.async_add_entry_listener(
+                self._internal_key, self._handle_coordinator_update
+            )
+        )
         
         current_eid = self.entity_id
         try:
@@ -133,11 +191,17 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
             return None
         return self.coordinator.anniversaries.get(self._internal_key)
 
+    @property
+    def snapshot(self) -> AnniversarySnapshot | None:
+        """Get the coordinator's evaluated snapshot for this anniversary."""
+        return self.coordinator.get_snapshot(self._internal_key)
+
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        # Always return True - entity should always be available even if anniversary data is temporarily missing
-        return True
+        # Entity should be available even if anniversary data is temporarily
+        # missing, except while its date template has not rendered a date
+        return self.anniversary is not None or not has_date_template(self.config)
 
     @property
     def name(self) -> str:
@@ -151,19 +215,16 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        ann = self.anniversary
-        if ann:
-            return ann.days_remaining
-        # Fallback: return 0 if anniversary data is missing
-        return 0
+        # Fallback: 0 if anniversary data is missing
+        return self._render()[0]
 
     @property
     def icon(self) -> str:
         """Return the icon to use in the frontend."""
-        ann = self.anniversary
-        if not ann:
-            return self._get_default_icon()
-        days = ann.days_remaining
+        return self._render()[1]
+
+    def _icon_for(self, days: int) -> str:
+        """Return the icon for the given number of days remaining."""
         if days == 0:
             return self._icon_today
         if days <= self._soon_days:
@@ -181,37 +242,75 @@ class AnniversarySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], Sen
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return entity specific state attributes."""
-        ann = self.anniversary
-        if not ann:
-            return {}
+        return self._render()[2]
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if the rendered state or attributes changed."""
+        rendered = (self.name, *self._render())
+        if rendered == self._written:
+            return
+        self._written = rendered
+        self.async_write_ha_state()
+
+    def _render(self) -> tuple[int, str, dict[str, any]]:
+        """Render state, icon and attributes once per snapshot."""
+        snap = self.snapshot
+        if snap is not None and snap is self._rendered_snapshot:
+            return self._rendered
+        if not snap:
+            rendered = (0, self._get_default_icon(), {})
+        else:
+            rendered = (
+                snap.days_remaining,
+                self._icon_for(snap.days_remaining),
+                self._render_attributes(snap),
+            )
+        self._rendered_snapshot = snap
+        self._rendered = rendered
+        return rendered
+
+    def _render_attributes(self, snap: AnniversarySnapshot) -> dict[str, any]:
+        """Build the attribute payload for a snapshot."""
         attrs: dict[str, any] = {
-            ATTR_NEXT_DATE: ann.next_anniversary_date,
-            ATTR_WEEKS: ann.weeks_remaining,
-            ATTR_ZODIAC_SIGN: ann.zodiac_sign,
-            ATTR_IS_MILESTONE: ann.is_milestone,
-            ATTR_GENERATION: ann.generation,
-            ATTR_BIRTHSTONE: ann.birthstone,
-            ATTR_BIRTH_FLOWER: ann.birth_flower,
-            ATTR_CATEGORY: ann.category,
-            ATTR_DAYS_SINCE_LAST: ann.days_since_last,
-            ATTR_LAST_ANNIVERSARY_DATE: ann.last_anniversary_date,
-            "custom_emoji": ann.emoji,
+            ATTR_NEXT_DATE: snap.next_anniversary_date,
+            ATTR_WEEKS: snap.weeks_remaining,
+            ATTR_IS_MILESTONE: snap.is_milestone,
+            ATTR_DAYS_SINCE_LAST: snap.days_since_last,
+            ATTR_LAST_ANNIVERSARY_DATE: snap.last_anniversary_date,
+            **self._static_attributes(snap.anniversary),
         }
-        if ann.named_anniversary:
-            attrs[ATTR_NAMED_ANNIVERSARY] = ann.named_anniversary
-        if ann.current_years is not None:
-            attrs[ATTR_YEARS_CURRENT] = ann.current_years
-        if ann.next_years is not None:
-            attrs[ATTR_YEARS_NEXT] = ann.next_years
-        if ann.half_anniversary_date is not None:
-            attrs[ATTR_HALF_DATE] = ann.half_anniversary_date
-            attrs[ATTR_HALF_DAYS] = ann.days_until_half_anniversary
-        if not ann.unknown_year:
-            attrs[ATTR_DATE] = ann.date
-            if ann.years_since_last is not None:
-                attrs[ATTR_YEARS_SINCE_LAST] = ann.years_since_last
+        if snap.named_anniversary:
+            attrs[ATTR_NAMED_ANNIVERSARY] = snap.named_anniversary
+        if snap.current_years is not None:
+            attrs[ATTR_YEARS_CURRENT] = snap.current_years
+        if snap.next_years is not None:
+            attrs[ATTR_YEARS_NEXT] = snap.next_years
+        if snap.half_anniversary_date is not None:
+            attrs[ATTR_HALF_DATE] = snap.half_anniversary_date
+            attrs[ATTR_HALF_DAYS] = snap.days_until_half_anniversary
+        if snap.years_since_last is not None:
+            attrs[ATTR_YEARS_SINCE_LAST] = snap.years_since_last
         return attrs
 
+    def _static_attributes(self, ann: AnniversaryData) -> dict[str, any]:
+        """Return the STATIC_ATTRIBUTES, computed once per configuration change."""
+        if ann is not self._static_for:
+            traits = ann.day_traits
+            attrs: dict[str, any] = {
+                ATTR_ZODIAC_SIGN: traits.zodiac_sign,
+                ATTR_GENERATION: ann.generation,
+                ATTR_BIRTHSTONE: traits.birthstone,
+                ATTR_BIRTH_FLOWER: traits.birth_flower,
+                ATTR_CATEGORY: ann.category,
+                ATTR_CUSTOM_EMOJI: ann.emoji,
+            }
+            if not ann.unknown_year:
+                attrs[ATTR_DATE] = ann.date
+            self._static_for = ann
+            self._static_attrs = attrs
+        return self._static_attrs
+
 
 class UpcomingAnniversariesSensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], SensorEntity):
     """Aggregated sensor listing next anniversaries."""
@@ -227,6 +326,9 @@ class UpcomingAnniversariesSensor(CoordinatorEntity[AnniversaryDataUpdateCoordin
     async def async_added_to_hass(self) -> None:
         """Handle entity being added to hass."""
         await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_upcoming_listener(self._handle_coordinator_update)
+        )
         current_eid = self.entity_id
         try:
             domain, object_id = current_eid.split(".")
@@ -237,27 +339,84 @@ class UpcomingAnniversariesSensor(CoordinatorEntity[AnniversaryDataUpdateCoordin
             new_object_id = f"anniversary_{object_id}"
             registry.async_update_entity(current_eid, new_entity_id=f"{domain}.{new_object_id}")
 
+    async def async_will_remove_from_hass(self) -> None:
+        """Allow the summary sensor to be added again by a later setup."""
+        await super().async_will_remove_from_hass()
+        self.hass.data.get(DOMAIN, {}).pop("summary_sensor_added", None)
+
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        upcoming = self.coordinator.upcoming_anniversaries
+        upcoming = self.coordinator.upcoming_snapshots
         if not upcoming:
             return None
-        return upcoming[0].name
+        return upcoming[0].anniversary.name
 
     @property
     def extra_state_attributes(self) -> dict[str, any] | None:
         """Return entity specific state attributes."""
-        upcoming = self.coordinator.upcoming_anniversaries
+        upcoming = self.coordinator.upcoming_snapshots
         if not upcoming:
             return None
         return {
             "upcoming": [
                 {
-                    "name": a.name,
-                    "date": a.next_anniversary_date.isoformat(),
-                    "days_remaining": a.days_remaining,
+                    "name": s.anniversary.name,
+                    "date": s.next_anniversary_date.isoformat(),
+                    "days_remaining": s.days_remaining,
                 }
-                for a in upcoming
+                for s in upcoming
             ]
         }
+
+
+class AnniversaryCategorySensor(CoordinatorEntity[AnniversaryDataUpdateCoordinator], SensorEntity):
+    """Aggregated sensor counting the anniversaries of a category."""
+
+    _attr_attribution = ATTRIBUTION
+
+    def __init__(self, coordinator: AnniversaryDataUpdateCoordinator, category: str) -> None:
+        super().__init__(coordinator)
+        self._category = category
+        self._attr_name = f"Anniversary {category.title()} Count"
+        self._attr_icon = CATEGORY_ICONS.get(category, DEFAULT_ICON_NORMAL)
+        self._attr_unique_id = f"{DOMAIN}_{category}_count_sensor"
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity being added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_category_listener(
+                self._category, self._handle_coordinator_update
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Allow the category sensors to be added again by a later setup."""
+        await super().async_will_remove_from_hass()
+        self.hass.data.get(DOMAIN, {}).pop("category_sensors_added", None)
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of anniversaries in the category."""
+        return len(self.coordinator.category_snapshots(self._category))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, any]:
+        """Return today's and the next anniversaries of the category."""
+        # Past one-time events have no next occurrence
+        snapshots = [
+            s for s in self.coordinator.category_snapshots(self._category) if s.days_remaining >= 0
+        ]
+        days = min((s.days_remaining for s in snapshots), default=None)
+        if days is None:
+            return {ATTR_CATEGORY: self._category}
+        upcoming = [s for s in snapshots if s.days_remaining == days]
+        names = sorted(s.anniversary.name for s in upcoming)
+        return {
+            ATTR_CATEGORY: self._category,
+            "today": names if days == 0 else [],
+            "next": names,
+            ATTR_NEXT_DATE: upcoming[0].next_anniversary_date.isoformat(),
+            "days_remaining": days,
+        }
@@ -0,0 +1,66 @@
+"""Services for the Anniversaries integration."""
+from __future__ import annotations
+
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    ATTR_FILE_PATH,
+    ATTR_REFERENCE_DATE,
+    ATTR_ROSTER,
+    DOMAIN,
+    SERVICE_EXPORT,
+    SERVICE_IMPORT_FILE,
+)
+
+IMPORT_FILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILE_PATH): cv.string,
+        vol.Optional(ATTR_ROSTER): cv.string,
+    }
+)
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_FILE_PATH): cv.string,
+        vol.Optional(ATTR_REFERENCE_DATE): cv.date,
+    }
+)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_import_file(call: ServiceCall) -> ServiceResponse:
+        """Create anniversaries from a CSV, JSON Lines or iCalendar file."""
+        # The importer pulls in the config flow; load it only when used
+        from .importer import async_import_file as import_file
+
+        return await import_file(
+            hass, call.data[ATTR_FILE_PATH], call.data.get(ATTR_ROSTER)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_FILE,
+        async_import_file,
+        schema=IMPORT_FILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def async_export(call: ServiceCall) -> ServiceResponse:
+        """Write every anniversary and its derived values to a file."""
+        from .exporter import async_export as export
+
+        return await export(
+            hass, call.data[ATTR_FILE_PATH], call.data.get(ATTR_REFERENCE_DATE)
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        async_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,312 @@
+"""WebSocket API serving the anniversaries held by the coordinator."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import date
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import (
+    ATTR_BIRTH_FLOWER,
+    ATTR_BIRTHSTONE,
+    ATTR_CATEGORY,
+    ATTR_CUSTOM_EMOJI,
+    ATTR_DATE,
+    ATTR_DAYS_SINCE_LAST,
+    ATTR_GENERATION,
+    ATTR_HALF_DATE,
+    ATTR_HALF_DAYS,
+    ATTR_IS_MILESTONE,
+    ATTR_LAST_ANNIVERSARY_DATE,
+    ATTR_NAMED_ANNIVERSARY,
+    ATTR_NEXT_DATE,
+    ATTR_WEEKS,
+    ATTR_YEARS_CURRENT,
+    ATTR_YEARS_NEXT,
+    ATTR_YEARS_SINCE_LAST,
+    ATTR_ZODIAC_SIGN,
+    CATEGORY_OPTIONS,
+    DOMAIN,
+)
+from .coordinator import AnniversaryDataUpdateCoordinator
+from .data import AnniversarySnapshot
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+
+# Sort keys of anniversaries/list; ties are broken by name.
+SORT_KEYS: dict[str, Callable[[AnniversarySnapshot], Any]] = {
+    "days_remaining": lambda s: s.days_remaining,
+    "name": lambda s: s.anniversary.name.casefold(),
+    "date": lambda s: (s.anniversary.date.month, s.anniversary.date.day),
+    "years": lambda s: -1 if s.next_years is None else s.next_years,
+    "category": lambda s: s.anniversary.category,
+}
+
+# Filters and order shared by anniversaries/list and anniversaries/subscribe
+QUERY_SCHEMA = {
+    vol.Optional("categories"): [vol.In(CATEGORY_OPTIONS)],
+    vol.Optional("start"): cv.date,
+    vol.Optional("end"): cv.date,
+    vol.Optional("sort_by", default="days_remaining"): vol.In(list(SORT_KEYS)),
+    vol.Optional("descending", default=False): bool,
+    vol.Optional("offset", default=0): vol.All(int, vol.Range(min=0)),
+}
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the integration's WebSocket commands."""
+    websocket_api.async_register_command(hass, ws_list)
+    websocket_api.async_register_command(hass, ws_subscribe)
+
+
+def list_row(key: str, snap: AnniversarySnapshot, entity_id: str | None = None) -> dict[str, Any]:
+    """Return the JSON row of one anniversary snapshot.
+
+    Values use the attribute names of the anniversary's sensor, so a card
+    can treat a row like the sensor's state.
+    """
+    ann = snap.anniversary
+    traits = ann.day_traits
+    return {
+        "id": key,
+        "entity_id": entity_id,
+        "name": ann.name,
+        ATTR_DATE: ann.date.strftime("%m-%d" if ann.unknown_year else "%Y-%m-%d"),
+        ATTR_CATEGORY: ann.category,
+        ATTR_CUSTOM_EMOJI: ann.emoji,
+        "one_time": ann.is_one_time,
+        ATTR_NEXT_DATE: snap.next_anniversary_date.isoformat(),
+        "days_remaining": snap.days_remaining,
+        ATTR_WEEKS: snap.weeks_remaining,
+        ATTR_YEARS_CURRENT: snap.current_years,
+        ATTR_YEARS_NEXT: snap.next_years,
+        ATTR_LAST_ANNIVERSARY_DATE: snap.last_anniversary_date.isoformat(),
+        ATTR_DAYS_SINCE_LAST: snap.days_since_last,
+        ATTR_YEARS_SINCE_LAST: snap.years_since_last,
+        ATTR_IS_MILESTONE: snap.is_milestone,
+        ATTR_NAMED_ANNIVERSARY: snap.named_anniversary,
+        ATTR_HALF_DATE: _isoformat(snap.half_anniversary_date),
+        ATTR_HALF_DAYS: snap.days_until_half_anniversary,
+        ATTR_ZODIAC_SIGN: traits.zodiac_sign,
+        ATTR_BIRTHSTONE: traits.birthstone,
+        ATTR_BIRTH_FLOWER: traits.birth_flower,
+        ATTR_GENERATION: ann.generation,
+    }
+
+
+def _isoformat(value: date | None) -> str | None:
+    """Return an optional date as an ISO string."""
+    return None if value is None else value.isoformat()
+
+
+def query(
+    snapshots: Iterable[tuple[str, AnniversarySnapshot]],
+    categories: Iterable[str] | None = None,
+    sort_by: str = "days_remaining",
+    descending: bool = False,
+    offset: int = 0,
+    limit: int | None = DEFAULT_LIMIT,
+    entity_id: Callable[[str], str | None] = lambda key: None,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Filter, sort and page snapshots; return (total matches, page rows)."""
+    if categories:
+        wanted = set(categories)
+        snapshots = [item for item in snapshots if item[1].anniversary.category in wanted]
+    key = SORT_KEYS[sort_by]
+    ordered = sorted(
+        snapshots,
+        key=lambda item: (key(item[1]), item[1].anniversary.name),
+        reverse=descending,
+    )
+    page = ordered[offset:] if limit is None else ordered[offset : offset + limit]
+    return len(ordered), [list_row(k, snap, entity_id(k)) for k, snap in page]
+
+
+def _candidates(
+    coordinator: AnniversaryDataUpdateCoordinator, msg: dict[str, Any]
+) -> list[tuple[str, AnniversarySnapshot]]:
+    """Return the snapshots matching the date window and categories of a query."""
+    start: date | None = msg.get("start")
+    end: date | None = msg.get("end")
+    if start is not None and end is not None:
+        # Read from the day index: cost follows the window, not the total
+        snapshots = coordinator.next_occurrences_between(start, end)
+    else:
+        snapshots = coordinator.snapshots_for().items()
+    return [(key, snap) for key, snap in snapshots if _matches(snap, msg)]
+
+
+def _matches(snap: AnniversarySnapshot, msg: dict[str, Any]) -> bool:
+    """Return True if a snapshot matches the date window and categories of a query."""
+    if (categories := msg.get("categories")) and snap.anniversary.category not in categories:
+        return False
+    start: date | None = msg.get("start")
+    end: date | None = msg.get("end")
+    return (start is None or snap.next_anniversary_date >= start) and (
+        end is None or snap.next_anniversary_date <= end
+    )
+
+
+@callback
+def _async_query(
+    hass: HomeAssistant,
+    msg: dict[str, Any],
+    candidates: list[tuple[str, AnniversarySnapshot]] | None = None,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Run the query of a list or subscribe message against the coordinator."""
+    coordinator: AnniversaryDataUpdateCoordinator | None = hass.data.get(DOMAIN, {}).get(
+        "coordinator"
+    )
+    if coordinator is None:
+        return 0, []
+    if candidates is None:
+        candidates = _candidates(coordinator, msg)
+    registry = er.async_get(hass)
+    return query(
+        candidates,
+        None,
+        msg["sort_by"],
+        msg["descending"],
+        msg["offset"],
+        msg.get("limit"),
+        lambda key: registry.async_get_entity_id("sensor", DOMAIN, f"{key}_sensor"),
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "anniversaries/list",
+        **QUERY_SCHEMA,
+        vol.Optional("limit", default=DEFAULT_LIMIT): vol.All(
+            int, vol.Range(min=1, max=MAX_LIMIT)
+        ),
+    }
+)
+@callback
+def ws_list(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return one page of anniversaries, filtered and sorted by the server."""
+    total, rows = _async_query(hass, msg)
+    connection.send_result(
+        msg["id"],
+        {"total": total, "offset": msg["offset"], "anniversaries": rows},
+    )
+
+
+class _Subscription:
+    """Push the changes to one subscriber's query result."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        self._hass = hass
+        self._connection = connection
+        self._msg = msg
+        self._coordinator: AnniversaryDataUpdateCoordinator | None = None
+        # Keys of every anniversary matching the query, beyond the sent page
+        self._matching: set[str] = set()
+        self._rows: dict[str, dict[str, Any]] = {}
+        self._order: list[str] = []
+        self._total: int | None = None
+        self._scheduled = False
+        self._unsubscribes: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_start(self, coordinator: AnniversaryDataUpdateCoordinator) -> CALLBACK_TYPE:
+        """Send the initial result and listen for changes; return the unsubscriber."""
+        self._coordinator = coordinator
+        self._unsubscribes = [
+            # Midnight refreshes move every anniversary
+            coordinator.async_add_listener(self.async_schedule),
+            # Single-anniversary edits
+            coordinator.async_add_key_listener(self._async_changed),
+        ]
+        self.async_send()
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop listening for changes."""
+        while self._unsubscribes:
+            self._unsubscribes.pop()()
+
+    @callback
+    def _async_changed(self, key: str) -> None:
+        """Re-run the query only if the changed anniversary matches it, or did."""
+        if key in self._matching:
+            self.async_schedule()
+            return
+        snap = self._coordinator.get_snapshot(key)
+        if snap is not None and _matches(snap, self._msg):
+            self.async_schedule()
+
+    @callback
+    def async_schedule(self) -> None:
+        """Send the changes once the current burst of updates is done."""
+        if not self._scheduled:
+            self._scheduled = True
+            self._hass.loop.call_soon(self.async_send)
+
+    @callback
+    def async_send(self) -> None:
+        """Send the rows that changed, the rows removed and the new order."""
+        self._scheduled = False
+        if not self._unsubscribes:
+            # Unsubscribed while a send was pending
+            return
+        candidates = _candidates(self._coordinator, self._msg)
+        self._matching = {key for key, _ in candidates}
+        total, rows = _async_query(self._hass, self._msg, candidates)
+        current = {row["id"]: row for row in rows}
+        changed = [row for key, row in current.items() if self._rows.get(key) != row]
+        removed = [key for key in self._rows if key not in current]
+        order = list(current)
+        if (
+            self._total is not None
+            and not changed
+            and not removed
+            and order == self._order
+            and total == self._total
+        ):
+            return
+        self._rows, self._order, self._total = current, order, total
+        self._connection.send_message(
+            websocket_api.event_message(
+                self._msg["id"],
+                {"total": total, "changed": changed, "removed": removed, "order": order},
+            )
+        )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "anniversaries/subscribe",
+        **QUERY_SCHEMA,
+        vol.Optional("limit", default=DEFAULT_LIMIT): vol.All(
+            int, vol.Range(min=1, max=MAX_LIMIT)
+        ),
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Subscribe to a query; only the changes to its result are pushed."""
+    coordinator = hass.data.get(DOMAIN, {}).get("coordinator")
+    if coordinator is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "No anniversaries loaded")
+        return
+    subscription = _Subscription(hass, connection, msg)
+    connection.send_result(msg["id"])
+    connection.subscriptions[msg["id"]] = subscription.async_start(coordinator)
@@ -3,14 +3,22 @@ console.error('🚨🚨🚨 CALENDAR CARD JAVASCRIPT FILE LOADED! 🚨🚨🚨')
 /**
  * Anniversary Calendar Card
  * Mini calendar view highlighting anniversary dates with popup details
+ * Reads the displayed weeks from the anniversaries/subscribe WebSocket command
  */
 
+import { AnniversaryFeed, MAX_LIMIT, isoDate } from './anniversary-feed.js';
+
 class AnniversaryCalendarCard extends HTMLElement {
   constructor() {
     super();
     console.error('🚨🚨🚨 CALENDAR CARD CONSTRUCTOR CALLED! 🚨🚨🚨');
     this.attachShadow({ mode: 'open' });
     this.currentMonth = new Date();
+    this._feed = new AnniversaryFeed(() => this.render());
+  }
+
+  disconnectedCallback() {
+    this._feed.disconnect();
   }
 
   setConfig(config) {
@@ -26,11 +34,29 @@ class AnniversaryCalendarCard extends HTMLElement {
 
   set hass(hass) {
     this._hass = hass;
+    // Once the feed has the displayed weeks, it re-renders on changes itself
+    if (this.connectFeed() && this._feed.ready) return;
     this.render();
   }
 
+  connectFeed() {
+    if (!this._feed.available || this.config.entities) return false;
+    // The six weeks shown for the current month
+    const firstDay = new Date(this.currentMonth.getFullYear(), this.currentMonth.getMonth(), 1);
+    const startOfWeek = new Date(firstDay);
+    startOfWeek.setDate(firstDay.getDate() - firstDay.getDay());
+    this._feed.connect(this._hass, {
+      start: isoDate(startOfWeek),
+      end: isoDate(startOfWeek, 41),
+      sort_by: 'days_remaining',
+      limit: MAX_LIMIT,
+    });
+    return true;
+  }
+
   getAnniversaryEntities() {
     if (!this._hass) return [];
+    if (this._feed.ready && !this.config.entities) return this._feed.items;
     
     return Object.keys(this._hass.states)
       .filter(entityId => {
@@ -56,6 +82,7 @@ class AnniversaryCalendarCard extends HTMLElement {
 
   navigateMonth(direction) {
     this.currentMonth.setMonth(this.currentMonth.getMonth() + direction);
+    this.connectFeed();
     this.render();
   }
 
@@ -351,16 +378,21 @@ class AnniversaryCalendarCard extends HTMLElement {
   }
 }
 
-customElements.define('anniversary-calendar-card', AnniversaryCalendarCard);
+export default AnniversaryCalendarCard;
 
-// Register the card
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: 'custom:anniversary-calendar-card',
-  name: 'Anniversary Calendar Card',
-  description: 'Mini calendar view highlighting anniversary dates',
-  preview: true
-});
+// Standalone resource: the anniversary-cards.js loader defines the tag first
+if (!customElements.get('anniversary-calendar-card')) {
+  customElements.define('anniversary-calendar-card', AnniversaryCalendarCard);
+
+  // Register the card
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: 'custom:anniversary-calendar-card',
+    name: 'Anniversary Calendar Card',
+    description: 'Mini calendar view highlighting anniversary dates',
+    preview: true
+  });
+}
 
 console.info(
   '%c  ANNIVERSARY-CALENDAR-CARD  %c  Version 1.0.0  ',
@@ -0,0 +1,137 @@
+/**
+ * Anniversary Cards
+ * The one resource to register for all anniversary cards. It defines the
+ * four card elements right away, but each card's code is only imported
+ * when a dashboard first creates that card, so a view only downloads and
+ * parses the cards it shows.
+ * When served by the integration, the imports carry the content hash of
+ * each file (?v=...) and browsers cache them until the file changes.
+ */
+
+const CARDS = [
+  {
+    type: 'anniversary-timeline-card',
+    load: () => import('./anniversary-timeline-card.js'),
+    name: 'Anniversary Timeline Card',
+    description: 'Advanced anniversary timeline with multi-category support, statistics, and interactive features',
+  },
+  {
+    type: 'anniversary-details-card',
+    load: () => import('./anniversary-details-card.js'),
+    name: 'Anniversary Details Card',
+    description: 'Detailed view of a single anniversary with rich attributes',
+  },
+  {
+    type: 'anniversary-calendar-card',
+    load: () => import('./anniversary-calendar-card.js'),
+    name: 'Anniversary Calendar Card',
+    description: 'Mini calendar view highlighting anniversary dates',
+  },
+  {
+    type: 'anniversary-stats-card',
+    load: () => import('./anniversary-stats-card.js'),
+    name: 'Anniversary Stats Card',
+    description: 'Summary statistics and overview of all anniversaries',
+  },
+];
+
+const implementations = new Map();
+
+// Import a card's code once and define it under a private tag
+function loadCard(card) {
+  if (!implementations.has(card.type)) {
+    implementations.set(card.type, card.load().then(module => {
+      const tag = `${card.type}-impl`;
+      if (!customElements.get(tag)) {
+        customElements.define(tag, class extends module.default {});
+      }
+      return tag;
+    }).catch(err => {
+      implementations.delete(card.type);  // Try again on the next card
+      throw err;
+    }));
+  }
+  return implementations.get(card.type);
+}
+
+// Stands in for a card and hands everything over once its code is loaded
+function lazyCard(card) {
+  return class extends HTMLElement {
+    static async getStubConfig(...args) {
+      const implementation = customElements.get(await loadCard(card));
+      return implementation.getStubConfig ? implementation.getStubConfig(...args) : {};
+    }
+
+    setConfig(config) {
+      this._config = config;
+      if (this._card) {
+        // Loaded: let the card validate the config, as Lovelace expects
+        this._card.setConfig(config);
+        return;
+      }
+      this._loaded().catch(() => {});  // Shown in the card by _load
+    }
+
+    set hass(hass) {
+      this._hass = hass;
+      if (this._card) this._card.hass = hass;
+    }
+
+    get hass() {
+      return this._hass;
+    }
+
+    connectedCallback() {
+      this.style.display = 'block';
+    }
+
+    getCardSize() {
+      if (this._card) return this._card.getCardSize();
+      return this._loaded().then(element => element.getCardSize()).catch(() => 1);
+    }
+
+    _loaded() {
+      if (!this._ready) {
+        this._ready = this._load();
+        // A config fixed in the editor gets a new attempt
+        this._ready.catch(() => { this._ready = null; });
+      }
+      return this._ready;
+    }
+
+    async _load() {
+      const element = document.createElement(await loadCard(card));
+      try {
+        element.setConfig(this._config);
+      } catch (err) {
+        const alert = document.createElement('ha-alert');
+        alert.alertType = 'error';
+        alert.textContent = err.message;
+        this.replaceChildren(alert);
+        throw err;
+      }
+      if (this._hass) element.hass = this._hass;
+      this.replaceChildren(element);
+      this._card = element;
+      return element;
+    }
+  };
+}
+
+window.customCards = window.customCards || [];
+for (const card of CARDS) {
+  if (customElements.get(card.type)) continue;  // Also registered as its own resource
+  customElements.define(card.type, lazyCard(card));
+  window.customCards.push({
+    type: `custom:${card.type}`,
+    name: card.name,
+    description: card.description,
+    preview: true,
+  });
+}
+
+console.info(
+  '%c  ANNIVERSARY-CARDS  %c  Loader 1.0.0  ',
+  'color: orange; font-weight: bold; background: black',
+  'color: white; font-weight: bold; background: dimgray'
+);
@@ -407,16 +407,21 @@ class AnniversaryDetailsCard extends HTMLElement {
   }
 }
 
-customElements.define('anniversary-details-card', AnniversaryDetailsCard);
+export default AnniversaryDetailsCard;
 
-// Register the card
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: 'custom:anniversary-details-card',
-  name: 'Anniversary Details Card',
-  description: 'Detailed view of a single anniversary with rich attributes',
-  preview: true
-});
+// Standalone resource: the anniversary-cards.js loader defines the tag first
+if (!customElements.get('anniversary-details-card')) {
+  customElements.define('anniversary-details-card', AnniversaryDetailsCard);
+
+  // Register the card
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: 'custom:anniversary-details-card',
+    name: 'Anniversary Details Card',
+    description: 'Detailed view of a single anniversary with rich attributes',
+    preview: true
+  });
+}
 
 console.info(
   '%c  ANNIVERSARY-DETAILS-CARD  %c  Version 1.0.0  ',
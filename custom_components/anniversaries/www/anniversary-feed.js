@@ -0,0 +1,95 @@
+/**
+ * Anniversary Feed
+ * Keeps a card's anniversaries in sync through the anniversaries/subscribe
+ * WebSocket command. The server filters, sorts and pages the anniversaries
+ * and only pushes the rows that changed, so a card no longer scans every
+ * entity in hass.states on each state change.
+ * Rows are shaped like sensor states, so cards can use them in place of
+ * hass.states entries.
+ */
+
+// Largest page the server sends for a query
+export const MAX_LIMIT = 500;
+
+export class AnniversaryFeed {
+  constructor(onChange) {
+    this._onChange = onChange;
+    this._connection = null;
+    this._key = null;
+    this._unsubscribe = null;
+    this._rows = new Map();
+    this._items = null;
+    this.total = 0;
+    // Turned off when the integration does not offer the command
+    this.available = true;
+  }
+
+  // Subscribe to a query; does nothing if already subscribed to it
+  connect(hass, query) {
+    const key = JSON.stringify(query);
+    if (!this.available || (key === this._key && this._connection === hass.connection)) {
+      return;
+    }
+    this.disconnect();
+    this._connection = hass.connection;
+    this._key = key;
+    const subscription = hass.connection.subscribeMessage(
+      event => this._apply(subscription, event),
+      { type: 'anniversaries/subscribe', ...query }
+    );
+    this._unsubscribe = subscription;
+    subscription.catch(() => {
+      if (this._unsubscribe !== subscription) return;
+      this.available = false;
+      this._unsubscribe = null;
+      this._onChange();
+    });
+  }
+
+  disconnect() {
+    if (this._unsubscribe) {
+      this._unsubscribe.then(unsubscribe => unsubscribe()).catch(() => {});
+      this._unsubscribe = null;
+    }
+    this._connection = null;
+    this._key = null;
+    this._rows = new Map();
+    this._items = null;
+  }
+
+  // True once the first result of the current query has arrived
+  get ready() {
+    return this.available && this._items !== null;
+  }
+
+  // The anniversaries of the current query, in the server's order
+  get items() {
+    return this._items || [];
+  }
+
+  _apply(subscription, event) {
+    if (this._unsubscribe !== subscription) return;
+    event.removed.forEach(id => this._rows.delete(id));
+    event.changed.forEach(row => this._rows.set(row.id, toState(row)));
+    this._items = event.order.map(id => this._rows.get(id));
+    this.total = event.total;
+    this._onChange();
+  }
+}
+
+// A row of the WebSocket API, shaped like the anniversary sensor's state
+export function toState(row) {
+  const { id, entity_id, name, days_remaining, ...attributes } = row;
+  return {
+    entity_id: entity_id || `sensor.anniversary_${id}`,
+    state: String(days_remaining),
+    attributes: { friendly_name: name, ...attributes },
+  };
+}
+
+// A local date as YYYY-MM-DD, days after the given date
+export function isoDate(date, days = 0) {
+  const day = new Date(date.getFullYear(), date.getMonth(), date.getDate() + days);
+  const pad = n => String(n).padStart(2, '0');
+  return `${day.getFullYear()}-${pad(day.getMonth() + 1)}-${pad(day.getDate())}`;
+}
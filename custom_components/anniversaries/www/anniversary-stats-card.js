@@ -3,13 +3,21 @@ console.error('🚨🚨🚨 STATS CARD JAVASCRIPT FILE LOADED! 🚨🚨🚨');
 /**
  * Anniversary Stats Card
  * Summary statistics and quick overview of anniversaries
+ * Reads the anniversaries from the anniversaries/subscribe WebSocket command
  */
 
+import { AnniversaryFeed, MAX_LIMIT } from './anniversary-feed.js';
+
 class AnniversaryStatsCard extends HTMLElement {
   constructor() {
     super();
     console.error('🚨🚨🚨 STATS CARD CONSTRUCTOR CALLED! 🚨🚨🚨');
     this.attachShadow({ mode: 'open' });
+    this._feed = new AnniversaryFeed(() => this.render());
+  }
+
+  disconnectedCallback() {
+    this._feed.disconnect();
   }
 
   setConfig(config) {
@@ -25,11 +33,20 @@ class AnniversaryStatsCard extends HTMLElement {
 
   set hass(hass) {
     this._hass = hass;
+    // Once the feed has its first result, it re-renders on changes itself
+    if (this.connectFeed() && this._feed.ready) return;
     this.render();
   }
 
+  connectFeed() {
+    if (!this._feed.available || this.config.entities) return false;
+    this._feed.connect(this._hass, { sort_by: 'days_remaining', limit: MAX_LIMIT });
+    return true;
+  }
+
   getAnniversaryEntities() {
     if (!this._hass) return [];
+    if (this._feed.ready && !this.config.entities) return this._feed.items;
     
     return Object.keys(this._hass.states)
       .filter(entityId => {
@@ -345,16 +362,21 @@ class AnniversaryStatsCard extends HTMLElement {
   }
 }
 
-customElements.define('anniversary-stats-card', AnniversaryStatsCard);
+export default AnniversaryStatsCard;
+
+// Standalone resource: the anniversary-cards.js loader defines the tag first
+if (!customElements.get('anniversary-stats-card')) {
+  customElements.define('anniversary-stats-card', AnniversaryStatsCard);
 
-// Register the card
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: 'custom:anniversary-stats-card',
-  name: 'Anniversary Stats Card',
-  description: 'Summary statistics and overview of all anniversaries',
-  preview: true
-});
+  // Register the card
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: 'custom:anniversary-stats-card',
+    name: 'Anniversary Stats Card',
+    description: 'Summary statistics and overview of all anniversaries',
+    preview: true
+  });
+}
 
 console.info(
   '%c  ANNIVERSARY-STATS-CARD  %c  Version 1.0.0  ',
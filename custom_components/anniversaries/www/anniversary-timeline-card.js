@@ -4,13 +4,21 @@
  * Now uses universal color scheme (red → orange → green → blue) for urgency
  * Emoji selection expanded and matches latest const.py
  * Category icons fixed for corrupted emojis
+ * Reads pre-sorted pages from the anniversaries/subscribe WebSocket command
  */
 
+import { AnniversaryFeed, MAX_LIMIT, isoDate } from './anniversary-feed.js';
+
 class AnniversaryTimelineCard extends HTMLElement {
   constructor() {
     super();
     this.attachShadow({ mode: 'open' });
     this._renderTimeout = null; // For debouncing renders
+    this._feed = new AnniversaryFeed(() => this.scheduleRender());
+  }
+
+  disconnectedCallback() {
+    this._feed.disconnect();
   }
 
   setConfig(config) {
@@ -54,6 +62,7 @@ class AnniversaryTimelineCard extends HTMLElement {
     
     // Render if hass is already available
     if (this._hass) {
+      this.connectFeed();
       this.scheduleRender();
     }
   }
@@ -188,12 +197,34 @@ class AnniversaryTimelineCard extends HTMLElement {
   set hass(hass) {
     this._hass = hass;
     if (this.config) { // Only render if config exists
+      // Once the feed has its first page, it re-renders on changes itself
+      if (this.connectFeed() && this._feed.ready) return;
       this.scheduleRender();
     }
   }
 
+  useFeed() {
+    // Explicit entity lists, priority ordering and filter debugging need
+    // the entity states
+    return this._feed.available && !this.config.entities &&
+      !this.config.priority_categories && !this.config.debug_filtering;
+  }
+
+  connectFeed() {
+    if (!this.useFeed()) return false;
+    const categories = this.config.category ? [this.config.category] : this.config.categories;
+    this._feed.connect(this._hass, {
+      categories: Array.isArray(categories) ? categories : undefined,
+      start: isoDate(new Date()),
+      sort_by: 'days_remaining',
+      limit: Math.min(this.config.max_items, MAX_LIMIT),
+    });
+    return true;
+  }
+
   getAnniversaryEntities() {
     if (!this._hass || !this.config) return [];
+    if (this.useFeed() && this._feed.ready) return this._feed.items;
     
     console.log('🔧 [Timeline Card] getAnniversaryEntities called, this.config:', this.config);
     
@@ -962,16 +993,21 @@ class AnniversaryTimelineCard extends HTMLElement {
   }
 }
 
-customElements.define('anniversary-timeline-card', AnniversaryTimelineCard);
+export default AnniversaryTimelineCard;
 
-// Register the card
-window.customCards = window.customCards || [];
-window.customCards.push({
-  type: 'custom:anniversary-timeline-card',
-  name: 'Anniversary Timeline Card',
-  description: 'Advanced anniversary timeline with multi-category support, statistics, and interactive features',
-  preview: true
-});
+// Standalone resource: the anniversary-cards.js loader defines the tag first
+if (!customElements.get('anniversary-timeline-card')) {
+  customElements.define('anniversary-timeline-card', AnniversaryTimelineCard);
+
+  // Register the card
+  window.customCards = window.customCards || [];
+  window.customCards.push({
+    type: 'custom:anniversary-timeline-card',
+    name: 'Anniversary Timeline Card',
+    description: 'Advanced anniversary timeline with multi-category support, statistics, and interactive features',
+    preview: true
+  });
+}
 
 console.info(
   '%c  ANNIVERSARY-TIMELINE-CARD  %c  Version 1.3.2 - Config Debug Fix  ',
@@ -5,21 +5,23 @@ import sys
 import os
 
 # Add the custom_components directory to the path
-sys.path.insert(0, '/workspaces/HACS.Anniversaries')
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ROOT)
 
 print("Testing imports...")
 
 try:
     print("Importing const...")
-    from custom_components.anniversaries.const import DOMAIN, PLATFORMS, EMOJI_OPTIONS
-    print(f"✓ Successfully imported const. Domain: {DOMAIN}, Emoji options count: {len(EMOJI_OPTIONS)}")
+    from custom_components.anniversaries.const import DOMAIN, PLATFORMS
+    from custom_components.anniversaries.emoji import EMOJI_CATALOG, emoji_index
+    print(f"✓ Successfully imported const. Domain: {DOMAIN}, Emoji groups: {len(EMOJI_CATALOG)}, emojis: {len(emoji_index().entries)}")
     
     print("Importing data...")
     from custom_components.anniversaries.data import AnniversaryData
     print("✓ Successfully imported data")
     
     print("Importing config_flow...")
-    from custom_components.anniversaries.config_flow import AnniversaryConfigFlow
+    from custom_components.anniversaries.config_flow import AnniversariesFlowHandler
     print("✓ Successfully imported config_flow")
     
     print("Importing sensor...")
@@ -33,21 +35,21 @@ try:
     print("Importing __init__...")
     # We can't fully import __init__ because it requires HomeAssistant objects,
     # but we can check for syntax errors
-    with open('/workspaces/HACS.Anniversaries/custom_components/anniversaries/__init__.py', 'r') as f:
+    with open(os.path.join(ROOT, 'custom_components', 'anniversaries', '__init__.py'), 'r') as f:
         code = f.read()
     compile(code, '__init__.py', 'exec')
     print("✓ __init__.py compiles without syntax errors")
     
     print("\n=== Testing emoji system ===")
     # Test emoji system
-    from custom_components.anniversaries.const import CATEGORY_EMOJIS, get_default_emoji_for_category
+    from custom_components.anniversaries.const import CATEGORY_EMOJIS, DEFAULT_EMOJI
     
     print(f"Available emoji categories: {list(CATEGORY_EMOJIS.keys())}")
     
     # Test some category defaults
     test_categories = ['birthday', 'anniversary', 'holiday', 'medical', 'travel']
     for category in test_categories:
-        emoji = get_default_emoji_for_category(category)
+        emoji = CATEGORY_EMOJIS.get(category, DEFAULT_EMOJI)
         print(f"Category '{category}' -> Default emoji: {emoji}")
     
     print("\n=== Testing data class ===")
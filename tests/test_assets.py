@@ -0,0 +1,109 @@
+"""In-memory server for the card files."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+import gzip
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import make_mocked_request
+
+from custom_components.anniversaries.assets import (
+    ASSETS_DIR,
+    CACHE_IMMUTABLE,
+    AnniversaryAssetsView,
+    load_assets,
+)
+
+
+@pytest.fixture(scope='module')
+def view():
+    return AnniversaryAssetsView(load_assets(ASSETS_DIR))
+
+
+def request(path, **headers):
+    return make_mocked_request('GET', path, headers=headers)
+
+
+def test_load_assets_reads_the_card_files(view):
+    asset = view.assets['anniversary-details-card.js']
+    assert asset.body == (ASSETS_DIR / 'anniversary-details-card.js').read_bytes()
+    assert asset.content_type in ('text/javascript', 'application/javascript')
+    assert gzip.decompress(asset.encoded['gzip']) == asset.body
+    assert view.asset_url('anniversary-details-card.js') == (
+        f'/local/community/anniversaries/anniversary-details-card.js?v={asset.version}'
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_negotiates_encoding_and_caching(view):
+    name = 'anniversary-feed.js'
+    asset = view.assets[name]
+
+    response = await view.get(request(f'/local/community/anniversaries/{name}'), name)
+    assert response.status == 200
+    assert response.body == asset.body
+    assert response.headers['ETag'] == asset.etag
+    assert response.headers['Cache-Control'] == 'no-cache'
+    assert 'Content-Encoding' not in response.headers
+
+    response = await view.get(
+        request(f'{view.asset_url(name)}', **{'Accept-Encoding': 'gzip, deflate'}), name
+    )
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert response.headers['Cache-Control'] == CACHE_IMMUTABLE
+    assert gzip.decompress(response.body) == asset.body
+
+    response = await view.get(
+        request(f'/local/community/anniversaries/{name}', **{'Accept-Encoding': 'gzip;q=0'}), name
+    )
+    assert 'Content-Encoding' not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_get_returns_not_modified_for_current_etag(view):
+    name = 'anniversary-feed.js'
+    etag = view.assets[name].etag
+    response = await view.get(
+        request(f'/local/community/anniversaries/{name}', **{'If-None-Match': f'"old", {etag}'}), name
+    )
+    assert response.status == 304
+    assert response.body is None
+    assert response.headers['ETag'] == etag
+
+    response = await view.get(
+        request(f'/local/community/anniversaries/{name}', **{'If-None-Match': '"old"'}), name
+    )
+    assert response.status == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('name', ['../manifest.json', '..%2Fconst.py', 'missing.js', ''])
+async def test_get_serves_only_cached_files(view, name):
+    with pytest.raises(web.HTTPNotFound):
+        await view.get(request(f'/local/community/anniversaries/{name}'), name)
+
+
+def test_module_imports_are_pinned_to_their_hash(tmp_path):
+    (tmp_path / 'feed.js').write_text('export const x = 1;\n')
+    (tmp_path / 'card.js').write_text("import { x } from './feed.js';\n")
+    (tmp_path / 'loader.js').write_text("const load = () => import(\"./card.js\");\nconst other = './missing.js';\n")
+    assets = load_assets(tmp_path)
+    feed, card = assets['feed.js'], assets['card.js']
+    assert card.body == f"import {{ x }} from './feed.js?v={feed.version}';\n".encode()
+    assert assets['loader.js'].body == (
+        f'const load = () => import("./card.js?v={card.version}");\n'
+        "const other = './missing.js';\n"
+    ).encode()
+
+    # A change to the feed reaches the hash of every module importing it
+    (tmp_path / 'feed.js').write_text('export const x = 2;\n')
+    changed = load_assets(tmp_path)
+    assert changed['card.js'].version != card.version
+    assert changed['loader.js'].version != assets['loader.js'].version
+
+
+def test_loader_imports_every_card(view):
+    loader = view.assets['anniversary-cards.js'].body.decode()
+    for name in ('timeline', 'details', 'calendar', 'stats'):
+        card = f'anniversary-{name}-card.js'
+        assert f"import('./{card}?v={view.assets[card].version}')" in loader
@@ -0,0 +1,127 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.anniversaries.calendar import AnniversariesCalendar
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+
+
+@pytest_asyncio.fixture
+async def hass():
+    hass = HomeAssistant('/tmp')
+    yield hass
+    await hass.async_stop(force=True)
+
+
+def _in_days(days: int) -> date:
+    return dt_util.now().date() + timedelta(days=days)
+
+
+def _event(name: str, days: int) -> AnniversaryData:
+    return AnniversaryData(name=name, date=_in_days(days), is_one_time=True)
+
+
+async def _coordinator(hass, count: int = 20) -> AnniversaryDataUpdateCoordinator:
+    coordinator = AnniversaryDataUpdateCoordinator(
+        hass,
+        {
+            f'e{n}': _event(f'A{n}', 10 + n)
+            for n in range(count)
+        },
+    )
+    await coordinator.async_refresh()
+    return coordinator
+
+
+@pytest.mark.asyncio
+async def test_edit_notifies_only_its_entry(hass):
+    coordinator = await _coordinator(hass)
+    calls = []
+    coordinator.async_add_listener(lambda: calls.append('all'))
+    for n in range(20):
+        coordinator.async_add_entry_listener(f'e{n}', lambda n=n: calls.append(f'e{n}'))
+    coordinator.async_add_upcoming_listener(lambda: calls.append('upcoming'))
+
+    # Outside the top 5: only its own entities re-render
+    coordinator.async_set_anniversary('e15', _event('Renamed', 30))
+    assert calls == ['e15']
+
+    # Moving into the top 5 also re-renders the summary
+    calls.clear()
+    coordinator.async_set_anniversary('e16', _event('Soon', 1))
+    assert calls == ['e16', 'upcoming']
+    assert coordinator.upcoming_snapshots[0].anniversary.name == 'Soon'
+
+    calls.clear()
+    coordinator.async_remove_anniversary('e16')
+    assert calls == ['e16', 'upcoming']
+    assert len(coordinator.upcoming_snapshots) == 5
+
+
+@pytest.mark.asyncio
+async def test_aggregated_calendars_follow_edits_outside_the_summary(hass):
+    coordinator = await _coordinator(hass)
+    calls = []
+    for category in (None, 'other', 'work'):
+        calendar = AnniversariesCalendar(coordinator, category)
+        calendar.hass = hass
+        calendar.entity_id = f'calendar.anniversary_{category or "all"}'
+        calendar._handle_coordinator_update = lambda category=category: calls.append(category)
+        await calendar.async_added_to_hass()
+
+    # Outside the top 5, but the next event of both calendars changes
+    coordinator.async_set_anniversary('e15', _event('Renamed', 30))
+    assert sorted(calls, key=str) == [None, 'other']
+
+
+@pytest.mark.asyncio
+async def test_removed_listener_is_not_called(hass):
+    coordinator = await _coordinator(hass, 2)
+    calls = []
+    remove = coordinator.async_add_entry_listener('e0', lambda: calls.append('e0'))
+    remove()
+    coordinator.async_set_anniversary('e0', _event('X', 3))
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_occurrences_between_matches_per_anniversary_expansion(hass):
+    import random
+
+    rng = random.Random(10)
+    anniversaries = {}
+    for n in range(200):
+        day = date.fromordinal(rng.randint(date(1950, 1, 1).toordinal(), date(2030, 12, 31).toordinal()))
+        anniversaries[f'e{n}'] = AnniversaryData(
+            name=f'A{n}',
+            date=day.replace(year=1904) if n % 9 == 0 else day,
+            unknown_year=n % 9 == 0,
+            is_one_time=n % 5 == 0,
+            show_half_anniversary=n % 3 == 0,
+            category=('birthday', 'work')[n % 2],
+        )
+    anniversaries['leap'] = AnniversaryData(name='Leap', date=date(1996, 2, 29), show_half_anniversary=True)
+    coordinator = AnniversaryDataUpdateCoordinator(hass, anniversaries)
+    coordinator.async_remove_anniversary('e1')
+    assert 'e1' not in anniversaries
+
+    start, end = date(2023, 11, 15), date(2026, 3, 20)
+    expected = sorted(
+        (day, ann.name, years, is_half)
+        for ann in anniversaries.values()
+        for day, years, is_half in ann.occurrences(start, end)
+    )
+    got = [(day, ann.name, years, is_half) for day, ann, years, is_half in coordinator.occurrences_between(start, end)]
+    assert [o[0] for o in got] == sorted(o[0] for o in got)
+    assert sorted(got) == expected
+
+    work = [o for o in coordinator.occurrences_between(start, end, 'work')]
+    assert work and all(ann.category == 'work' for _, ann, _, _ in work)
+    by_name = {ann.name: ann for ann in anniversaries.values()}
+    assert len(work) == sum(1 for o in expected if by_name[o[1]].category == 'work')
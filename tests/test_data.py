@@ -0,0 +1,110 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+
+import pytest
+
+from custom_components.anniversaries.data import AnniversaryData
+
+SAMPLES = [
+    AnniversaryData(name='Birthday', date=date(1990, 5, 1)),
+    AnniversaryData(name='Wedding', date=date(2000, 12, 31), show_half_anniversary=True),
+    AnniversaryData(name='Unknown', date=date(1900, 7, 4), unknown_year=True),
+    AnniversaryData(name='Trip', date=date(2099, 1, 15), is_one_time=True),
+    AnniversaryData(name='Past trip', date=date(2001, 3, 10), is_one_time=True),
+    AnniversaryData(name='Future start', date=date(2024, 3, 15)),
+    AnniversaryData(name='Future leap day', date=date(2024, 2, 29), show_half_anniversary=True),
+]
+
+
+@pytest.mark.parametrize('ann', SAMPLES, ids=lambda a: a.name)
+def test_snapshot_matches_properties(ann):
+    snap = ann.snapshot(date.today())
+    assert snap.anniversary is ann
+    assert snap.days_remaining == ann.days_remaining
+    assert snap.next_anniversary_date == ann.next_anniversary_date
+    assert snap.last_anniversary_date == ann.last_anniversary_date
+    assert snap.weeks_remaining == ann.weeks_remaining
+    assert snap.current_years == ann.current_years
+    assert snap.next_years == ann.next_years
+    assert snap.years_since_last == ann.years_since_last
+    assert snap.days_since_last == ann.days_since_last
+    assert snap.is_milestone == ann.is_milestone
+    assert snap.named_anniversary == ann.named_anniversary
+    assert snap.half_anniversary_date == ann.half_anniversary_date
+    assert snap.days_until_half_anniversary == ann.days_until_half_anniversary
+
+
+def test_snapshot_is_immutable():
+    snap = SAMPLES[0].snapshot(date(2024, 4, 30))
+    assert snap.days_remaining == 1
+    assert snap.next_years == 34
+    with pytest.raises(AttributeError):
+        snap.days_remaining = 0
+    assert not hasattr(snap, '__dict__')
+
+
+@pytest.mark.parametrize('ann', SAMPLES, ids=lambda a: a.name)
+def test_advance_matches_full_evaluation(ann):
+    day = date(2023, 1, 1)
+    snap = ann.snapshot(day)
+    for _ in range(800):
+        day = date.fromordinal(day.toordinal() + 1)
+        snap = snap.advance(day)
+        assert snap == ann.snapshot(day)
+
+
+def test_occurrences_span_decades_with_half_anniversaries():
+    ann = AnniversaryData(name='Wedding', date=date(2000, 12, 31), show_half_anniversary=True)
+    occurrences = list(ann.occurrences(date(2009, 1, 1), date(2011, 1, 1)))
+    assert occurrences == [
+        (date(2009, 6, 30), 8, True),
+        (date(2009, 12, 31), 9, False),
+        (date(2010, 6, 30), 9, True),
+        (date(2010, 12, 31), 10, False),
+    ]
+    for day, years, is_half in occurrences:
+        if not is_half:
+            assert ann.snapshot(day).current_years == years
+
+    decades = ann.occurrences(date(1900, 1, 1), date(2999, 12, 31))
+    assert next(decades) == (date(2000, 12, 31), 0, False)
+    assert sum(1 for _ in decades) == 999 + 999
+
+
+def test_occurrences_one_time_unknown_year_and_leap_day():
+    trip = AnniversaryData(name='Trip', date=date(2030, 5, 1), is_one_time=True)
+    assert list(trip.occurrences(date(2029, 1, 1), date(2031, 12, 31))) == [(date(2030, 5, 1), 0, False)]
+    assert list(trip.occurrences(date(2031, 1, 1), date(2031, 12, 31))) == []
+
+    unknown = AnniversaryData(name='Unknown', date=date(1900, 7, 4), unknown_year=True)
+    assert list(unknown.occurrences(date(2024, 7, 4), date(2025, 7, 4))) == [
+        (date(2024, 7, 4), None, False),
+        (date(2025, 7, 4), None, False),
+    ]
+
+    leap = AnniversaryData(name='Leap', date=date(1996, 2, 29))
+    assert [d for d, _, _ in leap.occurrences(date(2023, 1, 1), date(2024, 12, 31))] == [
+        date(2023, 2, 28),
+        date(2024, 2, 29),
+    ]
+
+
+def test_trait_tables_match_rules():
+    from custom_components.anniversaries.data import get_zodiac_sign
+
+    day = date(2024, 1, 1)
+    while day.year == 2024:
+        ann = AnniversaryData(name='Day', date=day)
+        assert ann.zodiac_sign == get_zodiac_sign(day.day, day.month)
+        assert ann.day_traits == (ann.zodiac_sign, ann.birthstone, ann.birth_flower)
+        day = date.fromordinal(day.toordinal() + 1)
+
+    assert AnniversaryData(name='Leap', date=date(1996, 2, 29)).zodiac_sign == 'Pisces'
+    assert AnniversaryData(name='Ruby', date=date(1990, 7, 22)).birthstone == 'Ruby'
+    generations = {year: AnniversaryData(name='Y', date=date(year, 6, 1)).generation for year in (1927, 1928, 1964, 1965, 2013, 2025, 2026)}
+    assert generations == {
+        1927: None, 1928: 'Silent Generation', 1964: 'Baby Boomers', 1965: 'Gen X',
+        2013: 'Gen Alpha', 2025: 'Gen Alpha', 2026: None,
+    }
+    assert AnniversaryData(name='U', date=date(1990, 1, 1), unknown_year=True).generation is None
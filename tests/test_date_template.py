@@ -0,0 +1,135 @@
+"""Anniversary dates rendered from templates."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date, datetime
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.anniversaries.config_flow import check_date
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+from custom_components.anniversaries.date_template import DateTemplateTracker, rendered_date
+
+
+@pytest.mark.parametrize(
+    ('result', 'expected'),
+    [
+        ('2000-06-15', '2000-06-15'),
+        ('2000-06-15 10:30:00', '2000-06-15'),
+        ('2000-06-15T10:30:00+00:00', '2000-06-15'),
+        (datetime(2000, 6, 15, 10, 30), '2000-06-15'),
+        (date(2000, 6, 15), '2000-06-15'),
+        (' 06-15 ', '06-15'),
+        ('unknown', None),
+        ('', None),
+        (20000615, None),
+    ],
+)
+def test_rendered_date(result, expected):
+    assert rendered_date(result) == expected
+
+
+def test_check_date_accepts_a_template_instead_of_a_date():
+    errors = {}
+    check_date({'date_template': "{{ states('input_datetime.x') }}"}, errors)
+    assert errors == {}
+    check_date({'date_template': '{{ states(', 'date': 'soon'}, errors)
+    assert errors == {'date_template': 'invalid_template', 'date': 'invalid'}
+    errors = {}
+    check_date({}, errors)
+    assert errors == {'date': 'invalid'}
+
+
+@pytest.mark.asyncio
+async def test_template_is_rerendered_when_its_entity_changes(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    hass.states.async_set('input_datetime.wedding', '2000-06-15')
+    hass.states.async_set('input_datetime.other', '1999-01-01')
+    coordinator = AnniversaryDataUpdateCoordinator(
+        hass, {'static': AnniversaryData(name='Static', date=date(1990, 1, 1))}
+    )
+    await coordinator.async_refresh()
+    changed = []
+    coordinator.async_add_change_listener(lambda: changed.append(True))
+
+    tracker = DateTemplateTracker(hass, coordinator)
+    config = {'name': 'Wedding', 'category': 'anniversary', 'date_template': "{{ states('input_datetime.wedding') }}"}
+    tracker.async_track('wedding', config)
+    assert coordinator.anniversaries['wedding'].date == date(2000, 6, 15)
+    assert coordinator.anniversaries['wedding'].category == 'anniversary'
+    assert 'wedding' in tracker and len(changed) == 1
+
+    hass.states.async_set('input_datetime.wedding', '2001-07-01 10:00:00')
+    await hass.async_block_till_done()
+    assert coordinator.anniversaries['wedding'].date == date(2001, 7, 1)
+    snapshot = coordinator.get_snapshot('wedding')
+    assert snapshot.next_anniversary_date.timetuple()[1:3] == (7, 1)
+    assert len(changed) == 2
+
+    # Entities the template does not read, and renders without a date, change nothing
+    hass.states.async_set('input_datetime.other', '1999-01-02')
+    hass.states.async_set('input_datetime.wedding', 'unknown')
+    await hass.async_block_till_done()
+    assert coordinator.anniversaries['wedding'].date == date(2001, 7, 1)
+    assert len(changed) == 2
+
+    # Tracking the same configuration again keeps the subscription
+    tracker.async_track('wedding', dict(config))
+    assert len(changed) == 2
+
+    tracker.async_untrack('wedding')
+    hass.states.async_set('input_datetime.wedding', '2002-02-02')
+    await hass.async_block_till_done()
+    assert coordinator.anniversaries['wedding'].date == date(2001, 7, 1)
+    assert not tracker
+    await hass.async_stop(force=True)
+
+
+class DummyConfigEntry:
+    def __init__(self, entry_id, data):
+        self.entry_id, self.domain, self.data, self.options = entry_id, 'anniversaries', data, {}
+        self.disabled_by = None
+
+    def add_update_listener(self, *_, **__):
+        return lambda: None
+
+    def async_on_unload(self, *_):
+        pass
+
+
+class DummyConfigEntries:
+    def __init__(self, entries):
+        self._entries = entries
+
+    def async_entries(self, domain):
+        return list(self._entries)
+
+    async def async_forward_entry_setups(self, entry, platforms):
+        pass
+
+    async def async_unload_platforms(self, entry, platforms):
+        return True
+
+
+@pytest.mark.asyncio
+async def test_entry_without_date_is_added_once_its_template_renders(tmp_path):
+    import custom_components.anniversaries as integration
+
+    hass = HomeAssistant(str(tmp_path))
+    entry = DummyConfigEntry('01TEMPLATE', {'name': 'Wedding', 'date_template': "{{ states('input_datetime.wedding') }}"})
+    hass.config_entries = DummyConfigEntries([entry])
+    hass.http = None
+
+    assert await integration.async_setup_entry(hass, entry)
+    coordinator = hass.data['anniversaries']['coordinator']
+    assert '01TEMPLATE' not in coordinator.anniversaries
+
+    hass.states.async_set('input_datetime.wedding', '2000-06-15')
+    await hass.async_block_till_done()
+    assert coordinator.anniversaries['01TEMPLATE'].date == date(2000, 6, 15)
+
+    assert await integration.async_unload_entry(hass, entry)
+    assert 'coordinator' not in hass.data['anniversaries']
+    assert 'date_templates' not in hass.data['anniversaries']
+    await hass.async_stop(force=True)
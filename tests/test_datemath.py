@@ -0,0 +1,60 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+import random
+
+from dateutil.relativedelta import relativedelta
+
+from custom_components.anniversaries.datemath import (
+    add_months,
+    is_milestone,
+    last_occurrence,
+    named_anniversary,
+    next_occurrence,
+    years_between,
+)
+
+
+def _random_dates(count: int, seed: int = 13) -> list[date]:
+    rng = random.Random(seed)
+    low, high = date(1896, 1, 1).toordinal(), date(2104, 12, 31).toordinal()
+    dates = [date.fromordinal(rng.randint(low, high)) for _ in range(count)]
+    # Leap days and month ends on both sides of a year boundary
+    dates += [date(1996, 2, 29), date(2000, 2, 29), date(2023, 2, 28), date(2024, 2, 29),
+              date(2023, 3, 1), date(1999, 8, 31), date(2024, 12, 31), date(2025, 1, 1)]
+    return dates
+
+
+def test_years_between_matches_relativedelta():
+    dates = _random_dates(400)
+    for later in dates:
+        for earlier in dates[::7]:
+            assert years_between(later, earlier) == relativedelta(later, earlier).years, (later, earlier)
+
+
+def test_add_months_matches_relativedelta():
+    for value in _random_dates(2000):
+        for months in (-13, -1, 1, 6, 12, 18):
+            assert add_months(value, months) == value + relativedelta(months=months)
+
+
+def test_occurrences_follow_feb_29_policy():
+    assert next_occurrence(2, 29, date(2023, 1, 1)) == date(2023, 2, 28)
+    assert next_occurrence(2, 29, date(2023, 3, 1)) == date(2024, 2, 29)
+    assert next_occurrence(5, 1, date(2024, 5, 1)) == date(2024, 5, 1)
+    assert last_occurrence(2, 29, date(2024, 2, 28)) == date(2023, 2, 28)
+    assert last_occurrence(5, 1, date(2024, 4, 30)) == date(2023, 5, 1)
+    assert years_between(date(2023, 2, 28), date(1996, 2, 29)) == 27
+
+
+def test_lookup_tables():
+    assert named_anniversary(25) == 'Silver'
+    assert named_anniversary(None) is None
+    assert [y for y in range(0, 101) if is_milestone(y)] == [1, 5, 10, 18, 20, 21, 25, 30, 40, 50, 60, 70, 75, 80, 90, 100]
+    assert not is_milestone(None)
+
+
+def test_years_between_matches_relativedelta_over_random_pairs():
+    """The relativedelta expression it replaces, over unrelated date pairs."""
+    pairs = list(zip(_random_dates(1000, 1), _random_dates(1000, 2)))
+    assert [years_between(a, b) for a, b in pairs] == [relativedelta(a, b).years for a, b in pairs]
@@ -0,0 +1,80 @@
+"""Anniversary date parsing, checked against the strptime chain it replaces."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date, datetime
+
+import pytest
+
+from custom_components.anniversaries.config_flow import is_not_date
+from custom_components.anniversaries.data import AnniversaryData
+from custom_components.anniversaries.dateparse import ParsedDate, parse_date
+
+
+@pytest.mark.parametrize(
+    ('value', 'expected'),
+    [
+        ('1815-12-10', (date(1815, 12, 10), False)),
+        ('1815-1-9', (date(1815, 1, 9), False)),
+        (' 1815/12/10 ', (date(1815, 12, 10), False)),
+        ('10.12.1815', (date(1815, 12, 10), False)),
+        ('2025-W01-3', (date(2025, 1, 1), False)),
+        ('2025W013', (date(2025, 1, 1), False)),
+        ('12-10', (date(1900, 12, 10), True)),
+        ('--12-10', (date(1900, 12, 10), True)),
+        ('02-29', (date(1904, 2, 29), True)),
+    ],
+)
+def test_parse_date_formats(value, expected):
+    assert parse_date(value) == ParsedDate(*expected)
+
+
+@pytest.mark.parametrize(
+    'value',
+    ['', 'tomorrow', '2021-02-29', '13-01', '2020-01', '1815.12.10', '2025-W54-1', '2020-01-05T10:00', '２０２０-01-01'],
+)
+def test_parse_date_rejects(value):
+    with pytest.raises(ValueError):
+        parse_date(value)
+
+
+def test_config_flow_and_from_config_share_the_parser():
+    assert not is_not_date('02-29', False)
+    assert is_not_date('02-29', True)  # A one-time event needs its year
+    assert not is_not_date('10.12.1815', True)
+    assert is_not_date('12/10', False)
+
+    ann = AnniversaryData.from_config({'name': 'Leap', 'date': '02-29'})
+    assert ann.unknown_year
+    snap = ann.snapshot(date(2025, 2, 1))
+    assert snap.next_anniversary_date == date(2025, 2, 28)
+    assert snap.next_years is None
+    assert AnniversaryData.from_config({'name': 'Ada', 'date': '1815/12/10'}).date == date(1815, 12, 10)
+    with pytest.raises(ValueError):
+        AnniversaryData.from_config({'name': 'Bad', 'date': '31.02.2000'})
+
+
+def _strptime_chain(value):
+    """The parser used before dateparse, for comparison."""
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date(), False
+    except ValueError:
+        return datetime.strptime(value, '%m-%d').date().replace(year=1900), True
+
+
+def test_parse_date_memoizes_bulk_loads():
+    # A bulk load: 20k entries over 2k distinct dates, plus 2k unknown-year ones
+    values = [f'{1950 + n % 70}-{1 + n % 12:02}-{1 + n % 28:02}' for n in range(2000)] * 10
+    values += [f'{1 + n % 12:02}-{1 + n % 28:02}' for n in range(2000)]
+    distinct = len(set(values))
+    parse_date.cache_clear()
+
+    parsed = [parse_date(value) for value in values]
+    assert [tuple(p) for p in parsed] == [_strptime_chain(value) for value in values]
+    info = parse_date.cache_info()
+    assert info.misses == distinct
+    assert info.hits == len(values) - distinct
+    assert info.currsize == distinct
+
+    # Parsed again, every value is a cache hit
+    assert [parse_date(value) for value in values] == parsed
+    assert parse_date.cache_info().misses == distinct
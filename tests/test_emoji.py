@@ -0,0 +1,75 @@
+"""Emoji catalog search and the emoji picker of the config flow."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.anniversaries.config_flow import OptionsFlowHandler
+from custom_components.anniversaries.const import CATEGORY_EMOJIS
+from custom_components.anniversaries.emoji import EMOJI_CATALOG, EmojiIndex, emoji_index, resolve_emoji
+
+
+def test_catalog_is_deduplicated_and_covers_category_defaults():
+    emojis = [emoji for group in EMOJI_CATALOG.values() for emoji, _, _ in group]
+    assert len(emojis) == len(set(emojis))
+    assert '' not in emojis
+    assert set(CATEGORY_EMOJIS.values()) <= set(emoji_index().entries)
+
+
+def test_search_matches_word_prefixes_in_catalog_order():
+    index = EmojiIndex({
+        'Food': (('🎂', 'Birthday cake', 'party'), ('🥧', 'Pie', 'dessert')),
+        'More': (('🎂', 'Duplicate', ''), ('🎉', 'Party popper', 'celebration')),
+    })
+    assert list(index.entries) == ['🎂', '🥧', '🎉']
+    assert index.search('par') == ['🎂', '🎉']
+    assert index.search('PARTY pop') == ['🎉']
+    assert index.search('food') == ['🎂', '🥧']
+    assert index.search('duplicate') == []
+    assert index.search('🥧') == ['🥧']
+    assert index.search('par', limit=1) == ['🎂']
+    assert index.search('  ') == []
+
+
+@pytest.mark.parametrize(
+    ('value', 'emoji'),
+    [('cake', '🎂'), ('🎂', '🎂'), ('🦄', '🦄'), ('', ''), ('christmas tree', '🎄')],
+)
+def test_resolve_emoji(value, emoji):
+    assert resolve_emoji(value) == (emoji, [])
+
+
+def test_resolve_emoji_reports_ambiguous_and_unknown_keywords():
+    emoji, matches = resolve_emoji('heart')
+    assert emoji is None and '❤️' in matches and len(matches) > 1
+    assert resolve_emoji('café') == (None, [])
+
+
+@pytest.mark.asyncio
+async def test_add_member_form_resolves_emoji_keywords(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    entry = SimpleNamespace(
+        entry_id='01ROSTER', data={'name': 'Staff', 'roster': True}, options={'anniversaries': []}
+    )
+    flow = OptionsFlowHandler(entry)
+    flow.hass = hass
+    flow.handler = entry.entry_id
+
+    result = await flow.async_step_add_member()
+    options = result['data_schema'].schema['emoji'].config['options']
+    assert len(options) < 10
+    assert {'value': '🎂', 'label': '🎂 Birthday cake'} in options
+
+    result = await flow.async_step_add_member({'name': 'Ada', 'date': '1815-12-10', 'emoji': 'heart'})
+    assert result['errors'] == {'emoji': 'emoji_choose'}
+    options = [option['value'] for option in result['data_schema'].schema['emoji'].config['options']]
+    assert options == resolve_emoji('heart')[1]
+    (field,) = [key for key in result['data_schema'].schema if key == 'emoji']
+    assert field.description == {'suggested_value': options[0]}
+
+    result = await flow.async_step_add_member({'name': 'Ada', 'date': '1815-12-10', 'emoji': 'cake'})
+    assert result['type'] == 'create_entry'
+    assert result['data']['anniversaries'][0]['emoji'] == '🎂'
+    await hass.async_stop(force=True)
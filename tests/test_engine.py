@@ -0,0 +1,74 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+
+import pytest
+
+from custom_components.anniversaries.data import AnniversaryData
+
+np = pytest.importorskip('numpy')
+
+from custom_components.anniversaries import engine
+from custom_components.anniversaries.engine import build_columns, evaluate_snapshots
+
+ANNIVERSARIES = {
+    'birthday': AnniversaryData(name='Birthday', date=date(1990, 5, 1)),
+    'wedding': AnniversaryData(name='Wedding', date=date(2000, 12, 31), show_half_anniversary=True),
+    'new_year': AnniversaryData(name='New year', date=date(1985, 1, 1), show_half_anniversary=True),
+    'leap': AnniversaryData(name='Leap', date=date(1996, 2, 29), show_half_anniversary=True),
+    'leap_half': AnniversaryData(name='Leap half', date=date(1999, 8, 31), show_half_anniversary=True),
+    'century': AnniversaryData(name='Century', date=date(1900, 3, 1)),
+    'unknown': AnniversaryData(name='Unknown', date=date(1900, 7, 4), unknown_year=True, show_half_anniversary=True),
+    'unknown_trip': AnniversaryData(name='Unknown trip', date=date(1900, 10, 10), unknown_year=True, is_one_time=True),
+    'future_start': AnniversaryData(name='Future start', date=date(2025, 6, 15), show_half_anniversary=True),
+    'trip': AnniversaryData(name='Trip', date=date(2024, 9, 1), is_one_time=True, show_half_anniversary=True),
+    'past_trip': AnniversaryData(name='Past trip', date=date(2001, 3, 10), is_one_time=True),
+}
+
+
+@pytest.fixture(autouse=True)
+def numpy_loaded():
+    # Loaded in the executor by the integration; nothing imports it on demand
+    assert engine._load_numpy()
+
+
+def test_columns_match_per_anniversary_evaluation_over_leap_cycle():
+    columns = build_columns(ANNIVERSARIES)
+    start = date(2023, 1, 1).toordinal()
+    for ordinal in range(start, start + 4 * 365 + 1):
+        today = date.fromordinal(ordinal)
+        expected = {key: ann.snapshot(today) for key, ann in ANNIVERSARIES.items()}
+        assert columns.snapshots(today) == expected, today
+
+
+def test_evaluate_snapshots_handles_empty_and_fallback(monkeypatch):
+    today = date(2024, 2, 28)
+    assert evaluate_snapshots({}, today) == {}
+    vectorized = evaluate_snapshots(ANNIVERSARIES, today)
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', True)
+    assert evaluate_snapshots(ANNIVERSARIES, today) == vectorized
+
+
+@pytest.mark.asyncio
+async def test_numpy_is_imported_in_the_executor(monkeypatch):
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', False)
+    jobs = []
+
+    class Hass:
+        async def async_add_import_executor_job(self, target):
+            jobs.append(target)
+            return target()
+
+    assert await engine.async_load_numpy(Hass())
+    assert await engine.async_load_numpy(Hass())
+    assert jobs == [engine._load_numpy]
+
+
+def test_build_columns_never_imports_numpy(monkeypatch):
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', False)
+    assert build_columns(ANNIVERSARIES) is None
+    assert evaluate_snapshots(ANNIVERSARIES, date(2024, 2, 28))
+    assert not engine._numpy_loaded
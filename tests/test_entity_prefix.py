@@ -28,6 +28,9 @@ from custom_components.anniversaries.data import AnniversaryData
 class DummyCoordinator(SimpleNamespace):
     def __init__(self):
         super().__init__(anniversaries={})
+    def get_snapshot(self, entry_id):
+        ann = self.anniversaries.get(entry_id)
+        return None if ann is None else ann.snapshot()
 
 class DummyConfigEntry(SimpleNamespace):
     def __init__(self, entry_id: str, data: dict):
@@ -0,0 +1,71 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+import json
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.anniversaries.const import DOMAIN
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+from custom_components.anniversaries.exporter import async_export
+from custom_components.anniversaries.importer import iter_csv, iter_icalendar, read_batch
+
+ANNIVERSARIES = {
+    'e1': AnniversaryData(name='Ada, Countess', date=date(1990, 5, 1), category='birthday', emoji='🎂'),
+    'e2': AnniversaryData(name='Launch', date=date(2031, 1, 15), is_one_time=True, category='event'),
+    'e3': AnniversaryData(name='Grace', date=date(1900, 7, 4), unknown_year=True, show_half_anniversary=True),
+}
+
+
+@pytest.mark.asyncio
+async def test_export_formats_reuse_cached_snapshots(tmp_path, monkeypatch):
+    hass = HomeAssistant(str(tmp_path))
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    coordinator = AnniversaryDataUpdateCoordinator(hass, dict(ANNIVERSARIES))
+    await coordinator.async_refresh()
+    hass.data[DOMAIN] = {'coordinator': coordinator}
+
+    def no_evaluation(self, today=None):
+        raise AssertionError('export must reuse the cached snapshots')
+
+    monkeypatch.setattr(AnniversaryData, 'snapshot', no_evaluation)
+    summary = await async_export(hass, str(tmp_path / 'all.json'))
+    assert summary['count'] == 3
+    assert summary['reference_date'] == coordinator.reference_date.isoformat()
+    rows = {row['entry_id']: row for row in json.loads((tmp_path / 'all.json').read_text())}
+    for entry_id, snap in coordinator.snapshots.items():
+        assert rows[entry_id]['next_date'] == snap.next_anniversary_date.isoformat()
+        assert rows[entry_id]['days_remaining'] == snap.days_remaining
+        assert rows[entry_id]['years_at_anniversary'] == snap.next_years
+    assert rows['e3']['date'] == '07-04'
+    monkeypatch.undo()
+
+    # Another reference date is evaluated in bulk
+    await async_export(hass, str(tmp_path / 'all.jsonl'), date(2024, 4, 30))
+    lines = [json.loads(line) for line in (tmp_path / 'all.jsonl').read_text().splitlines()]
+    ada = next(row for row in lines if row['entry_id'] == 'e1')
+    assert (ada['days_remaining'], ada['years_at_anniversary'], ada['is_milestone']) == (1, 34, False)
+
+    # CSV and iCalendar exports can be imported again
+    await async_export(hass, str(tmp_path / 'all.csv'))
+    with open(tmp_path / 'all.csv', newline='') as handle:
+        valid, errors, _ = read_batch(iter_csv(handle), 100)
+    assert not errors
+    assert {(row['name'], row['date'], row['one_time']) for row in valid} == {
+        ('Ada, Countess', '1990-05-01', False), ('Launch', '2031-01-15', True), ('Grace', '07-04', False),
+    }
+    await async_export(hass, str(tmp_path / 'all.ics'))
+    with open(tmp_path / 'all.ics', newline='') as handle:
+        valid, errors, _ = read_batch(iter_icalendar(handle), 100)
+    assert not errors
+    assert sorted(row['name'] for row in valid) == ['Ada, Countess', 'Grace', 'Launch']
+    assert not list(tmp_path.glob('.*.tmp'))
+
+    from homeassistant.exceptions import ServiceValidationError
+    with pytest.raises(ServiceValidationError):
+        await async_export(hass, str(tmp_path / 'all.xml'))
+    with pytest.raises(ServiceValidationError):
+        await async_export(hass, '/etc/all.csv')
+    await hass.async_stop(force=True)
@@ -0,0 +1,29 @@
+"""Modules kept off the runtime import path, checked in a fresh interpreter."""
+import sys, os
+import json
+import subprocess
+
+ROOT = os.path.abspath('.')
+PACKAGE = 'custom_components.anniversaries'
+# Only needed by the config flow or bulk refreshes
+LAZY_MODULES = {f'{PACKAGE}.config_flow', f'{PACKAGE}.emoji', 'numpy'}
+# Heavy third-party modules the integration itself never imports at runtime
+HEAVY_MODULES = {'numpy', 'dateutil'}
+
+
+def _imported(statement: str) -> set[str]:
+    """Return the modules loaded in a fresh interpreter after running statement."""
+    result = subprocess.run(
+        [sys.executable, '-c', f'{statement}\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))'],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return set(json.loads(result.stdout))
+
+
+def test_runtime_platforms_skip_heavy_modules():
+    modules = _imported(f'import {PACKAGE}, {PACKAGE}.sensor')
+    assert not (LAZY_MODULES | HEAVY_MODULES) & modules
+
+    # Home Assistant's calendar component imports dateutil on its own
+    modules = _imported(f'import {PACKAGE}.calendar')
+    assert not LAZY_MODULES & modules
@@ -0,0 +1,157 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+import io
+
+import pytest
+from homeassistant.components import persistent_notification
+from homeassistant.core import HomeAssistant
+
+from custom_components.anniversaries.const import DOMAIN
+from custom_components.anniversaries.importer import (
+    IMPORT_BATCH_SIZE,
+    IMPORT_NOTIFICATION_ID,
+    async_import_file,
+    iter_csv,
+    iter_icalendar,
+    iter_json_lines,
+    read_batch,
+)
+
+CSV = """name,date,category,one_time,show_half_anniversary
+Ada,1990-05-01,work,,yes
+Grace,07-04,birthday,false,
+,2000-01-01,,,
+Trip,05-01,event,true,
+Linus,1991-13-01,,,
+Moon,1969-07-20,space,,
+"""
+
+ICS = """BEGIN:VCALENDAR
+BEGIN:VEVENT
+SUMMARY:Wedding\\, Ann & Bob
+DTSTART;VALUE=DATE:20100612
+RRULE:FREQ=YEARLY
+CATEGORIES:ANNIVERSARY
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Conference in a very long
+  folded summary
+DTSTART:20300115T090000Z
+END:VEVENT
+BEGIN:VEVENT
+SUMMARY:Broken
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_csv_rows_are_validated():
+    valid, errors, exhausted = read_batch(iter_csv(io.StringIO(CSV)), 100)
+    assert exhausted
+    assert [(row['name'], row['date'], row['category'], row['one_time'], row['show_half_anniversary']) for row in valid] == [
+        ('Ada', '1990-05-01', 'work', False, True),
+        ('Grace', '07-04', 'birthday', False, False),
+    ]
+    assert errors == [
+        'line 4: missing name',
+        "line 5: invalid date '05-01'",
+        "line 6: invalid date '1991-13-01'",
+        "line 7: unknown category 'space'",
+    ]
+
+
+def test_json_lines_and_icalendar():
+    rows = iter_json_lines(io.StringIO('{"name": "Ada", "date": "1990-05-01", "emoji": "💼"}\n\nnot json\n[1]\n'))
+    valid, errors, _ = read_batch(rows, 100)
+    assert valid == [{'name': 'Ada', 'date': '1990-05-01', 'category': 'other', 'one_time': False,
+                      'show_half_anniversary': False, 'emoji': '💼'}]
+    assert [e.split(':')[0] for e in errors] == ['line 3', 'line 4']
+
+    valid, errors, _ = read_batch(iter_icalendar(io.StringIO(ICS)), 100)
+    assert [(row['name'], row['date'], row['category'], row['one_time']) for row in valid] == [
+        ('Wedding, Ann & Bob', '2010-06-12', 'anniversary', False),
+        ('Conference in a very long folded summary', '2030-01-15', 'other', True),
+    ]
+    assert errors == ['line 13: missing or invalid DTSTART']
+
+
+def test_batches_are_bounded():
+    rows = iter_csv(io.StringIO('name,date\n' + ''.join(f'N{n},2000-01-01\n' for n in range(250))))
+    sizes = []
+    while True:
+        valid, _, exhausted = read_batch(rows, 100)
+        sizes.append(len(valid))
+        if exhausted:
+            break
+    assert sizes == [100, 100, 50]
+
+
+class FakeFlowManager:
+    def __init__(self):
+        self.unique_ids = set()
+        self.contexts = []
+
+    async def async_init(self, domain, *, context, data):
+        self.contexts.append(context)
+        unique_id = (data['name'], data['date'])
+        if unique_id in self.unique_ids:
+            return {'type': 'abort', 'reason': 'already_configured'}
+        self.unique_ids.add(unique_id)
+        return {'type': 'create_entry'}
+
+
+class FakeCoordinator:
+    def __init__(self):
+        self.refreshes = 0
+
+    async def async_refresh(self):
+        self.refreshes += 1
+
+
+@pytest.mark.asyncio
+async def test_import_service_creates_entries_in_batches(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    flows = FakeFlowManager()
+    hass.config_entries = type('Entries', (), {'flow': flows})()
+
+    path = tmp_path / 'employees.csv'
+    path.write_text('name,date,category\n' + ''.join(
+        f'Employee {n},{1990 + n % 30}-{1 + n % 12:02}-{1 + n % 28:02},work\n' for n in range(5000)
+    ) + 'Bad,not-a-date,work\n')
+
+    coordinator = FakeCoordinator()
+    hass.data[DOMAIN] = {'coordinator': coordinator}
+    jobs = []
+    add_executor_job = hass.async_add_executor_job
+
+    def counting_executor_job(target, *args):
+        jobs.append(target)
+        return add_executor_job(target, *args)
+
+    hass.async_add_executor_job = counting_executor_job
+    summary = await async_import_file(hass, str(path))
+    assert summary['created'] == 5000
+    assert summary['invalid'] == 1
+    assert summary['errors'] == ["line 5002: invalid date 'not-a-date'"]
+    assert all(context == {'source': 'import', 'bulk_import': True} for context in flows.contexts)
+    # The file is opened and read in the executor, one batch per job, and
+    # the coordinator is refreshed once for the whole import
+    assert jobs[0].__name__ == '_open_rows'
+    assert [job.__name__ for job in jobs].count('read_batch') == 5002 // IMPORT_BATCH_SIZE + 1
+    assert coordinator.refreshes == 1
+
+    notifications = persistent_notification._async_get_or_create_notifications(hass)
+    assert 'Imported 5000 anniversaries' in notifications[IMPORT_NOTIFICATION_ID]['message']
+
+    # Re-importing the same file creates nothing new
+    summary = await async_import_file(hass, str(path))
+    assert summary['created'] == 0
+    assert summary['skipped'] == 5000
+
+    from homeassistant.exceptions import ServiceValidationError
+    with pytest.raises(ServiceValidationError):
+        await async_import_file(hass, '/etc/passwd.csv')
+    with pytest.raises(ServiceValidationError):
+        await async_import_file(hass, str(tmp_path / 'roster.xlsx'))
+    await hass.async_stop(force=True)
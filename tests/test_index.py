@@ -0,0 +1,97 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+
+from custom_components.anniversaries.index import DayIndex, day_slot
+
+
+def test_day_slots_cover_leap_year():
+    assert day_slot(1, 1) == 0
+    assert day_slot(2, 29) == 59
+    assert day_slot(3, 1) == 60
+    assert day_slot(12, 31) == 365
+
+
+def test_add_move_and_discard():
+    index = DayIndex()
+    index.add('a', 5, 1)
+    index.add('b', 5, 1)
+    assert index.on(date(2025, 5, 1)) == {'a', 'b'}
+    index.add('a', 6, 2)
+    assert index.on(date(2025, 5, 1)) == {'b'}
+    assert index.on(date(2025, 6, 2)) == {'a'}
+    index.discard('a')
+    index.discard('missing')
+    assert 'a' not in index
+    assert len(index) == 1
+
+
+def test_leap_day_observed_on_feb_28_in_common_years():
+    index = DayIndex()
+    index.add('leap', 2, 29)
+    index.add('eve', 2, 28)
+    assert index.on(date(2025, 2, 28)) == {'leap', 'eve'}
+    assert index.on(date(2024, 2, 28)) == {'eve'}
+    assert index.on(date(2024, 2, 29)) == {'leap'}
+
+
+def test_between_spans_year_boundary():
+    index = DayIndex()
+    index.add('nye', 12, 31)
+    index.add('ny', 1, 1)
+    index.add('mid', 7, 1)
+    hits = list(index.between(date(2024, 12, 30), date(2025, 1, 2)))
+    assert hits == [(date(2024, 12, 31), {'nye'}), (date(2025, 1, 1), {'ny'})]
+
+
+def _ring_with(anniversaries):
+    from custom_components.anniversaries.index import UpcomingRing
+    ring = UpcomingRing()
+    for key, ann in anniversaries.items():
+        ring.add(key, ann.date, recurring=not ann.is_one_time, unknown_year=ann.unknown_year)
+    return ring
+
+
+def test_upcoming_ring_matches_snapshot_ordering():
+    import random
+    from custom_components.anniversaries.data import AnniversaryData
+
+    rng = random.Random(4)
+    anniversaries = {}
+    for n in range(300):
+        day = date.fromordinal(rng.randint(date(1950, 1, 1).toordinal(), date(2030, 12, 31).toordinal()))
+        if (day.month, day.day) == (2, 29):
+            continue
+        anniversaries[f'id{n:03}'] = AnniversaryData(
+            name=str(n),
+            date=day.replace(year=1900) if n % 7 == 0 else day,
+            unknown_year=n % 7 == 0,
+            is_one_time=n % 5 == 0,
+        )
+    ring = _ring_with(anniversaries)
+    ring.discard('id001')
+    del anniversaries['id001']
+
+    today = date(2024, 1, 1)
+    while today < date(2028, 1, 1):
+        expected = sorted(
+            snap.days_remaining
+            for ann in anniversaries.values()
+            if not (ann.is_one_time and ann.date < today)
+            for snap in [ann.snapshot(today)]
+        )[:20]
+        got = ring.upcoming(today, 20)
+        assert [days for days, _ in got] == expected
+        for days, key in got:
+            assert anniversaries[key].snapshot(today).days_remaining == days
+        today = date.fromordinal(today.toordinal() + 17)
+
+
+def test_upcoming_ring_leap_day():
+    from custom_components.anniversaries.index import UpcomingRing
+    ring = UpcomingRing()
+    ring.add('leap', date(1996, 2, 29))
+    assert ring.upcoming(date(2025, 2, 28), 1) == [(0, 'leap')]
+    assert ring.upcoming(date(2025, 3, 1), 1) == [(364, 'leap')]
+    assert ring.upcoming(date(2027, 3, 1), 1) == [(365, 'leap')]
+    assert ring.upcoming(date(2024, 1, 1), 0) == []
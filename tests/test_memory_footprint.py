@@ -0,0 +1,50 @@
+"""Memory held per anniversary for a synthetic 10,000-entry install."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+import gc
+import json
+import tracemalloc
+
+from custom_components.anniversaries.data import AnniversaryData
+
+COUNT = 10_000
+
+
+def _entry_configs() -> list[dict]:
+    """Config entry data as loaded from .storage: every string is its own object."""
+    return json.loads(json.dumps([
+        {
+            'name': f'Employee {n}',
+            'date': f'{1960 + n % 60}-{1 + n % 12:02}-{1 + n % 28:02}',
+            'category': ('birthday', 'work', 'anniversary')[n % 3],
+            'emoji': ('🎂', '💼', '💕')[n % 3],
+            'half_anniversary': n % 2 == 0,
+            'icon_normal': 'mdi:calendar-blank',
+            'soon': 7,
+        }
+        for n in range(COUNT)
+    ]))
+
+
+def test_per_entry_footprint():
+    configs = _entry_configs()
+    AnniversaryData.from_config(dict(configs[0]))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    # Callers merge entry data and options into a fresh dict per entry
+    anniversaries = [AnniversaryData.from_config({**config}) for config in configs]
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    per_entry = sum(stat.size_diff for stat in after.compare_to(before, 'filename')) / COUNT
+    # Was ~457 bytes with a __dict__ and a retained config copy
+    assert per_entry < 200
+
+    first, second = anniversaries[0], anniversaries[3]
+    assert not hasattr(first, '__dict__')
+    assert 'config' not in AnniversaryData.__slots__
+    assert first.category is second.category
+    assert first.emoji is second.emoji
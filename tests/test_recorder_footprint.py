@@ -0,0 +1,46 @@
+"""Recorder bytes written per day for a synthetic 1,000-entry install."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+
+from custom_components.anniversaries.const import STATIC_ATTRIBUTES
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+from custom_components.anniversaries.sensor import AnniversarySensor
+
+
+def _recorded_bytes(attributes: dict, unrecorded: frozenset) -> int:
+    """Size of the state_attributes row the recorder would write."""
+    return len(json_bytes({k: v for k, v in attributes.items() if k not in unrecorded}))
+
+
+@pytest.mark.asyncio
+async def test_static_attributes_are_not_recorded():
+    hass = HomeAssistant('/tmp')
+    anniversaries = {
+        f'{n:08x}-entry': AnniversaryData(
+            name=f'Employee {n}',
+            date=date(1960 + n % 60, 1 + n % 12, 1 + n % 28),
+            category=('birthday', 'work', 'anniversary')[n % 3],
+            emoji=('🎂', '💼', '💕')[n % 3],
+        )
+        for n in range(1000)
+    }
+    coordinator = AnniversaryDataUpdateCoordinator(hass, anniversaries)
+    await coordinator.async_refresh()
+
+    before = after = 0
+    for entry_id in anniversaries:
+        entry = SimpleNamespace(entry_id=entry_id, data={'name': entry_id}, options={})
+        attributes = AnniversarySensor(coordinator, entry_id, entry).extra_state_attributes
+        before += _recorded_bytes(attributes, frozenset())
+        after += _recorded_bytes(attributes, AnniversarySensor._unrecorded_attributes)
+
+    assert AnniversarySensor._unrecorded_attributes == STATIC_ATTRIBUTES
+    assert after < before * 0.7
+    await hass.async_stop(force=True)
@@ -0,0 +1,193 @@
+"""Roster entries: many anniversaries held by one config entry."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+import custom_components.anniversaries as integration
+from custom_components.anniversaries import calendar, engine, sensor
+from custom_components.anniversaries.config_flow import OptionsFlowHandler
+from custom_components.anniversaries.const import DOMAIN
+from custom_components.anniversaries.importer import add_members
+from custom_components.anniversaries.roster import entry_configs, loaded_keys
+
+
+def member(n: int) -> dict:
+    return {
+        'id': f'm{n:05}',
+        'name': f'Employee {n}',
+        'date': f'{1960 + n % 60}-{1 + n % 12:02}-{1 + n % 28:02}',
+        'category': 'work',
+    }
+
+
+class DummyConfigEntry(SimpleNamespace):
+    def __init__(self, members, entry_id='01ROSTER', options=None):
+        super().__init__(
+            entry_id=entry_id,
+            domain=DOMAIN,
+            title='Staff',
+            data={'name': 'Staff', 'roster': True},
+            options={'anniversaries': members, **(options or {})},
+            disabled_by=None,
+        )
+
+    def add_update_listener(self, *_, **__):
+        return lambda: None
+
+    def async_on_unload(self, *_):
+        pass
+
+
+class DummyConfigEntries:
+    def __init__(self, entries):
+        self._entries = entries
+        self.forwarded = 0
+        self.reloaded = []
+
+    def async_entries(self, domain):
+        return list(self._entries)
+
+    async def async_forward_entry_setups(self, entry, platforms):
+        self.forwarded += 1
+
+    async def async_reload(self, entry_id):
+        self.reloaded.append(entry_id)
+
+
+def test_entry_configs_of_plain_and_roster_entries():
+    plain = SimpleNamespace(entry_id='01PLAIN', data={'name': 'A', 'date': '2000-01-01'}, options={'date': '2001-01-01'})
+    assert entry_configs(plain) == {'01PLAIN': {'name': 'A', 'date': '2001-01-01'}}
+
+    roster = DummyConfigEntry([member(1), member(2)])
+    configs = entry_configs(roster)
+    assert list(configs) == ['01ROSTER_m00001', '01ROSTER_m00002']
+    assert configs['01ROSTER_m00002']['name'] == 'Employee 2'
+    # Members removed from the options are still found in the coordinator
+    assert loaded_keys(roster, ['01ROSTER_m00009', '01PLAIN']) == {'01ROSTER_m00009'}
+
+
+@pytest.mark.asyncio
+async def test_roster_sets_up_all_members_at_once(monkeypatch):
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', True)
+    hass = HomeAssistant('/tmp')
+    entry = DummyConfigEntry([member(n) for n in range(2000)], options={'entry_calendar': True})
+    hass.config_entries = DummyConfigEntries([entry])
+    hass.http = None
+
+    assert await integration.async_setup_entry(hass, entry)
+    batches = []
+    await sensor.async_setup_entry(hass, entry, lambda entities: batches.append(list(entities)))
+    await calendar.async_setup_entry(hass, entry, lambda entities: batches.append(list(entities)))
+
+    coordinator = hass.data[DOMAIN]['coordinator']
+    assert len(coordinator.anniversaries) == 2000
+    assert hass.config_entries.forwarded == 1
+    # One add_entities call per platform, one entity per member
+    assert [len(batch) for batch in batches] == [2000, 2000]
+    sensors, calendars = batches
+    assert len({entity.unique_id for entity in sensors}) == 2000
+    assert sensors[0].unique_id == '01ROSTER_m00000_sensor'
+    assert sensors[0]._suggested_object_id == 'anniversary_employee_0_m00000'
+    assert calendars[0].unique_id == '01ROSTER_m00000_calendar'
+
+    # Editing a member updates it in place
+    edited = [member(n) for n in range(2000)]
+    edited[5] = {**edited[5], 'date': '1999-12-31'}
+    entry.options = {**entry.options, 'anniversaries': edited}
+    await integration.update_listener(hass, entry)
+    assert hass.config_entries.reloaded == []
+    assert coordinator.anniversaries['01ROSTER_m00005'].date.year == 1999
+
+    # Removing a member reloads the roster; unloading it drops every member
+    entry.options = {**entry.options, 'anniversaries': edited[1:]}
+    await integration.update_listener(hass, entry)
+    assert hass.config_entries.reloaded == ['01ROSTER']
+
+    async def unload_platforms(entry, platforms):
+        return True
+
+    hass.config_entries.async_unload_platforms = unload_platforms
+    assert await integration.async_unload_entry(hass, entry)
+    assert 'coordinator' not in hass.data[DOMAIN]
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_plain_entry_options_are_applied(monkeypatch):
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', True)
+    hass = HomeAssistant('/tmp')
+    entry = DummyConfigEntry([], entry_id='01PLAIN')
+    entry.data = {'name': 'Ada', 'date': '1815-12-10'}
+    entry.options = {'upcoming_anniversaries_sensor': True}
+    hass.config_entries = DummyConfigEntries([entry])
+    hass.http = None
+    assert await integration.async_setup_entry(hass, entry)
+    coordinator = hass.data[DOMAIN]['coordinator']
+
+    # The summary length is changed in place
+    entry.options = {**entry.options, 'upcoming_count': 2}
+    await integration.update_listener(hass, entry)
+    assert coordinator.upcoming_count == 2
+    assert hass.config_entries.reloaded == []
+
+    # Removing the summary sensor needs a reload
+    entry.options = {**entry.options, 'upcoming_anniversaries_sensor': False}
+    await integration.update_listener(hass, entry)
+    assert hass.config_entries.reloaded == ['01PLAIN']
+
+    # New calendars need a reload
+    entry.options = {**entry.options, 'combined_calendar': True}
+    await integration.update_listener(hass, entry)
+    assert hass.config_entries.reloaded == ['01PLAIN', '01PLAIN']
+    await hass.async_stop(force=True)
+
+
+def test_add_members_skips_existing_rows():
+    members, skipped = add_members(
+        [member(1)],
+        [
+            {'name': 'Employee 1', 'date': member(1)['date']},
+            {'name': 'New hire', 'date': '2024-05-01'},
+        ],
+    )
+    assert skipped == 1
+    assert [m['name'] for m in members] == ['Employee 1', 'New hire']
+    assert members[1]['id'] and members[1]['id'] != members[0]['id']
+
+
+@pytest.mark.asyncio
+async def test_options_flow_edits_roster(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    entry = DummyConfigEntry([member(1), member(2)], options={'upcoming_count': 3})
+    flow = OptionsFlowHandler(entry)
+    flow.hass = hass
+    flow.handler = entry.entry_id
+
+    result = await flow.async_step_init()
+    assert result['type'] == 'menu'
+    assert 'import_members' in result['menu_options']
+
+    result = await flow.async_step_add_member({'name': 'anniversary_x', 'date': '2020-01-01'})
+    assert result['errors'] == {'name': 'no_prefix'}
+    result = await flow.async_step_add_member({'name': 'New hire', 'date': '2024-05-01'})
+    assert result['type'] == 'create_entry'
+    assert result['data']['upcoming_count'] == 3
+    assert [m['name'] for m in result['data']['anniversaries']] == ['Employee 1', 'Employee 2', 'New hire']
+
+    result = await flow.async_step_remove_members({'anniversaries': ['m00001']})
+    assert [m['id'] for m in result['data']['anniversaries']] == ['m00002']
+
+    hass.config.allowlist_external_dirs = {str(tmp_path)}
+    path = tmp_path / 'people.csv'
+    path.write_text('name,date\nAda,1815-12-10\nEmployee 2,' + member(2)['date'] + '\n')
+    result = await flow.async_step_import_members({'file_path': str(path)})
+    assert [m['name'] for m in result['data']['anniversaries']] == ['Employee 1', 'Employee 2', 'Ada']
+
+    result = await flow.async_step_import_members({'file_path': '/etc/passwd.csv'})
+    assert result['errors'] == {'file_path': 'invalid_file'}
+    await hass.async_stop(force=True)
@@ -0,0 +1,71 @@
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from datetime import timedelta
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.anniversaries import sensor as sensor_platform
+from custom_components.anniversaries.const import DOMAIN, STATIC_ATTRIBUTES
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+from custom_components.anniversaries.sensor import AnniversarySensor
+
+
+class DummyConfigEntry(SimpleNamespace):
+    def __init__(self, entry_id: str, data: dict):
+        super().__init__(entry_id=entry_id, data=data, options={}, title=data.get('name'))
+
+
+@pytest.mark.asyncio
+async def test_unchanged_render_skips_state_write(monkeypatch):
+    hass = HomeAssistant('/tmp')
+    ann = AnniversaryData(name='Ada', date=dt_util.now().date() + timedelta(days=40), is_one_time=True)
+    coordinator = AnniversaryDataUpdateCoordinator(hass, {'1234-abcd': ann})
+    await coordinator.async_refresh()
+
+    sensor = AnniversarySensor(coordinator, '1234-abcd', DummyConfigEntry('1234-abcd', {'name': 'Ada'}))
+    writes = []
+    monkeypatch.setattr(sensor, 'async_write_ha_state', lambda: writes.append(sensor.native_value))
+
+    sensor._handle_coordinator_update()
+    sensor._handle_coordinator_update()
+    await coordinator.async_refresh()
+    sensor._handle_coordinator_update()
+    assert writes == [40]
+
+    static = sensor._static_attributes(ann)
+    assert set(static) == STATIC_ATTRIBUTES
+    assert sensor._static_attributes(ann) is static
+
+    coordinator.async_set_anniversary('1234-abcd', AnniversaryData(
+        name='Ada', date=dt_util.now().date() + timedelta(days=3), is_one_time=True))
+    sensor._handle_coordinator_update()
+    assert writes == [40, 3]
+    assert sensor._static_attributes(coordinator.anniversaries['1234-abcd']) is not static
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_summary_sensor_is_added_again_after_unload():
+    hass = HomeAssistant('/tmp')
+    coordinator = AnniversaryDataUpdateCoordinator(hass, {})
+    hass.data[DOMAIN] = {'coordinator': coordinator, 'coordinator_lock': asyncio.Lock()}
+    entry = DummyConfigEntry('1234-abcd', {'name': 'Ada', 'date': '2000-01-01'})
+    entry.options = {'upcoming_anniversaries_sensor': True}
+
+    added = []
+    await sensor_platform.async_setup_entry(hass, entry, added.extend)
+    await sensor_platform.async_setup_entry(hass, entry, added.extend)
+    summaries = [e for e in added if isinstance(e, sensor_platform.UpcomingAnniversariesSensor)]
+    assert len(summaries) == 1
+
+    summaries[0].hass = hass
+    await summaries[0].async_will_remove_from_hass()
+    added.clear()
+    await sensor_platform.async_setup_entry(hass, entry, added.extend)
+    assert sum(isinstance(e, sensor_platform.UpcomingAnniversariesSensor) for e in added) == 1
+    await hass.async_stop(force=True)
@@ -0,0 +1,94 @@
+"""Startup: setting up N anniversary entries must do the work once, not N times."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+from types import SimpleNamespace
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+import custom_components.anniversaries as integration
+from custom_components.anniversaries import engine
+from custom_components.anniversaries.const import DOMAIN
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+
+
+class DummyConfigEntry(SimpleNamespace):
+    def __init__(self, n: int):
+        super().__init__(
+            entry_id=f'{n:08x}-entry',
+            data={'name': f'Employee {n}', 'date': f'{1960 + n % 60}-{1 + n % 12:02}-{1 + n % 28:02}'},
+            options={},
+            disabled_by=None,
+        )
+
+    def add_update_listener(self, *_, **__):
+        return lambda: None
+
+    def async_on_unload(self, *_):
+        pass
+
+
+class DummyConfigEntries:
+    def __init__(self, entries):
+        self._entries = entries
+
+    def async_entries(self, domain):
+        return list(self._entries)
+
+    async def async_forward_entry_setups(self, entry, platforms):
+        pass
+
+
+async def _setup_all(count: int, monkeypatch) -> tuple[int, int, int]:
+    hass = HomeAssistant('/tmp')
+    entries = [DummyConfigEntry(n) for n in range(count)]
+    hass.config_entries = DummyConfigEntries(entries)
+    hass.http = None
+
+    evaluations = refreshes = 0
+    original = AnniversaryData.snapshot
+    original_update = AnniversaryDataUpdateCoordinator._async_update_data
+
+    def counting_snapshot(self, today=None):
+        nonlocal evaluations
+        evaluations += 1
+        return original(self, today)
+
+    async def counting_update(self):
+        nonlocal refreshes
+        refreshes += 1
+        return await original_update(self)
+
+    monkeypatch.setattr(AnniversaryData, 'snapshot', counting_snapshot)
+    monkeypatch.setattr(AnniversaryDataUpdateCoordinator, '_async_update_data', counting_update)
+    # Count per-anniversary evaluations on the pure-Python path
+    monkeypatch.setattr(engine, 'np', None)
+    monkeypatch.setattr(engine, '_numpy_loaded', True)
+    notified = 0
+
+    def count_listener_calls():
+        nonlocal notified
+        notified += 1
+
+    for n, entry in enumerate(entries):
+        assert await integration.async_setup_entry(hass, entry)
+        if n == 0:
+            coordinator = hass.data[DOMAIN]['coordinator']
+            coordinator.async_add_listener(count_listener_calls)
+            coordinator.async_add_upcoming_listener(count_listener_calls)
+    assert len(coordinator.anniversaries) == count
+    await hass.async_stop(force=True)
+    return evaluations, refreshes, notified
+
+
+@pytest.mark.asyncio
+async def test_setup_evaluates_each_anniversary_once(monkeypatch):
+    for count in (500, 2000):
+        evaluations, refreshes, notified = await _setup_all(count, monkeypatch)
+        # One evaluation per anniversary during the single startup refresh,
+        # instead of one full rescan per entry (N^2 / 2).
+        assert evaluations == count
+        assert refreshes == 1
+        # Entries preloaded by the first setup notify nobody when set up
+        assert notified == 0
@@ -0,0 +1,233 @@
+"""WebSocket API and the aggregate-only roster mode."""
+import sys, os
+sys.path.insert(0, os.path.abspath('.'))
+import asyncio
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+import voluptuous as vol
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.anniversaries import sensor, websocket_api
+from custom_components.anniversaries.const import DOMAIN
+from custom_components.anniversaries.coordinator import AnniversaryDataUpdateCoordinator
+from custom_components.anniversaries.data import AnniversaryData
+
+TODAY = date(2025, 3, 1)
+# test_entity_prefix replaces the registry accessor for the whole session
+REGISTRY_GET = er.async_get
+
+
+@pytest.fixture(autouse=True)
+def real_entity_registry(monkeypatch):
+    monkeypatch.setattr(er, 'async_get', REGISTRY_GET)
+
+
+def anniversary(name, day, category='birthday'):
+    return AnniversaryData(name=name, date=day, category=category)
+
+
+ANNIVERSARIES = {
+    'a': anniversary('Ada', date(1815, 12, 10)),
+    'b': anniversary('Bob', date(1990, 3, 2), 'work'),
+    'c': anniversary('Cy', date(2000, 3, 1)),
+    'd': anniversary('Di', date(1980, 6, 15), 'work'),
+}
+
+
+def snapshots():
+    return [(key, ann.snapshot(TODAY)) for key, ann in ANNIVERSARIES.items()]
+
+
+def test_query_sorts_filters_and_pages():
+    total, rows = websocket_api.query(snapshots())
+    assert total == 4
+    assert [row['name'] for row in rows] == ['Cy', 'Bob', 'Di', 'Ada']
+    assert rows[0] == {
+        **rows[0],
+        'id': 'c',
+        'next_date': '2025-03-01',
+        'days_remaining': 0,
+        'years_at_anniversary': 25,
+    }
+
+    total, rows = websocket_api.query(snapshots(), categories=['work'], sort_by='name', descending=True)
+    assert total == 2
+    assert [row['name'] for row in rows] == ['Di', 'Bob']
+
+    total, rows = websocket_api.query(snapshots(), sort_by='years', offset=1, limit=2)
+    assert total == 4
+    assert [row['name'] for row in rows] == ['Bob', 'Di']
+
+
+class FakeConnection:
+    def __init__(self):
+        self.results = []
+        self.events = []
+        self.subscriptions = {}
+
+    def send_result(self, msg_id, result=None):
+        self.results.append((msg_id, result))
+
+    def send_message(self, message):
+        self.events.append(message['event'])
+
+
+@pytest.mark.asyncio
+async def test_list_command_reads_the_coordinator(monkeypatch, tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    await er.async_load(hass)
+    coordinator = AnniversaryDataUpdateCoordinator(hass, dict(ANNIVERSARIES))
+    monkeypatch.setattr(coordinator, 'snapshots_for', lambda day=None: dict(snapshots()))
+    hass.data[DOMAIN] = {'coordinator': coordinator}
+    connection = FakeConnection()
+    websocket_api.ws_list(
+        hass,
+        connection,
+        {
+            'id': 7,
+            'type': 'anniversaries/list',
+            'categories': ['birthday'],
+            'sort_by': 'days_remaining',
+            'descending': False,
+            'offset': 0,
+            'limit': 1,
+        },
+    )
+    assert connection.results == [(7, {'total': 2, 'offset': 0, 'anniversaries': [
+        websocket_api.list_row('c', ANNIVERSARIES['c'].snapshot(TODAY))
+    ]})]
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_date_window_matches_a_full_scan():
+    hass = HomeAssistant('/tmp')
+    base = date(1950, 1, 1).toordinal()
+    anniversaries = {
+        f'k{n}': anniversary(f'P{n}', date.fromordinal(base + n * 67), ('birthday', 'work')[n % 2])
+        for n in range(400)
+    }
+    anniversaries['leap'] = anniversary('Leap', date(2000, 2, 29))
+    anniversaries['once'] = AnniversaryData(name='Once', date=date(2030, 5, 5), is_one_time=True)
+    coordinator = AnniversaryDataUpdateCoordinator(hass, anniversaries)
+    await coordinator.async_refresh()
+    today = coordinator.reference_date
+    snapshots = coordinator.snapshots_for()
+    for offset, length in ((0, 0), (0, 30), (40, 90), (200, 366), (0, 2000)):
+        start = date.fromordinal(today.toordinal() + offset)
+        end = date.fromordinal(start.toordinal() + length)
+        expected = {k for k, s in snapshots.items() if start <= s.next_anniversary_date <= end}
+        found = [k for k, _ in coordinator.next_occurrences_between(start, end)]
+        assert len(found) == len(set(found))
+        assert set(found) == expected
+    await hass.async_stop(force=True)
+
+
+@pytest.mark.asyncio
+async def test_subscription_pushes_only_changes(monkeypatch, tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    await er.async_load(hass)
+    coordinator = AnniversaryDataUpdateCoordinator(hass, dict(ANNIVERSARIES))
+    await coordinator.async_refresh()
+    hass.data[DOMAIN] = {'coordinator': coordinator}
+    connection = FakeConnection()
+    websocket_api.ws_subscribe(
+        hass,
+        connection,
+        {'id': 3, 'type': 'anniversaries/subscribe', 'categories': ['work'],
+         'sort_by': 'name', 'descending': False, 'offset': 0},
+    )
+    assert connection.results == [(3, None)]
+    initial = connection.events.pop()
+    assert initial['total'] == 2 and initial['removed'] == []
+    assert initial['order'] == ['b', 'd']
+    assert [row['name'] for row in initial['changed']] == ['Bob', 'Di']
+
+    # Burst of edits: one event, holding only what changed
+    coordinator.async_set_anniversary('d', anniversary('Di', date(1981, 6, 15), 'work'))
+    coordinator.async_set_anniversary('e', anniversary('Eve', date(1970, 1, 1), 'work'))
+    coordinator.async_set_anniversary('f', anniversary('Fay', date(1970, 1, 1)))
+    await asyncio.sleep(0)
+    (event,) = connection.events
+    assert event['order'] == ['b', 'd', 'e']
+    assert [row['name'] for row in event['changed']] == ['Di', 'Eve']
+    assert event['removed'] == []
+
+    # Edits outside the query are not even queried
+    connection.events.clear()
+    queries = []
+    candidates = websocket_api._candidates
+    monkeypatch.setattr(
+        websocket_api, '_candidates', lambda *args: queries.append(args) or candidates(*args)
+    )
+    coordinator.async_set_anniversary('f', anniversary('Fay', date(1971, 1, 1)))
+    await asyncio.sleep(0)
+    assert connection.events == []
+    assert queries == []
+
+    coordinator.async_remove_anniversary('b')
+    await asyncio.sleep(0)
+    (event,) = connection.events
+    assert event == {'total': 2, 'changed': [], 'removed': ['b'], 'order': ['d', 'e']}
+
+    assert len(queries) == 1
+
+    connection.subscriptions[3]()
+    connection.events.clear()
+    coordinator.async_remove_anniversary('d')
+    await asyncio.sleep(0)
+    assert connection.events == []
+    await hass.async_stop(force=True)
+
+
+def test_subscribe_limit_is_capped_like_list():
+    schema = websocket_api.ws_subscribe._ws_schema
+    message = {'id': 1, 'type': 'anniversaries/subscribe'}
+    assert schema(message)['limit'] == websocket_api.DEFAULT_LIMIT
+    with pytest.raises(vol.Invalid):
+        schema({**message, 'limit': websocket_api.MAX_LIMIT + 1})
+
+
+@pytest.mark.asyncio
+async def test_roster_without_member_entities_adds_category_counts():
+    hass = HomeAssistant('/tmp')
+    coordinator = AnniversaryDataUpdateCoordinator(hass, dict(ANNIVERSARIES))
+    await coordinator.async_refresh()
+    hass.data[DOMAIN] = {'coordinator': coordinator, 'coordinator_lock': asyncio.Lock()}
+    entry = SimpleNamespace(
+        entry_id='01ROSTER',
+        data={'name': 'Staff', 'roster': True},
+        options={'anniversaries': [], 'member_entities': False},
+    )
+    added = []
+    await sensor.async_setup_entry(hass, entry, lambda entities: added.extend(entities))
+    await sensor.async_setup_entry(hass, entry, lambda entities: added.extend(entities))
+    assert all(isinstance(entity, sensor.AnniversaryCategorySensor) for entity in added)
+    counts = {entity._category: entity for entity in added}
+    assert len(counts) == len(added)
+    assert counts['work'].native_value == 2
+    assert counts['holiday'].native_value == 0
+
+    notified = []
+    coordinator.async_add_category_listener('work', lambda: notified.append('work'))
+    coordinator.async_add_category_listener('birthday', lambda: notified.append('birthday'))
+    coordinator.async_set_anniversary('b', anniversary('Bob', date(1990, 3, 2), 'birthday'))
+    assert sorted(notified) == ['birthday', 'work']
+    assert counts['work'].native_value == 1
+    assert counts['birthday'].native_value == 3
+    attributes = counts['birthday'].extra_state_attributes
+    assert attributes['days_remaining'] == min(
+        coordinator.get_snapshot(key).days_remaining for key in ('a', 'b', 'c')
+    )
+
+    # A roster reload removes the sensors; the next setup adds them again
+    for entity in added:
+        entity.hass = hass
+        await entity.async_will_remove_from_hass()
+    readded = []
+    await sensor.async_setup_entry(hass, entry, lambda entities: readded.extend(entities))
+    assert len(readded) == len(added)
+    await hass.async_stop(force=True)